@@ -1,7 +1,11 @@
 # calculos/combinaciones.py (ACTUALIZADO)
 # -*- coding: utf-8 -*-
+import numpy as np
 from core.config import ProyectoConfig, NormativaAcciones, MetodoDiseno
 
+# Marca para un caso cuyo diagrama cambia de signo sin información por estación.
+_SIGNO_MIXTO = 2
+
 class GestorCombinaciones:
     def __init__(self, config: ProyectoConfig):
         self.config = config
@@ -17,4 +21,95 @@ class GestorCombinaciones:
             print("INFO: Usando combinaciones de carga de las NTC-CDMX-2023.")
             return [{"D": 1.3}, {"D": 1.3, "L": 1.5}]
         
-        raise NotImplementedError(f"Combinaciones para {norma.value} no implementadas.")
\ No newline at end of file
+        raise NotImplementedError(f"Combinaciones para {norma.value} no implementadas.")
+
+    def podar_combinaciones(self, combinaciones: list[dict], extremos_por_caso: dict) -> tuple[list[dict], int]:
+        """
+        Descarta las combinaciones que no pueden gobernar antes de analizarlas.
+
+        Usa la información de signo de cada caso (de `AnalizadorViga.analizar_casos_unitarios`).
+        Las estaciones se agrupan por la firma de signos de todos los casos; dentro de
+        cada grupo el signo de cada caso es fijo, así que una combinación B domina a
+        otra A cuando sus factores son mayores o iguales en los casos positivos, menores
+        o iguales en los negativos e iguales en los de signo mixto. Una combinación se
+        descarta solo si, para momento y cortante y en todos los grupos, existe otra que
+        la domina en el sentido en que puede actuar. Por superposición lineal, la
+        envolvente resultante es idéntica a la de analizar todas las combinaciones.
+
+        Args:
+            combinaciones (list[dict]): Combinaciones completas (ej. {'D': 1.2, 'L': 1.6}).
+            extremos_por_caso (dict): {caso: {"M_max", "M_min", "V_max", "V_min", ...}};
+                si incluye "signo_M"/"signo_V" por estación, la poda es más efectiva.
+
+        Returns:
+            tuple: (combinaciones que deben analizarse, número de combinaciones descartadas).
+        """
+        if len(combinaciones) < 2 or not extremos_por_caso:
+            return list(combinaciones), 0
+
+        casos = sorted(extremos_por_caso)
+        F = np.array([[combo.get(caso, 0.0) for caso in casos] for combo in combinaciones], dtype=float)
+        descartable = np.ones(len(combinaciones), dtype=bool)
+
+        for efecto in ("M", "V"):
+            firmas = self._firmas_de_signo(extremos_por_caso, casos, efecto)
+            for s in firmas:
+                descartable &= self._cubierta_en_grupo(F, s)
+
+        if descartable.all():
+            descartable[0] = False  # Sin efectos en la viga: basta con una combinación.
+
+        supervivientes = [combo for combo, quitar in zip(combinaciones, descartable) if not quitar]
+        num_descartadas = int(descartable.sum())
+        print(f"INFO: Poda por dominancia: {num_descartadas} de {len(combinaciones)} combinaciones descartadas.")
+        return supervivientes, num_descartadas
+
+    @staticmethod
+    def _firmas_de_signo(extremos_por_caso: dict, casos: list, efecto: str) -> np.ndarray:
+        """Firmas de signo distintas (una por grupo de estaciones), forma (grupos, casos)."""
+        clave = f"signo_{efecto}"
+        if all(clave in extremos_por_caso[caso] for caso in casos):
+            signos = np.vstack([extremos_por_caso[caso][clave] for caso in casos])
+            return np.unique(signos.T, axis=0)
+
+        # Sin signos por estación: un único grupo con el signo global de cada caso.
+        firma = []
+        for caso in casos:
+            maximo, minimo = extremos_por_caso[caso][f"{efecto}_max"], extremos_por_caso[caso][f"{efecto}_min"]
+            if maximo <= 0 <= minimo:
+                firma.append(0)
+            elif minimo >= 0:
+                firma.append(1)
+            elif maximo <= 0:
+                firma.append(-1)
+            else:
+                firma.append(_SIGNO_MIXTO)
+        return np.array([firma])
+
+    @staticmethod
+    def _cubierta_en_grupo(F: np.ndarray, firma: np.ndarray) -> np.ndarray:
+        """
+        Indica, para cada combinación, si otra la domina en un grupo de estaciones
+        en cada sentido (positivo/negativo) en que la combinación puede actuar.
+        """
+        mixto = firma == _SIGNO_MIXTO
+        s = np.where(mixto, 0, firma)
+
+        # delta[a, b, c] = (f_b - f_a) * s_c
+        diferencia = F[None, :, :] - F[:, None, :]
+        delta = diferencia * s
+        iguales_en_mixtos = np.all(np.where(mixto, diferencia == 0, True), axis=2)
+
+        n = F.shape[0]
+        indices = np.arange(n)
+        cubierta = np.ones(n, dtype=bool)
+        terminos = F * s
+        for sentido in (1, -1):
+            domina = np.all(sentido * delta >= 0, axis=2) & iguales_en_mixtos
+            empate = domina & domina.T
+            # Ante combinaciones equivalentes se conserva la de menor índice.
+            domina &= ~empate | (indices[None, :] < indices[:, None])
+            domina[indices, indices] = False
+            puede_actuar = np.any(sentido * terminos > 0, axis=1) | np.any(mixto & (F != 0), axis=1)
+            cubierta &= ~puede_actuar | domina.any(axis=1)
+        return cubierta
@@ -87,8 +87,41 @@ class AnalizadorViga:
             "reacciones": {"RA": reaccion_A, "RB": reaccion_B, "MA": momento_A},
             "Vu_max": Vu_max,
             "Mu_max": Mu_max,
+            "x": x,
+            "V": V,
+            "M": M,
         }
 
+    def analizar_casos_unitarios(self) -> dict:
+        """
+        Analiza cada caso de carga presente en la viga con factor 1.0.
+
+        Devuelve los extremos con signo de los diagramas de cortante y momento
+        de cada caso, junto con el signo del diagrama en cada estación. Por
+        superposición lineal, esta información basta para saber si una
+        combinación puede gobernar sin tener que analizarla.
+
+        Returns:
+            dict: {nombre_caso: {"M_max", "M_min", "V_max", "V_min", "signo_M", "signo_V"}}.
+        """
+        extremos = {}
+        casos = {carga.caso_carga.name for carga in self.viga.cargas}
+        for caso in sorted(casos):
+            resultado = self.analizar(combinacion={caso: 1.0})
+            extremos[caso] = {
+                "M_max": float(resultado["M"].max()), "M_min": float(resultado["M"].min()),
+                "V_max": float(resultado["V"].max()), "V_min": float(resultado["V"].min()),
+                "signo_M": self._signo_diagrama(resultado["M"]),
+                "signo_V": self._signo_diagrama(resultado["V"]),
+            }
+        return extremos
+
+    @staticmethod
+    def _signo_diagrama(diagrama: np.ndarray) -> np.ndarray:
+        """Signo por estación, tratando como cero el ruido numérico cerca de los apoyos."""
+        tolerancia = 1e-9 * np.abs(diagrama).max()
+        return np.sign(np.where(np.abs(diagrama) > tolerancia, diagrama, 0.0)).astype(np.int8)
+
     def _aplicar_factores(self, combinacion: dict) -> list:
         """Filtra y factoriza las cargas de la viga según la combinación."""
         cargas_factorizadas = []
@@ -1,6 +1,8 @@
 # calculos/perfil.py (NUEVA VERSIÓN CON PANDAS)
 # -*- coding: utf-8 -*-
 import os
+import functools
+import numpy as np
 import pandas as pd
 from core.config import ProyectoConfig
 from core.materials import MaterialAcero
@@ -14,6 +16,8 @@ IN_A_MM = 25.4
 IN2_A_MM2 = IN_A_MM ** 2
 IN3_A_MM3 = IN_A_MM ** 3
 IN4_A_MM4 = IN_A_MM ** 4
+IN6_A_MM6 = IN_A_MM ** 6
+LBFT_A_KGM = 1.48816
 
 def _cargar_base_de_datos_aisc_xlsx():
     """
@@ -42,19 +46,24 @@ def _cargar_base_de_datos_aisc_xlsx():
                 
                 try:
                     props_imp = {
+                        "W": float(row['W']),
                         "A": float(row['A']), "d": float(row['d']), "bf": float(row['bf']),
                         "tf": float(row['tf']), "tw": float(row['tw']), "Ix": float(row['Ix']),
                         "Zx": float(row['Zx']), "Sx": float(row['Sx']), "ry": float(row['ry']),
-                        "rts": float(row['rts'])
+                        "rts": float(row['rts']), "J": float(row['J']), "Cw": float(row['Cw']),
+                        "ho": float(row['ho']), "h_tw": float(row['h/tw'])
                     }
                     db_imp[label] = props_imp
 
                     props_si = {
+                        "W": props_imp["W"] * LBFT_A_KGM,
                         "A": props_imp["A"] * IN2_A_MM2, "d": props_imp["d"] * IN_A_MM,
                         "bf": props_imp["bf"] * IN_A_MM, "tf": props_imp["tf"] * IN_A_MM,
                         "tw": props_imp["tw"] * IN_A_MM, "Ix": props_imp["Ix"] * IN4_A_MM4,
                         "Zx": props_imp["Zx"] * IN3_A_MM3, "Sx": props_imp["Sx"] * IN3_A_MM3,
-                        "ry": props_imp["ry"] * IN_A_MM, "rts": props_imp["rts"] * IN_A_MM
+                        "ry": props_imp["ry"] * IN_A_MM, "rts": props_imp["rts"] * IN_A_MM,
+                        "J": props_imp["J"] * IN4_A_MM4, "Cw": props_imp["Cw"] * IN6_A_MM6,
+                        "ho": props_imp["ho"] * IN_A_MM, "h_tw": props_imp["h_tw"]
                     }
                     db_si[label] = props_si
                 except (ValueError, TypeError):
@@ -73,6 +82,29 @@ def _cargar_base_de_datos_aisc_xlsx():
 _db_perfiles_imp, _db_perfiles_si = _cargar_base_de_datos_aisc_xlsx()
 
 
+@functools.lru_cache(maxsize=None)
+def obtener_tabla_perfiles(unidad_longitud: str) -> dict:
+    """
+    Devuelve todos los perfiles W como arreglos de NumPy, ordenados del más
+    ligero al más pesado (peso 'W' en lb/ft o kg/m).
+
+    Se construye una sola vez por sistema de unidades y se comparte entre los
+    módulos de diseño que recorren la tabla completa (ej. selección de perfiles).
+
+    Args:
+        unidad_longitud (str): Unidad de longitud del proyecto; 'm' o 'mm' usan la tabla en SI.
+
+    Returns:
+        dict: {"nombre": arreglo de etiquetas, <propiedad>: arreglo de valores}.
+    """
+    db = _db_perfiles_si if unidad_longitud in ['m', 'mm'] else _db_perfiles_imp
+    nombres = sorted(db, key=lambda nombre: (db[nombre]["W"], nombre))
+    tabla = {"nombre": np.array(nombres)}
+    for propiedad in db[nombres[0]]:
+        tabla[propiedad] = np.array([db[nombre][propiedad] for nombre in nombres])
+    return tabla
+
+
 # La clase PerfilAcero no necesita ningún cambio en su lógica.
 # Sigue funcionando igual, pero ahora se alimenta de una fuente de datos mucho más robusta.
 class PerfilAcero:
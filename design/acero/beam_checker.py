@@ -1,20 +1,104 @@
 # calculos/verificador.py (NUEVO MÓDULO)
 # -*- coding: utf-8 -*-
-from analysis.model import Viga
+import functools
+import numpy as np
+from analysis.model import Viga, TipoApoyo
 from core.config import NormativaDisenoAcero, MetodoDiseno
+from design.acero.shear_table import resistencia_cortante
+
+# Factores para llevar longitudes de la viga a las unidades de la sección (mm o in).
+_FACTOR_LONGITUD_A_SECCION = {'m': 1000.0, 'mm': 1.0, 'ft': 12.0, 'in': 1.0}
+
+# Factores para llevar momentos de la sección (N·mm o kip-in) a las unidades del proyecto (kNm, kip-ft, kip-in).
+_FACTOR_MOMENTO_A_PROYECTO = {'m': 1e-6, 'mm': 1e-6, 'ft': 1 / 12, 'in': 1.0}
+
+# Estados límite del Capítulo F, en el orden de los códigos de `resistencia_nominal_flexion`.
+ESTADOS_LIMITE_FLEXION = ("Fluencia", "PLT inelástico", "PLT elástico", "Pandeo local del patín")
+
+def constantes_flexion(Fy, E, Zx, Sx, ry, rts, J, ho, bf, tf, d, tw) -> dict:
+    """
+    Calcula las constantes de flexión que solo dependen del perfil y del material
+    (AISC 360-22, F2 y F3 para perfiles I doblemente simétricos, eje fuerte).
+
+    Acepta escalares o arreglos de NumPy, de modo que sirve tanto para una viga
+    como para una tabla completa de perfiles.
+    """
+    Mp = Fy * Zx
+    Mr = 0.7 * Fy * Sx
+    Lp = 1.76 * ry * np.sqrt(E / Fy)
+    termino_torsion = J / (Sx * ho)  # c = 1.0 en perfiles doblemente simétricos
+    Lr = 1.95 * rts * (E / (0.7 * Fy)) * np.sqrt(
+        termino_torsion + np.sqrt(termino_torsion**2 + 6.76 * (0.7 * Fy / E)**2))
+
+    # Pandeo local del patín (F3): el límite no depende de Lb, se calcula una sola vez.
+    lambda_f = bf / (2 * tf)
+    lambda_pf = 0.38 * np.sqrt(E / Fy)
+    lambda_rf = 1.0 * np.sqrt(E / Fy)
+    kc = np.clip(4 / np.sqrt((d - 2 * tf) / tw), 0.35, 0.76)
+    Mn_patin = np.where(
+        lambda_f <= lambda_pf, Mp,
+        np.where(lambda_f <= lambda_rf,
+                 Mp - (Mp - Mr) * (lambda_f - lambda_pf) / (lambda_rf - lambda_pf),
+                 0.9 * E * kc * Sx / lambda_f**2))
+
+    return {"E": E, "Mp": Mp, "Mr": Mr, "Lp": Lp, "Lr": Lr, "rts": rts, "Sx": Sx,
+            "termino_torsion": termino_torsion, "Mn_patin": Mn_patin}
+
+def resistencia_nominal_flexion(constantes: dict, Lb, Cb):
+    """
+    Evalúa Mn para una longitud no arriostrada Lb y un factor Cb a partir de
+    `constantes_flexion` (AISC 360-22, Ecs. F2-1 a F2-4 y F3).
+
+    Returns:
+        tuple: (Mn, código del estado límite que controla según ESTADOS_LIMITE_FLEXION).
+    """
+    k = constantes
+    Mp, Mr, Lp, Lr = k["Mp"], k["Mr"], k["Lp"], k["Lr"]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        Mn_inelastico = Cb * (Mp - (Mp - Mr) * (Lb - Lp) / (Lr - Lp))
+        esbeltez_sq = (Lb / k["rts"])**2
+        Fcr = (Cb * np.pi**2 * k["E"] / esbeltez_sq) * np.sqrt(1 + 0.078 * k["termino_torsion"] * esbeltez_sq)
+    Mn_plt = np.where(Lb <= Lp, Mp, np.where(Lb <= Lr, Mn_inelastico, Fcr * k["Sx"]))
+    Mn_plt = np.minimum(Mn_plt, Mp)
+
+    Mn = np.minimum(Mn_plt, k["Mn_patin"])
+    estado = np.where(Mn_plt < Mp, np.where(Lb <= Lr, 1, 2), 0)
+    estado = np.where(k["Mn_patin"] < Mn_plt, 3, estado)
+    return Mn, estado
+
+def factor_cb(x: np.ndarray, M: np.ndarray, inicio: float, fin: float) -> tuple:
+    """
+    Calcula Cb (AISC 360-22, Ec. F1-1) y el momento máximo absoluto de un
+    segmento no arriostrado a partir del diagrama de momentos por estaciones.
+
+    Returns:
+        tuple: (Cb, Mmax) del segmento [inicio, fin].
+    """
+    en_segmento = (x >= inicio) & (x <= fin)
+    M_abs = np.abs(M)
+    Mmax = M_abs[en_segmento].max() if en_segmento.any() else 0.0
+    MA, MB, MC = np.abs(np.interp(inicio + np.array([0.25, 0.5, 0.75]) * (fin - inicio), x, M))
+    Mmax = max(Mmax, MA, MB, MC)
+    denominador = 2.5 * Mmax + 3 * MA + 4 * MB + 3 * MC
+    if denominador == 0:
+        return 1.0, 0.0
+
+    # Limitación a 3.0, igual que en el cálculo de Cb de las pruebas.
+    return min(float(12.5 * Mmax / denominador), 3.0), float(Mmax)
 
 class VerificadorResistencia:
     """
     Clase base para los verificadores de resistencia.
     Selecciona el motor de cálculo de resistencia correcto según la normativa de diseño.
     """
-    def __new__(cls, viga: Viga, Mu: float, Vu: float):
+    def __new__(cls, viga: Viga, Mu: float, Vu: float, resultados_analisis: list = None,
+                puntos_arriostramiento: list = None):
         config = viga.config
         norma_diseno = config.normativa_diseno
         
         if norma_diseno == NormativaDisenoAcero.AISC_360_22 and config.metodo_diseno == MetodoDiseno.LRFD:
             # Si se elige AISC, crea una instancia del verificador específico para AISC
-            return VerificadorAISC36022_LRFD(viga, Mu, Vu)
+            return VerificadorAISC36022_LRFD(viga, Mu, Vu, resultados_analisis, puntos_arriostramiento)
         
         # Futuro: Añadir otros verificadores
         # elif norma_diseno == NormativaDisenoAcero.NTC_ACERO_2020:
@@ -22,63 +106,108 @@ class VerificadorResistencia:
             
         raise NotImplementedError(f"No hay un motor de verificación de resistencia para {norma_diseno.value}")
 
+@functools.lru_cache(maxsize=512)
+def _constantes_flexion_perfil(Fy, E, Zx, Sx, ry, rts, J, ho, bf, tf, d, tw) -> dict:
+    """`constantes_flexion` de un solo perfil (escalares), con caché acotada para corridas largas."""
+    return constantes_flexion(Fy, E, Zx, Sx, ry, rts, J, ho, bf, tf, d, tw)
+
 class VerificadorAISC36022_LRFD:
     """Calcula la resistencia de una viga de acero según AISC 360-22 (LRFD)."""
-    def __init__(self, viga: Viga, Mu: float, Vu: float):
+
+    def __init__(self, viga: Viga, Mu: float, Vu: float, resultados_analisis: list = None,
+                 puntos_arriostramiento: list = None):
+        """
+        Args:
+            viga (Viga): Viga con perfil asignado.
+            Mu (float): Momento último requerido (envolvente).
+            Vu (float): Cortante último requerido (envolvente).
+            resultados_analisis (list, opcional): Resultados de `AnalizadorViga.analizar`
+                (uno por combinación) con los diagramas 'x' y 'M' por estaciones.
+                Con ellos se obtienen Mu y Cb de cada segmento no arriostrado.
+            puntos_arriostramiento (list, opcional): Posiciones de los arriostramientos
+                laterales, en unidades de longitud de la viga. Por omisión solo los apoyos;
+                en un cantiléver el extremo libre (x = L) solo está arriostrado si se incluye aquí.
+        """
         self.viga = viga
         self.Mu = Mu  # Momento último requerido (Acción)
         self.Vu = Vu  # Cortante último requerido (Acción)
         self.perfil = viga.perfil_asignado
         self.material = self.perfil.material
+        self.resultados_analisis = resultados_analisis or []
+        # Límites de los segmentos no arriostrados; x = L siempre cierra el último segmento.
+        self.puntos_arriostramiento = sorted(set([0.0, viga.longitud] + list(puntos_arriostramiento or [])))
+        self.extremo_libre_sin_arriostrar = (viga.tipo_apoyo == TipoApoyo.CANTILEVER and not np.isclose(
+            list(puntos_arriostramiento or []), viga.longitud).any())
         
         # Factores de Resistencia (φ) para LRFD
         self.phi_b = 0.90  # Factor de resistencia a flexión
-        self.phi_v = 0.90  # Factor de resistencia a cortante (para almas sin rigidizar)
+        # φv depende de la esbeltez del alma (G2.1); viene de la tabla de cortante.
+
+    def _constantes_flexion(self) -> dict:
+        """Devuelve las constantes de flexión del perfil; se reutilizan entre vigas con el mismo perfil."""
+        p = self.perfil
+        return _constantes_flexion_perfil(self.material.Fy, self.material.E, p.Zx, p.Sx, p.ry, p.rts,
+                                          p.J, p.ho, p.bf, p.tf, p.d, p.tw)
 
     def revisar_flexion(self) -> dict:
         """
-        Revisa la viga por flexión (Capítulo F, AISC 360-22).
-        NOTA: Implementación simplificada asumiendo sección compacta y Lb=0.
-        """
-        # Resistencia Nominal a Momento (Mn)
-        # Asumimos que la sección es compacta y no hay pandeo lateral-torsional (PLT).
-        # Mp = Momento plástico = Fy * Zx
-        Mp = self.material.Fy * self.perfil.Zx
-        Mn = Mp
-        
-        # Resistencia de Diseño a Momento (φMn)
-        phi_Mn = self.phi_b * Mn
+        Revisa la viga por flexión (Capítulo F, AISC 360-22), incluyendo pandeo
+        lateral-torsional y pandeo local del patín.
 
-        # Conversión de unidades si es necesario (ej. Zx de mm3 a m3)
+        Cada segmento entre arriostramientos se revisa con su propio Lb. Si se
+        proporcionaron los diagramas del análisis, Mu y Cb de cada segmento se
+        obtienen de ellos para cada combinación; si no, se usa Mu de la envolvente
+        con Cb = 1.0 (conservador). En el segmento del extremo libre de un cantiléver
+        sin arriostrar Cb = 1.0 (AISC 360-22, F1).
+        """
         unidad_long = self.viga.config.unidades['longitud']
-        if unidad_long in ['m', 'mm']:
-            # Zx(mm3) * Fy(MPa=N/mm2) = N*mm. Convertir a kNm
-            phi_Mn /= (1000 * 1000)
-            
-        ratio = self.Mu / phi_Mn
-        status = "CUMPLE" if ratio <= 1.0 else "NO CUMPLE"
-        
-        return {"Mu": self.Mu, "phi_Mn": phi_Mn, "Ratio": ratio, "Status": status}
+        factor_longitud = _FACTOR_LONGITUD_A_SECCION[unidad_long]
+        # Zx(mm3) * Fy(MPa=N/mm2) = N*mm -> kNm; Zx(in3) * Fy(ksi) = kip-in -> kip-ft si el proyecto usa ft
+        factor_momento = _FACTOR_MOMENTO_A_PROYECTO[unidad_long]
+        constantes = self._constantes_flexion()
+
+        diagramas = [(r["x"], r["M"]) for r in self.resultados_analisis if "M" in r]
+        gobierna = None
+        for inicio, fin in zip(self.puntos_arriostramiento[:-1], self.puntos_arriostramiento[1:]):
+            if diagramas:
+                demandas = [factor_cb(x, M, inicio, fin) for x, M in diagramas]
+                if self.extremo_libre_sin_arriostrar and fin == self.viga.longitud:
+                    demandas = [(1.0, Mu_segmento) for _, Mu_segmento in demandas]
+            else:
+                demandas = [(1.0, self.Mu)]
+
+            Lb = (fin - inicio) * factor_longitud
+            for Cb, Mu_segmento in demandas:
+                Mn, estado = resistencia_nominal_flexion(constantes, Lb, Cb)
+                # Resistencia de Diseño a Momento (φMn)
+                phi_Mn = self.phi_b * float(Mn) * factor_momento
+                ratio = Mu_segmento / phi_Mn
+                if gobierna is None or ratio > gobierna["Ratio"]:
+                    gobierna = {"Mu": Mu_segmento, "phi_Mn": phi_Mn, "Ratio": ratio,
+                                "Lb": fin - inicio, "Cb": Cb, "Estado_Limite": ESTADOS_LIMITE_FLEXION[int(estado)]}
+
+        gobierna["Status"] = "CUMPLE" if gobierna["Ratio"] <= 1.0 else "NO CUMPLE"
+        return gobierna
 
     def revisar_cortante(self) -> dict:
         """
-        Revisa la viga por cortante (Capítulo G, AISC 360-22).
-        NOTA: Implementación simplificada.
+        Revisa la viga por cortante (Capítulo G, AISC 360-22) para almas sin
+        rigidizadores transversales. Cv1 y φv se toman de la tabla precalculada
+        del grado de acero (G2.1(a): φv = 1.0 si h/tw ≤ 2.24·√(E/Fy)).
         """
-        # Resistencia Nominal a Cortante (Vn)
-        # Vn = 0.6 * Fy * Aw * Cv1  (asumimos Cv1=1.0)
-        Aw = self.perfil.d * self.perfil.tw # Área del alma
-        Vn = 0.6 * self.material.Fy * Aw
-        
-        # Resistencia de Diseño a Cortante (φVn)
-        phi_Vn = self.phi_v * Vn
+        unidad_long = self.viga.config.unidades['longitud']
+        cortante = resistencia_cortante(self.perfil.nombre, self.material.Fy, self.material.E, unidad_long)
+
+        # Resistencia de Diseño a Cortante: φVn = φv * 0.6 * Fy * Aw * Cv1
+        phi_Vn = cortante["phi_Vn"]
 
         # Conversión de unidades si es necesario (ej. Aw de mm2 a m2)
-        if self.viga.config.unidades['longitud'] in ['m', 'mm']:
+        if unidad_long in ['m', 'mm']:
             # Fy(MPa=N/mm2) * Aw(mm2) = N. Convertir a kN
             phi_Vn /= 1000
 
         ratio = self.Vu / phi_Vn
         status = "CUMPLE" if ratio <= 1.0 else "NO CUMPLE"
 
-        return {"Vu": self.Vu, "phi_Vn": phi_Vn, "Ratio": ratio, "Status": status}
\ No newline at end of file
+        return {"Vu": self.Vu, "phi_Vn": phi_Vn, "Ratio": ratio, "Status": status,
+                "Cv1": cortante["Cv1"], "phi_v": cortante["phi_v"], "Clase_Alma": cortante["Clase_Alma"]}
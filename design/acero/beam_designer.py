@@ -0,0 +1,147 @@
+# calculos/disenador_vigas.py (NUEVO MÓDULO)
+# -*- coding: utf-8 -*-
+import numpy as np
+from core.config import ProyectoConfig
+from core.materials import MaterialAcero
+from core.sections import obtener_tabla_perfiles
+from design.acero.shear_table import tabla_cortante
+from design.acero.beam_checker import (_FACTOR_LONGITUD_A_SECCION, _FACTOR_MOMENTO_A_PROYECTO,
+                                       constantes_flexion, resistencia_nominal_flexion)
+
+# Factores para llevar fuerzas del proyecto a las unidades de la sección (N o kips).
+_FACTOR_FUERZA_A_SECCION = {'kN': 1000.0, 'N': 1.0, 'kips': 1.0}
+
+class DisenadorViga:
+    """
+    Selecciona el perfil W más ligero que cumple flexión (incluyendo PLT), cortante
+    y una inercia mínima, según AISC 360-22 (LRFD).
+
+    La tabla de perfiles se recorre en orden de peso. Antes de evaluar el Capítulo F,
+    cada perfil se descarta con cotas necesarias baratas (Zx ≥ Mu/(φb·Fy),
+    φVn ≥ Vu, Ix ≥ Ix requerida); las revisiones completas solo se hacen
+    sobre los supervivientes y cada viga se detiene en el primer perfil que cumple.
+    """
+    def __init__(self, config: ProyectoConfig, material: MaterialAcero):
+        self.config = config
+        self.material = material
+        unidad_long = config.unidades['longitud']
+        self.tabla = obtener_tabla_perfiles(unidad_long)
+        self.factor_longitud = _FACTOR_LONGITUD_A_SECCION[unidad_long]
+        # Zx(mm3) * Fy(MPa=N/mm2) = N*mm -> kNm (kip-in -> kip-ft en ft); Aw(mm2) * Fy(MPa) = N -> kN
+        self.factor_momento = _FACTOR_MOMENTO_A_PROYECTO[unidad_long]
+        self.factor_cortante = 1 / 1000 if unidad_long in ['m', 'mm'] else 1.0
+
+        # Factor de Resistencia (φ) a flexión para LRFD, igual al de VerificadorAISC36022_LRFD
+        self.phi_b = 0.90
+
+        # Capacidades que solo dependen del perfil y del material: una vez para toda la tabla.
+        t = self.tabla
+        Fy, E = material.Fy, material.E
+        self.constantes = constantes_flexion(Fy, E, t["Zx"], t["Sx"], t["ry"], t["rts"], t["J"],
+                                             t["ho"], t["bf"], t["tf"], t["d"], t["tw"])
+        self.phi_Mp = self.phi_b * self.constantes["Mp"] * self.factor_momento
+        # φVn con Cv1 y φv por perfil (G2.1), en el mismo orden de la tabla de perfiles.
+        self.phi_Vn = tabla_cortante(Fy, E, unidad_long)["phi_Vn"] * self.factor_cortante
+
+    def inercia_requerida(self, w_servicio, longitud, limite_deflexion: float = 360.0):
+        """
+        Inercia mínima de una viga simplemente apoyada con carga uniforme para que
+        la flecha no exceda L/limite: Ix = 5·w·L⁴·limite / (384·E·L).
+
+        Args:
+            w_servicio: Carga de servicio en fuerza/longitud del proyecto (ej. kN/m).
+            longitud: Claro en unidades de longitud del proyecto.
+            limite_deflexion (float): Denominador del límite (ej. 360 para L/360).
+
+        Returns:
+            Ix requerida en unidades de la sección (mm4 o in4).
+        """
+        L = np.asarray(longitud, dtype=float) * self.factor_longitud
+        w = np.asarray(w_servicio, dtype=float) * _FACTOR_FUERZA_A_SECCION[self.config.unidades['fuerza']] / self.factor_longitud
+        return 5 * w * L**3 * limite_deflexion / (384 * self.material.E)
+
+    def seleccionar_perfiles(self, Mu, Vu, Lb, Cb=1.0, Ix_requerido=0.0, tam_bloque: int = 16) -> dict:
+        """
+        Selecciona el perfil más ligero para un lote de vigas.
+
+        Args:
+            Mu, Vu: Momento y cortante últimos (unidades del proyecto), escalares o arreglos.
+            Lb: Longitud no arriostrada en unidades de longitud del proyecto.
+            Cb: Factor de modificación por momento no uniforme.
+            Ix_requerido: Inercia mínima en unidades de la sección (ver `inercia_requerida`).
+            tam_bloque (int): Perfiles evaluados por iteración en orden de peso.
+
+        Returns:
+            dict: Arreglos por viga con 'perfil' ('' si ninguno cumple), 'indice' (-1 si
+                ninguno), 'peso', 'phi_Mn', 'phi_Vn', 'ratio_flexion' y 'ratio_cortante'.
+        """
+        Mu, Vu, Lb, Cb, Ix_req = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float))
+                                                       for v in (Mu, Vu, Lb, Cb, Ix_requerido)))
+        Lb = Lb * self.factor_longitud
+        t = self.tabla
+        num_perfiles = len(t["nombre"])
+
+        indice = np.full(Mu.shape, -1, dtype=int)
+        phi_Mn = np.full(Mu.shape, np.nan)
+        pendientes = np.arange(Mu.size)
+
+        for inicio in range(0, num_perfiles, tam_bloque):
+            if pendientes.size == 0:
+                break
+            bloque = np.arange(inicio, min(inicio + tam_bloque, num_perfiles))
+
+            # Cotas necesarias: Mn ≤ Mp, así que si φMp < Mu el perfil no puede cumplir.
+            candidato = ((self.phi_Mp[bloque][None, :] >= Mu.flat[pendientes][:, None])
+                         & (self.phi_Vn[bloque][None, :] >= Vu.flat[pendientes][:, None])
+                         & (t["Ix"][bloque][None, :] >= Ix_req.flat[pendientes][:, None]))
+            filas, columnas = np.nonzero(candidato)
+            if filas.size == 0:
+                continue
+
+            # Revisión completa del Capítulo F solo sobre los pares (viga, perfil) supervivientes.
+            vigas, perfiles = pendientes[filas], bloque[columnas]
+            constantes = {k: v[perfiles] if np.ndim(v) else v for k, v in self.constantes.items()}
+            Mn, _ = resistencia_nominal_flexion(constantes, Lb.flat[vigas], Cb.flat[vigas])
+            phi_Mn_pares = self.phi_b * Mn * self.factor_momento
+            cumple = np.zeros(candidato.shape, dtype=bool)
+            cumple[filas, columnas] = phi_Mn_pares >= Mu.flat[vigas]
+
+            resueltas = cumple.any(axis=1)
+            primero = cumple.argmax(axis=1)[resueltas]
+            vigas_resueltas = pendientes[resueltas]
+            indice.flat[vigas_resueltas] = bloque[primero]
+            phi_Mn_bloque = np.full(candidato.shape, np.nan)
+            phi_Mn_bloque[filas, columnas] = phi_Mn_pares
+            phi_Mn.flat[vigas_resueltas] = phi_Mn_bloque[resueltas, primero]
+            pendientes = pendientes[~resueltas]
+
+        encontrado = indice >= 0
+        seguro = np.where(encontrado, indice, 0)
+        phi_Vn = np.where(encontrado, self.phi_Vn[seguro], np.nan)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return {
+                "perfil": np.where(encontrado, t["nombre"][seguro], ""),
+                "indice": indice,
+                "peso": np.where(encontrado, t["W"][seguro], np.nan),
+                "phi_Mn": phi_Mn,
+                "phi_Vn": phi_Vn,
+                "ratio_flexion": Mu / phi_Mn,
+                "ratio_cortante": Vu / phi_Vn,
+            }
+
+    def seleccionar_perfil(self, Mu: float, Vu: float, Lb: float, Cb: float = 1.0,
+                           Ix_requerido: float = 0.0) -> dict:
+        """
+        Selecciona el perfil más ligero para una sola viga.
+
+        Returns:
+            dict: {"Perfil", "Peso", "phi_Mn", "phi_Vn", "Ratio_Flexion", "Ratio_Cortante"},
+                o None si ningún perfil de la tabla cumple.
+        """
+        res = self.seleccionar_perfiles(Mu, Vu, Lb, Cb, Ix_requerido)
+        if res["indice"][0] < 0:
+            return None
+        return {"Perfil": str(res["perfil"][0]), "Peso": float(res["peso"][0]),
+                "phi_Mn": float(res["phi_Mn"][0]), "phi_Vn": float(res["phi_Vn"][0]),
+                "Ratio_Flexion": float(res["ratio_flexion"][0]),
+                "Ratio_Cortante": float(res["ratio_cortante"][0])}
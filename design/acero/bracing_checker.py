@@ -11,6 +11,10 @@ class ArriostramientoTipo(Enum):
 class CurvaturaTipo(Enum):
     DOBLE = "doble"; NORMAL = "normal"
 
+# Resultados a nivel de módulo para que se puedan enviar entre procesos (pickle).
+ResultadoLateral = collections.namedtuple('ResultadoLateral', ['resistencia', 'rigidez'])
+ResultadoTorsional = collections.namedtuple('ResultadoTorsional', ['resistencia_momento', 'rigidez_torsional'])
+
 class CalculadoraArriostramiento:
     """
     Calcula los requisitos de resistencia y rigidez para el arriostramiento
@@ -27,8 +31,8 @@ class CalculadoraArriostramiento:
         self.omega_torsional = 3.0 # <-- Factor para arriostramiento torsional en ASD
         
         # Namedtuples para organizar las salidas
-        self.ResultadoLateral = collections.namedtuple('ResultadoLateral', ['resistencia', 'rigidez'])
-        self.ResultadoTorsional = collections.namedtuple('ResultadoTorsional', ['resistencia_momento', 'rigidez_torsional'])
+        self.ResultadoLateral = ResultadoLateral
+        self.ResultadoTorsional = ResultadoTorsional
 
     def _get_factor_analisis(self, tipo='lateral'):
         """Obtiene el factor multiplicador según el método de diseño (LRFD o ASD)."""
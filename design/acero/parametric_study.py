@@ -0,0 +1,191 @@
+# calculos/estudio_parametrico.py (NUEVO MÓDULO)
+# -*- coding: utf-8 -*-
+import numpy as np
+from core.config import ProyectoConfig
+from core.sections import obtener_tabla_perfiles
+from analysis.combinations import GestorCombinaciones
+from design.acero.beam_checker import (_FACTOR_LONGITUD_A_SECCION, _FACTOR_MOMENTO_A_PROYECTO,
+                                       constantes_flexion, resistencia_nominal_flexion)
+from design.acero.beam_designer import _FACTOR_FUERZA_A_SECCION
+from design.acero.shear_table import tabla_cortante
+
+# Revisiones del estudio, en el orden de los códigos de 'revision_gobierna'.
+REVISIONES_ESTUDIO = ("Flexión", "Cortante", "Deflexión")
+
+# Peso propio: de kg/m o lb/ft (columna 'W' de la tabla) a fuerza/longitud del proyecto.
+_PESO_PROPIO_A_PROYECTO = {('kN', 'm'): 9.80665e-3, ('N', 'm'): 9.80665, ('kips', 'ft'): 1e-3}
+
+class ResultadoEstudio:
+    """
+    Resultado etiquetado de un estudio paramétrico: arreglos N-D cuyos ejes son
+    `dimensiones`, con las coordenadas de cada eje en `ejes`.
+    """
+    def __init__(self, ejes: dict, ratios: dict):
+        self.ejes = ejes
+        self.dimensiones = tuple(ejes)
+        self.ratios = ratios  # {"Flexión": arreglo, "Cortante": ..., "Deflexión": ...}
+        apilados = np.stack([ratios[r] for r in REVISIONES_ESTUDIO])
+        self.revision_gobierna = np.argmax(apilados, axis=0).astype(np.int8)
+        self.ratio = np.max(apilados, axis=0)
+
+    @property
+    def forma(self) -> tuple:
+        return self.ratio.shape
+
+    def seleccionar(self, **coordenadas) -> "ResultadoEstudio":
+        """
+        Extrae un sub-estudio por valores de coordenada, ej.
+        `seleccionar(perfil="W18X35", material="ASTM A992")`. Un valor escalar
+        elimina el eje; una lista lo conserva con esas coordenadas.
+        """
+        indices, ejes = [], {}
+        for dim in self.dimensiones:
+            coords = self.ejes[dim]
+            if dim not in coordenadas:
+                indices.append(slice(None)); ejes[dim] = coords
+                continue
+            valor = coordenadas[dim]
+            if np.ndim(valor) == 0:
+                indices.append(self._posicion(dim, valor))
+            else:
+                posiciones = [self._posicion(dim, v) for v in valor]
+                indices.append(posiciones); ejes[dim] = coords[posiciones]
+        # Se indexa eje por eje para que varias listas no se combinen entre sí.
+        def extraer(arreglo):
+            for eje, indice in reversed(list(enumerate(indices))):
+                arreglo = np.take(arreglo, indice, axis=eje) if not isinstance(indice, slice) else arreglo
+            return arreglo
+        return ResultadoEstudio(ejes, {r: extraer(a) for r, a in self.ratios.items()})
+
+    def _posicion(self, dim: str, valor) -> int:
+        coords = self.ejes[dim]
+        if coords.dtype.kind in 'fc':
+            coincide = np.isclose(coords, valor)
+        else:
+            coincide = coords == valor
+        if not coincide.any():
+            raise KeyError(f"El valor {valor!r} no está en el eje '{dim}'.")
+        return int(np.argmax(coincide))
+
+    def a_dataframe(self):
+        """Devuelve el resultado en formato largo (una fila por punto) como DataFrame de pandas."""
+        import pandas as pd
+        mallas = np.meshgrid(*(self.ejes[d] for d in self.dimensiones), indexing='ij')
+        datos = {d: m.ravel() for d, m in zip(self.dimensiones, mallas)}
+        datos.update({f"Ratio {r}": self.ratios[r].ravel() for r in REVISIONES_ESTUDIO})
+        datos["Ratio"] = self.ratio.ravel()
+        datos["Revision_Gobierna"] = np.array(REVISIONES_ESTUDIO)[self.revision_gobierna.ravel()]
+        return pd.DataFrame(datos)
+
+class EstudioParametrico:
+    """
+    Barrido paramétrico de vigas simplemente apoyadas con carga uniforme
+    (AISC 360-22, LRFD): claro × carga viva × perfil × material.
+
+    Lo que solo depende del perfil y del material (Mp, Lp, Lr, φVn...) se calcula
+    una vez por par perfil-material; lo que solo depende de la carga (wu por
+    combinación) una vez por valor de carga; el resto se evalúa con difusión de
+    NumPy sobre la malla completa, sin bucles de Python por punto.
+    """
+    def __init__(self, config: ProyectoConfig, ancho_tributario: float, carga_muerta: float,
+                 incluir_peso_propio: bool = True, limite_deflexion: float = 360.0):
+        """
+        Args:
+            config (ProyectoConfig): Configuración del proyecto (unidades y normativas).
+            ancho_tributario (float): Ancho tributario de la viga (unidades de longitud).
+            carga_muerta (float): Carga muerta superficial (ej. kPa = kN/m²).
+            incluir_peso_propio (bool): Suma el peso del perfil a la carga muerta.
+            limite_deflexion (float): Denominador del límite de flecha por carga viva (L/360).
+        """
+        self.config = config
+        self.ancho_tributario = ancho_tributario
+        self.carga_muerta = carga_muerta
+        self.incluir_peso_propio = incluir_peso_propio
+        self.limite_deflexion = limite_deflexion
+
+        unidades = config.unidades
+        self.unidad_long = unidades['longitud']
+        self.factor_longitud = _FACTOR_LONGITUD_A_SECCION[self.unidad_long]
+        self.factor_fuerza = _FACTOR_FUERZA_A_SECCION[unidades['fuerza']]
+        self.combinaciones = GestorCombinaciones(config).obtener_combinaciones()
+        self.phi_b = 0.90
+
+    @staticmethod
+    def perfiles_de_series(unidad_longitud: str, series: list) -> list:
+        """Perfiles W de las series indicadas (ej. ['W18', 'W21']), del más ligero al más pesado."""
+        nombres = obtener_tabla_perfiles(unidad_longitud)["nombre"]
+        return [n for n in nombres if n.split('X')[0] in series]
+
+    def ejecutar(self, claros, cargas_vivas, perfiles: list, materiales: list,
+                 distancia_arriostramiento: float = None, Cb: float = 1.0) -> ResultadoEstudio:
+        """
+        Evalúa flexión (con PLT), cortante y flecha por carga viva en toda la malla.
+
+        Args:
+            claros (array_like): Claros de la viga (unidades de longitud).
+            cargas_vivas (array_like): Cargas vivas superficiales (ej. kPa).
+            perfiles (list): Nombres de perfiles W.
+            materiales (list[MaterialAcero]): Grados de acero.
+            distancia_arriostramiento (float, opcional): Separación de arriostramientos
+                laterales; por omisión la viga solo está arriostrada en los apoyos (Lb = L).
+            Cb (float): Factor de modificación por momento no uniforme (1.0 conservador).
+
+        Returns:
+            ResultadoEstudio: Ejes ("claro", "carga_viva", "perfil", "material").
+        """
+        claros = np.asarray(claros, dtype=float)
+        cargas_vivas = np.asarray(cargas_vivas, dtype=float)
+        tabla = obtener_tabla_perfiles(self.unidad_long)
+        indice = {nombre: i for i, nombre in enumerate(tabla["nombre"])}
+        faltantes = [p for p in perfiles if p not in indice]
+        if faltantes:
+            raise ValueError(f"Perfiles no encontrados en la base de datos: {faltantes}")
+        idx = np.array([indice[p] for p in perfiles])
+
+        # Forma de la malla: (claro, carga_viva, perfil, material).
+        L = claros[:, None, None, None]
+        q = cargas_vivas[None, :, None, None]
+        Fy = np.array([m.Fy for m in materiales], dtype=float)[None, None, None, :]
+        E = np.array([m.E for m in materiales], dtype=float)[None, None, None, :]
+        def prop(nombre):
+            return tabla[nombre][idx][None, None, :, None]
+
+        # --- Invariantes de perfil y material (una vez por par perfil-material) ---
+        constantes = constantes_flexion(Fy, E, prop("Zx"), prop("Sx"), prop("ry"), prop("rts"), prop("J"),
+                                        prop("ho"), prop("bf"), prop("tf"), prop("d"), prop("tw"))
+        factor_momento = _FACTOR_MOMENTO_A_PROYECTO[self.unidad_long]
+        factor_cortante = 1 / 1000 if self.unidad_long in ['m', 'mm'] else 1.0
+        phi_Vn = np.stack([tabla_cortante(m.Fy, m.E, self.unidad_long)["phi_Vn"][idx] for m in materiales],
+                          axis=-1)[None, None, :, :] * factor_cortante
+        rigidez = E * prop("Ix")  # E·Ix en unidades de la sección
+
+        # --- Invariantes de carga (una vez por valor de carga y perfil) ---
+        w_muerta = self.carga_muerta * self.ancho_tributario
+        if self.incluir_peso_propio:
+            clave = (self.config.unidades['fuerza'], self.unidad_long)
+            if clave not in _PESO_PROPIO_A_PROYECTO:
+                raise NotImplementedError(f"Peso propio no soportado para las unidades {clave}.")
+            w_muerta = w_muerta + prop("W") * _PESO_PROPIO_A_PROYECTO[clave]
+        w_viva = q * self.ancho_tributario
+        wu = np.max([c.get("D", 0.0) * w_muerta + c.get("L", 0.0) * w_viva for c in self.combinaciones], axis=0)
+
+        # --- Malla completa ---
+        Mu = wu * L**2 / 8
+        Vu = wu * L / 2
+        Lb = L if distancia_arriostramiento is None else np.minimum(L, distancia_arriostramiento)
+        Mn, _ = resistencia_nominal_flexion(constantes, Lb * self.factor_longitud, Cb)
+        ratio_flexion = Mu / (self.phi_b * Mn * factor_momento)
+        ratio_cortante = Vu / phi_Vn
+
+        L_seccion = L * self.factor_longitud
+        w_viva_seccion = w_viva * self.factor_fuerza / self.factor_longitud
+        flecha = 5 * w_viva_seccion * L_seccion**4 / (384 * rigidez)
+        ratio_deflexion = flecha / (L_seccion / self.limite_deflexion)
+
+        forma = np.broadcast_shapes(Mu.shape, Mn.shape, phi_Vn.shape, flecha.shape)
+        ejes = {"claro": claros, "carga_viva": cargas_vivas, "perfil": np.array(perfiles),
+                "material": np.array([m.nombre for m in materiales])}
+        ratios = {"Flexión": np.broadcast_to(ratio_flexion, forma),
+                  "Cortante": np.broadcast_to(ratio_cortante, forma),
+                  "Deflexión": np.broadcast_to(ratio_deflexion, forma)}
+        return ResultadoEstudio(ejes, ratios)
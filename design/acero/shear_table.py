@@ -0,0 +1,74 @@
+# calculos/cortante.py (NUEVO MÓDULO)
+# -*- coding: utf-8 -*-
+import functools
+import numpy as np
+from core.sections import obtener_tabla_perfiles
+
+# Clases de alma, en el orden de los códigos de 'clase' en `coeficientes_cortante`.
+CLASES_ALMA_CORTANTE = ("G2.1(a): sin pandeo, φv = 1.0", "Sin pandeo (Cv1 = 1.0)", "Pandeo del alma (Cv1 < 1.0)")
+
+# Coeficiente de pandeo por cortante del alma sin rigidizadores transversales (G2.1(b)(2)).
+KV_ALMA_SIN_RIGIDIZAR = 5.34
+
+def coeficientes_cortante(Fy, E, h_tw, kv: float = KV_ALMA_SIN_RIGIDIZAR) -> dict:
+    """
+    Calcula la clase del alma, Cv1, Cv2 y φv para perfiles I rolados
+    (AISC 360-22, G2.1 y G2.2), con escalares o arreglos de NumPy.
+
+    Cv1 es el que se usa en Vn = 0.6·Fy·Aw·Cv1 (G2-1); Cv2 solo interviene si se
+    considera el campo de tensión con rigidizadores (G2.2).
+    """
+    h_tw = np.asarray(h_tw, dtype=float)
+    limite_a = 2.24 * np.sqrt(E / Fy)
+    limite_inelastico = 1.10 * np.sqrt(kv * E / Fy)
+    limite_elastico = 1.37 * np.sqrt(kv * E / Fy)
+
+    caso_a = h_tw <= limite_a
+    Cv1 = np.where(caso_a | (h_tw <= limite_inelastico), 1.0, limite_inelastico / h_tw)
+    Cv2 = np.where(h_tw <= limite_inelastico, 1.0,
+                   np.where(h_tw <= limite_elastico, limite_inelastico / h_tw,
+                            1.51 * kv * E / (h_tw**2 * Fy)))
+    clase = np.where(caso_a, 0, np.where(Cv1 < 1.0, 2, 1)).astype(np.int8)
+    phi_v = np.where(caso_a, 1.00, 0.90)
+    return {"clase": clase, "Cv1": Cv1, "Cv2": Cv2, "phi_v": phi_v}
+
+@functools.lru_cache(maxsize=None)
+def tabla_cortante(Fy: float, E: float, unidad_longitud: str) -> dict:
+    """
+    Precalcula la resistencia a cortante de todos los perfiles W para un grado
+    de acero: clase del alma, Cv1, Cv2, φv y φVn (en N o kips, unidades de la sección).
+
+    La tabla se calcula con NumPy de una sola vez, así que un grado poco común
+    solo cuesta una pasada vectorizada la primera vez que se pide.
+
+    Returns:
+        dict: Arreglos en el orden de `obtener_tabla_perfiles` más "indice" {nombre: posición}.
+    """
+    perfiles = obtener_tabla_perfiles(unidad_longitud)
+    tabla = coeficientes_cortante(Fy, E, perfiles["h_tw"])
+    Aw = perfiles["d"] * perfiles["tw"]  # Área del alma
+    tabla["h_tw"] = perfiles["h_tw"]
+    tabla["phi_Vn"] = tabla["phi_v"] * 0.6 * Fy * Aw * tabla["Cv1"]
+    tabla["indice"] = {nombre: i for i, nombre in enumerate(perfiles["nombre"])}
+    return tabla
+
+def precalcular_tablas_cortante(unidad_longitud: str, grados: list) -> None:
+    """Construye por adelantado las tablas de los grados [(Fy, E), ...] que usará el proyecto."""
+    for Fy, E in grados:
+        tabla_cortante(Fy, E, unidad_longitud)
+
+def resistencia_cortante(nombre_perfil: str, Fy: float, E: float, unidad_longitud: str) -> dict:
+    """
+    Devuelve la resistencia a cortante de un perfil con una búsqueda O(1) en la
+    tabla del grado de acero.
+
+    Returns:
+        dict: {"h_tw", "Clase_Alma", "Cv1", "Cv2", "phi_v", "phi_Vn"}; φVn en N o kips.
+    """
+    tabla = tabla_cortante(Fy, E, unidad_longitud)
+    if nombre_perfil not in tabla["indice"]:
+        raise ValueError(f"El perfil '{nombre_perfil}' no está en la tabla de cortante (solo perfiles 'W').")
+    i = tabla["indice"][nombre_perfil]
+    return {"h_tw": float(tabla["h_tw"][i]), "Clase_Alma": CLASES_ALMA_CORTANTE[tabla["clase"][i]],
+            "Cv1": float(tabla["Cv1"][i]), "Cv2": float(tabla["Cv2"][i]),
+            "phi_v": float(tabla["phi_v"][i]), "phi_Vn": float(tabla["phi_Vn"][i])}
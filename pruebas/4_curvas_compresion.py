@@ -11,7 +11,7 @@ import matplotlib.pyplot as plt
 
 # Importamos nuestras herramientas desde los otros archivos del paquete
 from aisc_database import DatabaseAISC
-from compression_analysis import calcular_resistencia_compresion
+from compression_analysis import calcular_resistencia_compresion_vectorizada
 
 def main():
     """
@@ -34,32 +34,35 @@ def main():
     plt.style.use('seaborn-v0_8-whitegrid')
     fig, ax = plt.subplots(figsize=(12, 8))
 
-    # --- 3. Bucle de Cálculo y Gráfica ---
+    # --- 3. Cálculo Vectorizado y Gráfica ---
     print("\nIniciando cálculo de curvas de compresión...")
     longitudes_vector_ft = np.linspace(1, longitud_max_ft, num=100)
     longitudes_vector_in = longitudes_vector_ft * 12
 
+    respuesta_db = db.obtener_arreglos_perfiles()
+    if respuesta_db['status'] == 'Error':
+        print(f"    Advertencia: {respuesta_db['mensaje']}.")
+        return
+    tabla = respuesta_db['propiedades']
+    etiquetas = list(tabla['AISC_Manual_Label'])
+
+    indices = []
     for perfil_nombre in perfiles_a_analizar:
-        print(f"  - Procesando perfil: {perfil_nombre}")
-        
-        respuesta_db = db.obtener_propiedades_perfil(perfil_nombre)
-        if respuesta_db['status'] == 'Error':
-            print(f"    Advertencia: {respuesta_db['mensaje']}.")
+        if perfil_nombre not in etiquetas:
+            print(f"    Advertencia: El perfil '{perfil_nombre}' no fue encontrado en la base de datos.")
             continue
-        
-        props_seccion = respuesta_db['propiedades']
-        Pn_vector_kips = []
+        indices.append(etiquetas.index(perfil_nombre))
+    secciones = {clave: valores[indices] for clave, valores in tabla.items()}
 
-        for L_in in longitudes_vector_in:
-            longitudes_efectivas = {'Lx': L_in, 'Ly': L_in, 'Lz': L_in, **factores_k}
-            
-            # ¡Aquí usamos la función importada!
-            resultado_pn = calcular_resistencia_compresion(
-                propiedades_material, props_seccion, longitudes_efectivas
-            )
-            
-            Pn_vector_kips.append(resultado_pn['valor_calculado_Pn'] if resultado_pn['status'] == 'Exitoso' else 0)
+    # Una sola llamada evalúa todos los perfiles × todas las longitudes.
+    longitudes_efectivas = {'Lx': longitudes_vector_in, 'Ly': longitudes_vector_in, 'Lz': longitudes_vector_in, **factores_k}
+    resultado_pn = calcular_resistencia_compresion_vectorizada(propiedades_material, secciones, longitudes_efectivas)
+    if resultado_pn['status'] == 'Error':
+        print(f"    Advertencia: {resultado_pn['mensaje']}")
+        return
 
+    for perfil_nombre, Pn_vector_kips in zip(secciones['AISC_Manual_Label'], resultado_pn['valor_calculado_Pn']):
+        print(f"  - Procesando perfil: {perfil_nombre}")
         ax.plot(longitudes_vector_ft, Pn_vector_kips, label=perfil_nombre, linewidth=2.5)
 
     # --- 4. Formato y Visualización ---
@@ -73,11 +76,12 @@ def main():
 
 if __name__ == "__main__":
     main()
-Resumen de las Ventajas
-Organización: Cada archivo tiene una única responsabilidad. aisc_database.py maneja datos, compression_analysis.py realiza cálculos de compresión.
-
-Reutilización: Si mañana necesitamos escribir otro script que calcule la resistencia a compresión de un solo perfil, simplemente importaremos calcular_resistencia_compresion sin tener que copiar el código.
-
-Mantenimiento: Si encontramos un error o queremos mejorar la función de cálculo de compresión, solo tenemos que editar compression_analysis.py. Todos los scripts que la usen se beneficiarán automáticamente del cambio.
 
-Escalabilidad: A medida que traduzcamos más funciones (flexión, cortante, etc.), simplemente crearemos más archivos (flexure_analysis.py, shear_analysis.py) y los importaremos cuando los necesitemos.
\ No newline at end of file
+# Resumen de las Ventajas
+# Organización: Cada archivo tiene una única responsabilidad. aisc_database.py maneja datos, compression_analysis.py realiza cálculos de compresión.
+#
+# Reutilización: Si mañana necesitamos escribir otro script que calcule la resistencia a compresión de un solo perfil, simplemente importaremos calcular_resistencia_compresion sin tener que copiar el código.
+#
+# Mantenimiento: Si encontramos un error o queremos mejorar la función de cálculo de compresión, solo tenemos que editar compression_analysis.py. Todos los scripts que la usen se beneficiarán automáticamente del cambio.
+#
+# Escalabilidad: A medida que traduzcamos más funciones (flexión, cortante, etc.), simplemente crearemos más archivos (flexure_analysis.py, shear_analysis.py) y los importaremos cuando los necesitemos.
\ No newline at end of file
@@ -6,7 +6,7 @@ Created on Wed Aug 20 12:20:18 2025
 """
 
 import pandas as pd
-from typing import Dict, Any
+from typing import Dict, Any, Iterable, Optional
 
 class DatabaseAISC:
     """
@@ -87,6 +87,63 @@ class DatabaseAISC:
             
         return resultado
 
+    def obtener_arreglos_perfiles(
+        self,
+        tipos: Optional[Iterable[str]] = None,
+        columnas: Optional[Iterable[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Devuelve las propiedades de muchos perfiles como arreglos de NumPy,
+        listos para los cálculos vectorizados.
+
+        Las celdas sin valor ('–' en el archivo de la AISC) se convierten en NaN.
+        Solo se usan las columnas en unidades imperiales.
+
+        Args:
+            tipos (iterable, opcional): Tipos de perfil a incluir (ej. ['W', 'HP']).
+                                        Si es None se incluyen todos.
+            columnas (iterable, opcional): Propiedades a extraer (ej. ['Zx', 'Sx']).
+                                           Si es None se extraen todas.
+
+        Returns:
+            dict: Un diccionario con el estado, un mensaje y, en 'propiedades', un
+                  arreglo por columna más 'AISC_Manual_Label' y 'Type'.
+        """
+        resultado = {
+            "propiedades": None,
+            "status": "Error",
+            "mensaje": "",
+            "datos_entrada": {"tipos": tipos, "columnas": columnas}
+        }
+
+        try:
+            db = self.db
+            if tipos is not None:
+                db = db.loc[db['Type'].isin(list(tipos))]
+
+            # Las columnas con sufijo '.1' son la versión métrica de la tabla.
+            if columnas is None:
+                no_numericas = ('Type', 'EDI_Std_Nomenclature', 'AISC_Manual_Label', 'T_F')
+                columnas = [c for c in db.columns if c not in no_numericas and not str(c).endswith('.1')]
+
+            propiedades = {
+                "AISC_Manual_Label": db['AISC_Manual_Label'].to_numpy(dtype=str),
+                "Type": db['Type'].to_numpy(dtype=str)
+            }
+            for columna in columnas:
+                propiedades[columna] = pd.to_numeric(db[columna], errors='coerce').to_numpy(dtype=float)
+
+            resultado["propiedades"] = propiedades
+            resultado["status"] = "Exitoso"
+            resultado["mensaje"] = f"Se obtuvieron {len(db)} perfiles."
+
+        except KeyError as e:
+            resultado["mensaje"] = f"Error: La columna {e} no se encontró en el archivo Excel."
+        except Exception as e:
+            resultado["mensaje"] = f"Error inesperado durante la extracción: {e}"
+
+        return resultado
+
 # --- EJEMPLO DE USO ---
 if __name__ == "__main__":
     try:
@@ -0,0 +1,325 @@
+# -*- coding: utf-8 -*-
+"""
+Motor de revisión por lotes de miembros de acero.
+
+Lee los miembros desde una lista (o cualquier iterable) o desde un archivo
+CSV / JSON Lines, los agrupa en bloques y, en un grupo de procesos, calcula
+para cada bloque la resistencia a compresión (Cap. E), a flexión (Cap. F) y la
+interacción H1-1 con los cálculos vectorizados. Los resultados se escriben
+bloque por bloque en CSV, Parquet o Excel, de modo que la memoria no crece con
+el tamaño del proyecto y lo ya revisado queda en disco si la corrida se interrumpe.
+
+Cada miembro es un diccionario con el formato de 'generar_reporte_diseno':
+    {"id": "C-01", "perfil": "W14X90", "longitud_ft": 15,
+     "cargas": {'Pr': 400, 'Mrx': 3000, 'Mry': 0}}   # kips y kip-in
+"""
+
+# batch_design.py
+import csv
+import json
+import os
+from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from aisc_database import DatabaseAISC
+from combined_effects_analysis import (ECUACIONES_INTERACCION,
+                                       verificar_interaccion_flexo_compresion_vectorizada)
+from compression_analysis import calcular_resistencia_compresion_vectorizada
+from flexure_analysis import calcular_resistencia_flexion_vectorizada
+
+# Perfiles que cubren los cálculos vectorizados de compresión y flexión.
+TIPOS_PERFIL_LOTE = ('W', 'M', 'S', 'HP', 'C', 'MC')
+COLUMNAS_PERFIL_LOTE = ('A', 'rx', 'ry', 'ro', 'H', 'J', 'Cw', 'Ix', 'Iy', 'Zx', 'Sx', 'Zy',
+                        'rts', 'ho', 'bf', 'tf', 'd', 'tw')
+
+# Columnas del reporte, en el orden en que se escriben.
+COLUMNAS_REPORTE = ("ID", "Perfil", "Estado", "Ratio D/C", "Ecuacion", "φcPn (kips)", "Pr (kips)",
+                    "φbMnx (kip-ft)", "Mrx (kip-ft)", "φbMny (kip-ft)", "Mry (kip-ft)")
+
+# ==============================================================================
+# LECTURA DE MIEMBROS
+# ==============================================================================
+
+def leer_miembros(origen: Union[str, Iterable[Dict[str, Any]]]) -> Iterator[Dict[str, Any]]:
+    """
+    Devuelve los miembros uno a uno, sin cargar el archivo completo en memoria.
+
+    Args:
+        origen: Iterable de diccionarios de miembro, o la ruta de un archivo
+            '.csv' (columnas id, perfil, longitud_ft, Pr, Mrx, Mry) o
+            '.jsonl' (un diccionario de miembro por línea).
+    """
+    if not isinstance(origen, (str, os.PathLike)):
+        yield from origen
+        return
+
+    extension = os.path.splitext(origen)[1].lower()
+    with open(origen, newline='', encoding='utf-8') as archivo:
+        if extension == '.csv':
+            for fila in csv.DictReader(archivo):
+                yield {
+                    "id": fila['id'], "perfil": fila['perfil'], "longitud_ft": float(fila['longitud_ft']),
+                    "cargas": {c: float(fila.get(c) or 0) for c in ('Pr', 'Mrx', 'Mry')}
+                }
+        elif extension in ('.jsonl', '.ndjson'):
+            for linea in archivo:
+                if linea.strip():
+                    yield json.loads(linea)
+        else:
+            raise ValueError(f"Formato de archivo de miembros no soportado: '{extension}'")
+
+def _en_bloques(miembros: Iterable[Dict[str, Any]], tam_bloque: int) -> Iterator[List[Dict[str, Any]]]:
+    """Agrupa los miembros en listas de hasta 'tam_bloque' elementos."""
+    iterador = iter(miembros)
+    while True:
+        bloque = list(islice(iterador, tam_bloque))
+        if not bloque:
+            return
+        yield bloque
+
+# ==============================================================================
+# ESCRITURA INCREMENTAL DE RESULTADOS
+# ==============================================================================
+
+class _EscritorResultados(ABC):
+    """Escritor por bloques; cada bloque es un diccionario de columnas de igual longitud."""
+
+    def __init__(self, ruta: str):
+        self.ruta = ruta
+
+    @abstractmethod
+    def escribir(self, bloque: Dict[str, Any]) -> None:
+        """Agrega las filas de un bloque al archivo de salida."""
+
+    @abstractmethod
+    def cerrar(self) -> None:
+        """Termina de escribir el archivo y libera sus recursos."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    @staticmethod
+    def _filas(bloque: Dict[str, Any]) -> Iterator[tuple]:
+        return zip(*(bloque[c] for c in COLUMNAS_REPORTE))
+
+class _EscritorCSV(_EscritorResultados):
+    def __init__(self, ruta: str):
+        super().__init__(ruta)
+        self._archivo = open(ruta, 'w', newline='', encoding='utf-8')
+        self._csv = csv.writer(self._archivo)
+        self._csv.writerow(COLUMNAS_REPORTE)
+
+    def escribir(self, bloque):
+        self._csv.writerows(self._filas(bloque))
+        self._archivo.flush()
+
+    def cerrar(self):
+        self._archivo.close()
+
+class _EscritorParquet(_EscritorResultados):
+    def __init__(self, ruta: str):
+        super().__init__(ruta)
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as e:
+            raise ImportError("Para escribir Parquet se requiere 'pyarrow' (pip install pyarrow)") from e
+        self._pa, self._pq = pa, pq
+        self._escritor = None
+
+    def escribir(self, bloque):
+        tabla = self._pa.Table.from_pydict({c: bloque[c] for c in COLUMNAS_REPORTE})
+        if self._escritor is None:
+            self._escritor = self._pq.ParquetWriter(self.ruta, tabla.schema)
+        self._escritor.write_table(tabla.cast(self._escritor.schema))
+
+    def cerrar(self):
+        if self._escritor is not None:
+            self._escritor.close()
+
+class _EscritorExcel(_EscritorResultados):
+    def __init__(self, ruta: str):
+        super().__init__(ruta)
+        from openpyxl import Workbook
+        # En modo 'write_only' openpyxl vuelca las filas a disco en lugar de guardarlas en memoria.
+        self._libro = Workbook(write_only=True)
+        self._hoja = self._libro.create_sheet('Resumen de Diseño')
+        self._hoja.append(COLUMNAS_REPORTE)
+
+    def escribir(self, bloque):
+        for fila in self._filas(bloque):
+            self._hoja.append(fila)
+
+    def cerrar(self):
+        self._libro.save(self.ruta)
+
+def crear_escritor(ruta: str) -> _EscritorResultados:
+    """Elige el escritor según la extensión: '.csv', '.parquet' o '.xlsx'."""
+    extension = os.path.splitext(ruta)[1].lower()
+    escritores = {'.csv': _EscritorCSV, '.parquet': _EscritorParquet, '.xlsx': _EscritorExcel}
+    if extension not in escritores:
+        raise ValueError(f"Formato de salida no soportado: '{extension}'. Use .csv, .parquet o .xlsx")
+    return escritores[extension](ruta)
+
+# ==============================================================================
+# CÁLCULO DE UN BLOQUE (se ejecuta en los procesos trabajadores)
+# ==============================================================================
+
+# Estado de cada proceso trabajador, cargado una sola vez por '_inicializar_trabajador'.
+_trabajador: Dict[str, Any] = {}
+
+def _inicializar_trabajador(tabla_perfiles: Dict[str, np.ndarray], material: Dict[str, float],
+                            phi_c: float, phi_b: float) -> None:
+    """Guarda la tabla numérica de perfiles y un índice por etiqueta en el proceso."""
+    _trabajador.clear()
+    _trabajador.update({
+        "tabla": tabla_perfiles,
+        "indice": {etiqueta: i for i, etiqueta in enumerate(tabla_perfiles['AISC_Manual_Label'])},
+        "material": material, "phi_c": phi_c, "phi_b": phi_b,
+    })
+
+def _evaluar_bloque(miembros: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Revisa un bloque de miembros y devuelve los resultados como columnas."""
+    tabla, material = _trabajador["tabla"], _trabajador["material"]
+    phi_c, phi_b = _trabajador["phi_c"], _trabajador["phi_b"]
+
+    indices = np.array([_trabajador["indice"].get(m['perfil'], -1) for m in miembros], dtype=np.intp)
+    valido = indices >= 0
+    n = len(miembros)
+
+    cargas = np.array([[m['cargas'].get('Pr', 0), m['cargas'].get('Mrx', 0), m['cargas'].get('Mry', 0)]
+                       for m in miembros], dtype=float).reshape(n, 3)
+    L = np.array([m['longitud_ft'] for m in miembros], dtype=float) * 12  # in
+
+    Pc, Mcx, Mcy = np.full(n, np.nan), np.full(n, np.nan), np.full(n, np.nan)
+    if valido.any():
+        secciones = {k: v[indices[valido]] for k, v in tabla.items()}
+        Lv = L[valido]
+        longitudes = {'Lx': Lv, 'Ly': Lv, 'Lz': Lv, 'Kx': 1.0, 'Ky': 1.0, 'Kz': 1.0}
+        Pc[valido] = phi_c * calcular_resistencia_compresion_vectorizada(
+            material, secciones, longitudes, por_miembro=True)['valor_calculado_Pn']
+        Mcx[valido] = phi_b * calcular_resistencia_flexion_vectorizada(
+            material, secciones, Lv, 1.0, por_miembro=True)['valor_calculado_Mn']
+        Mcy[valido] = phi_b * material['Fy'] * secciones['Zy']
+
+    # Interacción H1-1 (una combinación por miembro)
+    interaccion = verificar_interaccion_flexo_compresion_vectorizada(
+        cargas[:, None, :], np.column_stack([Pc, Mcx, Mcy]))
+    if interaccion['status'] == 'Error':
+        raise ValueError(interaccion['mensaje'])
+    ratio = interaccion['ratio_demanda_capacidad']
+    ecuacion = np.array(ECUACIONES_INTERACCION)[interaccion['ecuacion_gobierna']]
+
+    estado = np.where(valido, np.where(ratio <= 1.0, "Pasa", "No Pasa"), "Error en Perfil")
+    # Listas de Python: la conversión se hace aquí, en el trabajador, y no en el proceso que escribe.
+    return {
+        "ID": [m['id'] for m in miembros],
+        "Perfil": [m['perfil'] for m in miembros],
+        "Estado": estado.tolist(),
+        "Ratio D/C": ratio.tolist(),
+        "Ecuacion": np.where(valido, ecuacion, "").tolist(),
+        "φcPn (kips)": Pc.tolist(),
+        "Pr (kips)": cargas[:, 0].tolist(),
+        "φbMnx (kip-ft)": (Mcx / 12).tolist(),
+        "Mrx (kip-ft)": (cargas[:, 1] / 12).tolist(),
+        "φbMny (kip-ft)": (Mcy / 12).tolist(),
+        "Mry (kip-ft)": (cargas[:, 2] / 12).tolist(),
+    }
+
+# ==============================================================================
+# ORQUESTADOR
+# ==============================================================================
+
+def cargar_tabla_perfiles(ruta_db: str = "aisc-shapes-database-v15.0.xlsx") -> Dict[str, np.ndarray]:
+    """Lee la base de datos AISC una sola vez y devuelve las columnas que usa el motor por lotes."""
+    respuesta = DatabaseAISC(ruta_db).obtener_arreglos_perfiles(tipos=TIPOS_PERFIL_LOTE,
+                                                                columnas=COLUMNAS_PERFIL_LOTE)
+    if respuesta['status'] == 'Error':
+        raise ValueError(respuesta['mensaje'])
+    return respuesta['propiedades']
+
+def procesar_lote(
+    origen: Union[str, Iterable[Dict[str, Any]]],
+    ruta_salida: str,
+    material: Dict[str, float],
+    phi_c: float = 0.90,
+    phi_b: float = 0.90,
+    tam_bloque: int = 2000,
+    num_procesos: Optional[int] = None,
+    tabla_perfiles: Optional[Dict[str, np.ndarray]] = None,
+    ruta_db: str = "aisc-shapes-database-v15.0.xlsx"
+) -> Dict[str, Any]:
+    """
+    Revisa por compresión, flexión e interacción H1-1 todos los miembros de
+    'origen' y escribe los resultados en 'ruta_salida' a medida que se calculan.
+
+    Args:
+        origen: Miembros (iterable) o ruta de un archivo '.csv' / '.jsonl'.
+        ruta_salida (str): Archivo de resultados ('.csv', '.parquet' o '.xlsx').
+        material (dict): 'Fy', 'E' y opcionalmente 'G' (ksi).
+        phi_c, phi_b (float): Factores de resistencia LRFD.
+        tam_bloque (int): Miembros por tarea enviada a los procesos.
+        num_procesos (int, opcional): Procesos trabajadores; por omisión os.cpu_count().
+            Con 1 el cálculo se hace en el proceso actual.
+        tabla_perfiles (dict, opcional): Salida de 'cargar_tabla_perfiles', si ya se leyó.
+        ruta_db (str): Ruta de la base de datos AISC si no se da 'tabla_perfiles'.
+
+    Returns:
+        dict: Resumen con el estado, el mensaje y los conteos de la corrida.
+    """
+    resultado = {
+        "status": "Error", "mensaje": "", "ruta_salida": ruta_salida,
+        "miembros": 0, "no_pasan": 0, "errores_perfil": 0, "ratio_max": None
+    }
+
+    try:
+        if tabla_perfiles is None:
+            tabla_perfiles = cargar_tabla_perfiles(ruta_db)
+        num_procesos = num_procesos or os.cpu_count() or 1
+        bloques = _en_bloques(leer_miembros(origen), tam_bloque)
+        ratio_max = -np.inf
+
+        with crear_escritor(ruta_salida) as escritor:
+            def registrar(bloque_resultados):
+                nonlocal ratio_max
+                escritor.escribir(bloque_resultados)
+                estados = bloque_resultados["Estado"]
+                resultado["miembros"] += len(estados)
+                resultado["no_pasan"] += estados.count("No Pasa")
+                resultado["errores_perfil"] += estados.count("Error en Perfil")
+                ratios = np.asarray(bloque_resultados["Ratio D/C"], dtype=float)
+                if np.isfinite(ratios).any():
+                    ratio_max = max(ratio_max, float(np.nanmax(ratios)))
+
+            if num_procesos == 1:
+                _inicializar_trabajador(tabla_perfiles, material, phi_c, phi_b)
+                for bloque in bloques:
+                    registrar(_evaluar_bloque(bloque))
+            else:
+                with ProcessPoolExecutor(max_workers=num_procesos, initializer=_inicializar_trabajador,
+                                         initargs=(tabla_perfiles, material, phi_c, phi_b)) as pool:
+                    # Pocas tareas en vuelo: la memoria queda acotada y el orden de salida se conserva.
+                    en_vuelo = deque()
+                    for bloque in bloques:
+                        en_vuelo.append(pool.submit(_evaluar_bloque, bloque))
+                        if len(en_vuelo) >= 2 * num_procesos:
+                            registrar(en_vuelo.popleft().result())
+                    while en_vuelo:
+                        registrar(en_vuelo.popleft().result())
+
+        resultado["ratio_max"] = ratio_max if np.isfinite(ratio_max) else None
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = f"Se revisaron {resultado['miembros']} miembros; resultados en '{ruta_salida}'."
+
+    except (FileNotFoundError, KeyError, ValueError, ImportError) as e:
+        resultado["mensaje"] = f"Error en la revisión por lotes: {e}."
+
+    return resultado
@@ -9,6 +9,9 @@ Created on Wed Aug 20 12:58:38 2025
 import numpy as np
 from typing import Dict, Any
 
+from fiber_section_analysis import (discretizar_perfil_i, _superficie_pm_plastica,
+                                    construir_superficie_teselada, ratio_superficie_plastica)
+
 def verificar_interaccion_flexo_compresion(
     required_strengths: Dict[str, float],
     available_strengths: Dict[str, float]
@@ -55,6 +58,135 @@ def verificar_interaccion_flexo_compresion(
     return resultado
 
 
+# Códigos de la ecuación usada en 'ecuacion_gobierna'.
+ECUACIONES_INTERACCION = ("H1-1a", "H1-1b")
+
+def verificar_interaccion_flexo_compresion_vectorizada(
+    demandas: Any,
+    capacidades: Any
+) -> Dict[str, Any]:
+    """
+    Verifica muchos miembros con muchas combinaciones de carga a la vez con las
+    ecuaciones de interacción H1-1a/H1-1b del AISC 360-22, sin bucles de Python.
+
+    Las dos ecuaciones se escriben como una sola con coeficientes elegidos por
+    máscara: ratio = a·Pr/Pc + b·(Mrx/Mcx + Mry/Mcy), con (a, b) = (1, 8/9) si
+    Pr/Pc ≥ 0.2 y (1/2, 1) en caso contrario. Igual que la versión escalar, un
+    término de flexión con Mc = 0 no contribuye.
+
+    Args:
+        demandas (array_like): (Pr, Mrx, Mry) con forma (miembros, combinaciones, 3).
+            Las combinaciones con NaN se ignoran, lo que permite rellenar miembros
+            con menos combinaciones.
+        capacidades (array_like): (Pc, Mcx, Mcy) con forma (miembros, 3).
+
+    Returns:
+        dict: Con arreglos de forma (miembros,): 'ratio_demanda_capacidad' (máximo
+              entre combinaciones), 'combinacion_gobierna' (índice, -1 si no hay
+              combinaciones válidas), 'ecuacion_gobierna' (índices de
+              ECUACIONES_INTERACCION) y 'pasa'; en 'detalles', los ratios de
+              todas las combinaciones con forma (miembros, combinaciones).
+    """
+    resultado = {
+        "status": "Error", "referencia_norma": "AISC 360-22, Eq. H1-1",
+        "mensaje": "", "ratio_demanda_capacidad": None, "combinacion_gobierna": None,
+        "ecuacion_gobierna": None, "pasa": None, "detalles": {}
+    }
+    try:
+        demandas = np.asarray(demandas, dtype=float)
+        capacidades = np.asarray(capacidades, dtype=float)
+        if demandas.ndim != 3 or demandas.shape[-1] != 3:
+            raise ValueError(f"Las demandas deben tener forma (miembros, combinaciones, 3), no {demandas.shape}")
+        if capacidades.shape != (demandas.shape[0], 3):
+            raise ValueError(f"Las capacidades deben tener forma ({demandas.shape[0]}, 3), no {capacidades.shape}")
+        if np.any(capacidades[:, 0] == 0):
+            raise ValueError("La resistencia a compresión (Pc) no puede ser cero.")
+
+        Pr, Mr = demandas[..., 0], demandas[..., 1:]
+        Pc, Mc = capacidades[:, None, 0], capacidades[:, None, 1:]
+
+        ratio_axial = Pr / Pc
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio_flexion = np.where(Mc != 0, Mr / Mc, 0.0).sum(axis=-1)
+
+        usa_a = ratio_axial >= 0.2
+        ratios = np.where(usa_a, 1.0, 0.5) * ratio_axial + np.where(usa_a, 8 / 9, 1.0) * ratio_flexion
+
+        # La combinación que gobierna ignora las combinaciones de relleno (NaN).
+        validos = ~np.isnan(ratios)
+        combinacion = np.argmax(np.where(validos, ratios, -np.inf), axis=1)
+        filas = np.arange(ratios.shape[0])
+        hay_validos = validos.any(axis=1)
+        ratio_max = np.where(hay_validos, ratios[filas, combinacion], np.nan)
+
+        resultado["ratio_demanda_capacidad"] = ratio_max
+        resultado["combinacion_gobierna"] = np.where(hay_validos, combinacion, -1)
+        resultado["ecuacion_gobierna"] = np.where(usa_a[filas, combinacion], 0, 1).astype(np.int8)
+        resultado["pasa"] = ratio_max <= 1.0
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = (f"Verificación vectorizada completa para {ratios.shape[0]} miembros "
+                                f"y {ratios.shape[1]} combinaciones.")
+        resultado["detalles"] = {"ratios": ratios, "ecuaciones": ECUACIONES_INTERACCION}
+
+    except (KeyError, ValueError) as e:
+        resultado["mensaje"] = f"Error en los datos de entrada: {e}."
+    return resultado
+
+
+def verificar_interaccion_superficie_plastica(
+    demandas: Any,
+    seccion_props: Dict[str, Any],
+    material_props: Dict[str, float],
+    phi: float = 0.90
+) -> Dict[str, Any]:
+    """
+    Verifica muchos puntos de demanda (P, Mx, My) contra la superficie de
+    interacción plástica exacta de la sección, como complemento de las
+    ecuaciones bilineales H1-1 (ver 'verificar_interaccion_flexo_compresion').
+
+    La superficie se tesela una vez por perfil y grado y queda en caché; cada
+    punto se revisa con la intersección de su rayo desde el origen con la malla
+    (ver 'fiber_section_analysis.ratio_superficie_plastica'). La malla queda por
+    dentro de la superficie, así que el ratio es conservador. No incluye
+    esbeltez ni pandeo: es una revisión de resistencia de la sección.
+
+    Args:
+        demandas (array_like): Forma (..., 3) con Pr (compresión positiva, kips),
+            Mrx y Mry (kip-in).
+        seccion_props (dict): 'd', 'bf', 'tf', 'tw' (in) y, para la caché, 'AISC_Manual_Label'.
+        material_props (dict): 'Fy' y 'E' (ksi).
+        phi (float): Factor de resistencia aplicado a toda la superficie.
+
+    Returns:
+        dict: 'ratio_demanda_capacidad' y 'pasa' con la forma de las demandas sin
+              el último eje; en 'detalles', Py, Mpx y Mpy de la superficie.
+    """
+    resultado = {
+        "status": "Error", "referencia_norma": "Superficie plástica P-Mx-My por fibras",
+        "mensaje": "", "ratio_demanda_capacidad": None, "pasa": None, "detalles": {}
+    }
+    try:
+        demandas = np.asarray(demandas, dtype=float)
+        if demandas.shape[-1] != 3:
+            raise ValueError(f"Las demandas deben tener forma (..., 3), no {demandas.shape}")
+        if phi <= 0:
+            raise ValueError("El factor de resistencia (phi) debe ser positivo.")
+
+        superficie = construir_superficie_teselada(material_props, seccion_props)
+        ratios = ratio_superficie_plastica(superficie, demandas).reshape(demandas.shape[:-1]) / phi
+
+        Py, Mpx, Mpy = superficie["escalas"]
+        resultado["ratio_demanda_capacidad"] = ratios
+        resultado["pasa"] = ratios <= 1.0
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = f"Verificación contra la superficie plástica completa para {ratios.size} puntos."
+        resultado["detalles"] = {"Py_kips": Py, "Mpx_kip_in": Mpx, "Mpy_kip_in": Mpy, "phi": phi}
+
+    except (KeyError, ValueError) as e:
+        resultado["mensaje"] = f"Error en los datos de entrada: {e}."
+    return resultado
+
+
 def generar_diagrama_interaccion_pm(
     seccion_props: Dict[str, float],
     material_props: Dict[str, float]
@@ -62,49 +194,30 @@ def generar_diagrama_interaccion_pm(
     """
     Calcula la curva del diagrama de interacción Plástico P-M para el eje fuerte de un perfil W.
     Lógica mejorada y consolidada a partir de los scripts de diagrama_interaccion.m.
+
+    La forma de la curva se obtiene por fibras (ver 'fiber_section_analysis'): para
+    cada nivel de P se busca el eje neutro plástico que cumple el equilibrio axial,
+    en lugar de usar fórmulas cerradas aproximadas cuando el eje cae en el patín.
+    Las fibras no incluyen los filetes, así que la curva se escala para que sus
+    extremos coincidan con Py = Ag·Fy y Mp = Zx·Fy del catálogo.
     """
     resultado = {"status": "Error", "mensaje": "", "datos_diagrama": None}
     try:
         Fy = material_props['Fy']
-        d, bf, tf, tw = seccion_props['d'], seccion_props['bf'], seccion_props['tf'], seccion_props['tw']
         Ag, Zx = seccion_props['Ag'], seccion_props['Zx']
-        
-        h_alma = d - 2 * tf
-        area_alma = h_alma * tw
-        area_patin = bf * tf
-        
-        # Capacidades máximas
-        Py = Ag * Fy
-        Mp = Zx * Fy
-        P_alma = area_alma * Fy # Carga axial que puede tomar el alma
-        
-        # Vector de cargas axiales para el cálculo
-        cargas_p = np.linspace(0, Py, 100)
-        momentos_m = []
-
-        for P in cargas_p:
-            if P <= P_alma:
-                # Eje neutro plástico en el alma
-                a = P / (2 * tw * Fy) # Distancia desde el centroide del alma
-                Mn = Mp - (P**2) / (4 * tw * Fy)
-            else:
-                # Eje neutro plástico en los patines
-                P_patines = P - P_alma
-                a = P_patines / (2 * bf * Fy) # Distancia desde el borde interior del patín
-                Mn = (Fy / 2) * (area_alma * (h_alma/2) + area_patin * (h_alma + tf - a)) * 2 - P * (h_alma/2 + a/2)
-                # Esta es una aproximación, la fórmula exacta es más compleja.
-                # Una simplificación común:
-                Mn_reducido_patin = (bf * Fy) * (tf - a) * (d - tf - a)
-                momentos_m.append(Mn_reducido_patin)
-                continue # Saltar el append de abajo
-
-            momentos_m.append(Mn)
+        fibras = discretizar_perfil_i(seccion_props)
+
+        # Vector de cargas axiales para el cálculo, de 0 a Py
+        curva = _superficie_pm_plastica(fibras, Fy, np.array([np.pi / 2]), np.linspace(0.0, 1.0, 100))
+        cargas_p = curva["P"][0] * (Ag / fibras['A'].sum())
+        momentos_m = np.abs(curva["Mx"][0])
+        momentos_m = momentos_m * (Zx * Fy / momentos_m[0])
 
         resultado["status"] = "Exitoso"
         resultado["mensaje"] = "Diagrama de interacción P-M calculado."
         resultado["datos_diagrama"] = {
-            "cargas_axiales_P": cargas_p.tolist(), "momentos_M": momentos_m
+            "cargas_axiales_P": cargas_p.tolist(), "momentos_M": momentos_m.tolist()
         }
     except KeyError as e:
         resultado["mensaje"] = f"Error en propiedades de entrada: {e}."
-    return resultado
\ No newline at end of file
+    return resultado
@@ -6,8 +6,46 @@ Created on Wed Aug 20 12:23:50 2025
 """
 
 import math
+import numpy as np
 from typing import Dict, Any
 
+from section_constants import obtener_constantes
+
+def _constantes_compresion(
+    material_props: Dict[str, float],
+    seccion_props: Dict[str, float],
+    G: float
+) -> Dict[str, Any]:
+    """
+    Calcula los términos de Fex, Fey y Fez que no dependen de la longitud
+    (Fe = coef / Lc² y Fez = coef_alabeo / Lcz² + GJ/(Ag·r0²)) y el factor H.
+    Acepta los nombres de la función escalar ('tipo', 'Ag', 'r0_sq', 'x0') o los
+    de la base de datos AISC ('Type', 'A', 'ro', 'H').
+    """
+    E = material_props['E']
+    tipo = seccion_props['tipo'] if 'tipo' in seccion_props else seccion_props['Type']
+    Ag = seccion_props['Ag'] if 'Ag' in seccion_props else seccion_props['A']
+    rx, ry = seccion_props['rx'], seccion_props['ry']
+    J, Cw = seccion_props['J'], seccion_props['Cw']
+    x0 = seccion_props.get('x0', 0) # Para secciones doblemente simétricas, x0 = 0
+    # r0_sq = x0^2 + y0^2 + (Ix+Iy)/Ag; la base de datos deja 'ro' y 'H' vacíos ('–') en perfiles doblemente simétricos
+    ro, H_db = _a_flotantes(seccion_props.get('ro', np.nan)), _a_flotantes(seccion_props.get('H', np.nan))
+    if 'r0_sq' in seccion_props:
+        r0_sq = seccion_props['r0_sq']
+    elif np.isfinite(ro):
+        r0_sq = float(ro)**2
+    else:
+        r0_sq = x0**2 + (seccion_props['Ix'] + seccion_props['Iy']) / Ag
+    H = float(H_db) if 'x0' not in seccion_props and np.isfinite(H_db) else 1 - (x0**2 / r0_sq) # Eq. E4-10
+
+    return {
+        "tipo": tipo, "Ag": Ag, "H": H,
+        "coef_Fe_x": math.pi**2 * E * rx**2,
+        "coef_Fe_y": math.pi**2 * E * ry**2,
+        "coef_Fe_z_alabeo": math.pi**2 * E * Cw / (Ag * r0_sq),
+        "Fe_z_st_venant": G * J / (Ag * r0_sq),
+    }
+
 def calcular_resistencia_compresion(
     material_props: Dict[str, float],
     seccion_props: Dict[str, float],
@@ -64,48 +102,41 @@ def calcular_resistencia_compresion(
         E = material_props['E']
         G = material_props.get('G', E / (2 * (1 + 0.3))) # Calcular G si no se proporciona
 
-        tipo = seccion_props['tipo']
-        Ag = seccion_props['Ag']
-        rx = seccion_props['rx']
-        ry = seccion_props['ry']
-        r0 = math.sqrt(seccion_props['r0_sq']) # r0_sq = x0^2 + y0^2 + (Ix+Iy)/Ag
-        J = seccion_props['J']
-        Cw = seccion_props['Cw']
-        Ix = seccion_props['Ix']
-        Iy = seccion_props['Iy']
-        x0 = seccion_props.get('x0', 0) # Para secciones doblemente simétricas, x0 = 0
-        H = 1 - (x0**2 / seccion_props['r0_sq']) # Eq. E4-10
+        # Términos independientes de la longitud (desde la caché de constantes)
+        k = obtener_constantes(('compresion', G), material_props, seccion_props,
+                               lambda: _constantes_compresion(material_props, seccion_props, G))
+        tipo, Ag, H = k['tipo'], k['Ag'], k['H']
         
         Kx, Ky, Kz = longitudes_efectivas['Kx'], longitudes_efectivas['Ky'], longitudes_efectivas['Kz']
         Lx, Ly, Lz = longitudes_efectivas['Lx'], longitudes_efectivas['Ly'], longitudes_efectivas['Lz']
 
         # --- 1. Pandeo por Flexión (Sección E3) ---
         # Eje X
-        slenderness_x = (Kx * Lx) / rx if rx > 0 else 0
-        Fe_x = (math.pi**2 * E) / slenderness_x**2 if slenderness_x > 0 else float('inf')
+        Lcx = Kx * Lx
+        Fe_x = k['coef_Fe_x'] / Lcx**2 if Lcx > 0 and k['coef_Fe_x'] > 0 else float('inf')
         
         # Eje Y
-        slenderness_y = (Ky * Ly) / ry if ry > 0 else 0
-        Fe_y = (math.pi**2 * E) / slenderness_y**2 if slenderness_y > 0 else float('inf')
+        Lcy = Ky * Ly
+        Fe_y = k['coef_Fe_y'] / Lcy**2 if Lcy > 0 and k['coef_Fe_y'] > 0 else float('inf')
 
         # --- 2. Pandeo Torsional y Flexo-Torsional (Sección E4) ---
         Lcz = Kz * Lz
         # Esfuerzo de pandeo elástico torsional
-        Fe_z = (((math.pi**2 * E * Cw) / Lcz**2) + (G * J)) * (1 / (Ag * r0**2)) if Lcz > 0 else float('inf')
+        Fe_z = k['coef_Fe_z_alabeo'] / Lcz**2 + k['Fe_z_st_venant'] if Lcz > 0 else float('inf')
         
         # Determinar el esfuerzo de pandeo elástico Fe que controla
         # Para perfiles W (doblemente simétricos), se compara Fex, Fey y Fez
         if tipo in ["W", "M", "S", "HP"]:
             Fe = min(Fe_x, Fe_y, Fe_z)
-        # Para perfiles C (simetría simple)
+        # Para perfiles C (simetría simple, x es el eje de simetría)
         elif tipo in ["C", "MC"]:
-            # Ecuación de pandeo por flexo-torsión (AISC E4-4)
-            Fe = ((Fe_y + Fe_z) / (2 * H)) * (1 - math.sqrt(1 - (4 * Fe_y * Fe_z * H) / (Fe_y + Fe_z)**2))
-            Fe = min(Fe_x, Fe) # El pandeo en X sigue siendo un estado límite independiente
-        # Para perfiles WT (simetría simple)
-        elif tipo in ["WT", "MT", "ST"]:
+            # Ecuación de pandeo por flexo-torsión (AISC E4-4, con Fex en lugar de Fey)
             Fe = ((Fe_x + Fe_z) / (2 * H)) * (1 - math.sqrt(1 - (4 * Fe_x * Fe_z * H) / (Fe_x + Fe_z)**2))
-            Fe = min(Fe_y, Fe)
+            Fe = min(Fe_y, Fe) # El pandeo en Y sigue siendo un estado límite independiente
+        # Para perfiles WT (simetría simple, y es el eje de simetría)
+        elif tipo in ["WT", "MT", "ST"]:
+            Fe = ((Fe_y + Fe_z) / (2 * H)) * (1 - math.sqrt(1 - (4 * Fe_y * Fe_z * H) / (Fe_y + Fe_z)**2))
+            Fe = min(Fe_x, Fe)
         else:
             # Para otros perfiles, considerar solo pandeo por flexión como simplificación
             Fe = min(Fe_x, Fe_y)
@@ -145,6 +176,163 @@ def calcular_resistencia_compresion(
     return resultado
 
 
+# Códigos del modo de pandeo que gobierna en 'modo_gobierna'.
+MODOS_PANDEO_COMPRESION = (
+    "Flexión eje x", "Flexión eje y", "Torsional", "Flexo-torsional"
+)
+
+def _a_flotantes(valor):
+    """Convierte a arreglo de flotantes; las celdas vacías de la AISC ('–') pasan a NaN."""
+    try:
+        return np.asarray(valor, dtype=float)
+    except (TypeError, ValueError):
+        def a_flotante(v):
+            try:
+                return float(v)
+            except (TypeError, ValueError):
+                return np.nan
+        return np.array([a_flotante(v) for v in np.ravel(valor)]).reshape(np.shape(valor))
+
+def _propiedad_compresion(secciones, *nombres, default=None):
+    """Devuelve la primera propiedad disponible entre varios nombres equivalentes."""
+    for nombre in nombres:
+        if nombre in secciones:
+            return _a_flotantes(secciones[nombre])
+    if default is not None:
+        return default
+    raise KeyError(nombres[0])
+
+def calcular_resistencia_compresion_vectorizada(
+    material_props: Dict[str, float],
+    secciones: Dict[str, Any],
+    longitudes_efectivas: Dict[str, Any],
+    por_miembro: bool = False
+) -> Dict[str, Any]:
+    """
+    Calcula Pn para muchos perfiles y muchas longitudes efectivas en una sola
+    pasada (AISC 360-22, Secciones E3 y E4), sin bucles de Python.
+
+    Evalúa Fex, Fey y Fez, las ramas de pandeo flexo-torsional para perfiles de
+    simetría simple (C/MC con x como eje de simetría, WT/MT/ST con y como eje de
+    simetría) y Fcr según E3-2/E3-3. No incluye la reducción por elementos
+    esbeltos (E7), igual que 'calcular_resistencia_compresion'.
+
+    Args:
+        material_props (dict): 'Fy', 'E' y opcionalmente 'G'.
+        secciones (dict): Arreglos de forma (n,). Acepta los nombres de la función
+            escalar ('tipo', 'Ag', 'r0_sq', 'x0') o los de la base de datos AISC
+            ('Type', 'A', 'ro', 'H'), más 'rx', 'ry', 'Ix', 'Iy', 'J' y 'Cw'.
+        longitudes_efectivas (dict): 'Lx', 'Ly', 'Lz' y 'Kx', 'Ky', 'Kz'; cada valor
+            puede ser un escalar o un arreglo, y deben ser compatibles entre sí.
+        por_miembro (bool): Si es True, el primer eje de las longitudes corresponde
+            a los perfiles (una longitud por miembro, forma (n, ...)) en lugar de
+            difundirse contra todos ellos.
+
+    Returns:
+        dict: Resultados con arreglos de forma (n,) + forma(longitudes):
+              'valor_calculado_Pn', 'Fcr' y 'modo_gobierna' (índices de
+              MODOS_PANDEO_COMPRESION).
+    """
+    resultado = {
+        "valor_calculado_Pn": None, "Fcr": None, "modo_gobierna": None,
+        "status": "Error", "referencia_norma": "AISC 360-22, Cap. E",
+        "mensaje": "", "detalles": {}
+    }
+
+    try:
+        Fy = material_props['Fy']
+        E = material_props['E']
+        G = material_props.get('G', E / (2 * (1 + 0.3)))
+
+        Lcx = np.asarray(longitudes_efectivas['Kx'], dtype=float) * np.asarray(longitudes_efectivas['Lx'], dtype=float)
+        Lcy = np.asarray(longitudes_efectivas['Ky'], dtype=float) * np.asarray(longitudes_efectivas['Ly'], dtype=float)
+        Lcz = np.asarray(longitudes_efectivas['Kz'], dtype=float) * np.asarray(longitudes_efectivas['Lz'], dtype=float)
+        Lcx, Lcy, Lcz = np.broadcast_arrays(Lcx, Lcy, Lcz)
+
+        # Propiedades como columnas (n, 1, ..., 1) para que difundan contra las longitudes.
+        forma_seccion = (-1,) + (1,) * (Lcx.ndim - 1 if por_miembro else Lcx.ndim)
+        tipo = np.asarray(secciones.get('tipo', secciones.get('Type', 'W'))).reshape(forma_seccion)
+        Ag = _propiedad_compresion(secciones, 'Ag', 'A').reshape(forma_seccion)
+        rx = _propiedad_compresion(secciones, 'rx').reshape(forma_seccion)
+        ry = _propiedad_compresion(secciones, 'ry').reshape(forma_seccion)
+        J = _propiedad_compresion(secciones, 'J').reshape(forma_seccion)
+        Cw = np.nan_to_num(_propiedad_compresion(secciones, 'Cw').reshape(forma_seccion))
+        Ix = _propiedad_compresion(secciones, 'Ix').reshape(forma_seccion)
+        Iy = _propiedad_compresion(secciones, 'Iy').reshape(forma_seccion)
+
+        # r0^2 (E4-9) y H (E4-10); en perfiles doblemente simétricos r0^2 = (Ix+Iy)/Ag y H = 1.
+        r0_sq_simetrico = (Ix + Iy) / Ag
+        if 'r0_sq' in secciones:
+            r0_sq = _a_flotantes(secciones['r0_sq']).reshape(forma_seccion)
+        else:
+            ro = _propiedad_compresion(secciones, 'ro', default=np.full(Ag.shape, np.nan)).reshape(forma_seccion)
+            r0_sq = np.where(np.isnan(ro), r0_sq_simetrico, ro**2)
+        if 'x0' in secciones:
+            x0 = _a_flotantes(secciones['x0']).reshape(forma_seccion)
+            H = 1 - x0**2 / r0_sq
+        else:
+            H = _propiedad_compresion(secciones, 'H', default=np.full(Ag.shape, np.nan)).reshape(forma_seccion)
+            H = np.where(np.isnan(H), 1.0, H)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            # --- 1. Pandeo por Flexión (Sección E3) ---
+            Fe_x = np.where(Lcx > 0, np.pi**2 * E / (Lcx / rx)**2, np.inf)
+            Fe_y = np.where(Lcy > 0, np.pi**2 * E / (Lcy / ry)**2, np.inf)
+
+            # --- 2. Pandeo Torsional y Flexo-Torsional (Sección E4) ---
+            Fe_z = np.where(Lcz > 0, (np.pi**2 * E * Cw / Lcz**2 + G * J) / (Ag * r0_sq), np.inf)
+
+            def flexo_torsional(Fe_sim):
+                suma = Fe_sim + Fe_z
+                return (suma / (2 * H)) * (1 - np.sqrt(1 - 4 * Fe_sim * Fe_z * H / suma**2))
+
+            Fe_ft_canal = flexo_torsional(Fe_x)   # C/MC: x es el eje de simetría
+            Fe_ft_te = flexo_torsional(Fe_y)      # WT/MT/ST: y es el eje de simetría
+
+        doble_simetria = np.isin(tipo, ["W", "M", "S", "HP"])
+        canal = np.isin(tipo, ["C", "MC"])
+        te = np.isin(tipo, ["WT", "MT", "ST"])
+
+        # Candidatos por modo (orden de MODOS_PANDEO_COMPRESION); inf = modo no aplicable.
+        # En simetría simple la flexión sobre el eje de simetría queda acoplada con la torsión.
+        forma = np.broadcast_shapes(Ag.shape, Lcx.shape)
+        candidatos = np.stack([
+            np.broadcast_to(np.where(canal, np.inf, Fe_x), forma),
+            np.broadcast_to(np.where(te, np.inf, Fe_y), forma),
+            np.broadcast_to(np.where(doble_simetria, Fe_z, np.inf), forma),
+            np.broadcast_to(np.where(canal, Fe_ft_canal, np.where(te, Fe_ft_te, np.inf)), forma),
+        ])
+
+        modo = np.argmin(candidatos, axis=0).astype(np.int8)
+        Fe = np.take_along_axis(candidatos, modo[None].astype(np.intp), axis=0)[0]
+
+        # --- 3. Esfuerzo Crítico y Resistencia Nominal (Sección E3) ---
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio_esbeltez = Fy / Fe
+            Fcr = np.where(ratio_esbeltez <= 2.25, Fy * 0.658**ratio_esbeltez, 0.877 * Fe)
+        Pn = Fcr * Ag
+
+        resultado["valor_calculado_Pn"] = Pn
+        resultado["Fcr"] = Fcr
+        resultado["modo_gobierna"] = modo
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = f"Cálculo de compresión vectorizado completado para {forma[0]} perfiles."
+        if not np.all(doble_simetria | canal | te):
+            resultado["mensaje"] += " Advertencia: para otros tipos de perfil solo se consideró pandeo por flexión."
+        resultado["detalles"] = {
+            "Esfuerzo_pandeo_elastico_Fe_ksi": Fe,
+            "Pandeo_inelastico_E3_2": ratio_esbeltez <= 2.25,
+            "modos_pandeo": MODOS_PANDEO_COMPRESION
+        }
+
+    except KeyError as e:
+        resultado["mensaje"] = f"Error: Falta la propiedad requerida en los datos de entrada: {e}."
+    except Exception as e:
+        resultado["mensaje"] = f"Error inesperado durante el cálculo: {e}."
+
+    return resultado
+
+
 # --- EJEMPLO DE USO ---
 # Simula la forma en que llamarías a esta función después de obtener
 # las propiedades con la clase DatabaseAISC.
@@ -7,7 +7,10 @@ Created on Wed Aug 20 15:29:52 2025
 
 # connection_analysis.py
 import math
-from typing import Dict, Any
+import numpy as np
+from typing import Dict, Any, Optional
+
+from section_constants import CacheLRU
 
 # ==============================================================================
 # FUNCIÓN 1: RESISTENCIA DE TORNILLOS (Ya completada)
@@ -129,7 +132,9 @@ def verificar_bloque_cortante(
     (AISC 360-22, Capítulo J4.3).
 
     Args:
-        geometry (dict): Áreas de la trayectoria de falla ('Agt', 'Anv', 'Ant').
+        geometry (dict): Áreas de la trayectoria de falla ('Agv', 'Anv', 'Ant').
+            Para obtenerlas de la disposición de tornillos, ver
+            'generar_trayectorias_bloque_cortante'.
         material_props (dict): Propiedades del material ('Fy', 'Fu').
         required_strength (float): Carga requerida (kips).
 
@@ -138,16 +143,16 @@ def verificar_bloque_cortante(
     """
     resultado = {"status": "Error", "mensaje": "", "capacidad_Rn": None}
     try:
-        Agt, Anv, Ant = geometry['Agt'], geometry['Anv'], geometry['Ant']
+        Agv, Anv, Ant = geometry['Agv'], geometry['Anv'], geometry['Ant']
         Fy, Fu = material_props['Fy'], material_props['Fu']
         
-        Ubs = 1.0 # Para la mayoría de las conexiones de cortante
+        Ubs = geometry.get('Ubs', 1.0) # 1.0 para la mayoría de las conexiones de cortante
         
         # Ecuación J4-5
         termino_cortante = 0.6 * Fu * Anv
         termino_tension = Ubs * Fu * Ant
         
-        Rn = min(termino_cortante + termino_tension, 0.6 * Fy * Agt + termino_tension)
+        Rn = min(termino_cortante + termino_tension, 0.6 * Fy * Agv + termino_tension)
         
         pasa = (0.75 * Rn) >= required_strength # Usando factor phi de 0.75
         
@@ -187,10 +192,16 @@ def analizar_conexion_cortante(
         Anv = (Lp - num_tornillos * d_h) * tp
         Rn_ruptura_cortante = 0.6 * Fu_p * Anv
         
-        # 3. Bloque de Cortante (¡llamando a nuestra nueva función!)
-        # Se necesitarían más datos geométricos (Agt, Ant) para un cálculo real
-        # geometry_bs = {'Agt': ..., 'Anv': ..., 'Ant': ...}
-        # resultado_bs = verificar_bloque_cortante(geometry_bs, ...)
+        # 3. Bloque de Cortante: trayectorias generadas a partir de la disposición
+        # de tornillos (una línea vertical) si se conocen el paso y las distancias al borde.
+        resultado_bs = None
+        if all(k in bolt_group_props for k in ('s', 'Lev', 'Leh')):
+            resultado_bs = verificar_bloque_cortante_lote({
+                'n_lineas': 1, 'n_tornillos': num_tornillos, 's': bolt_group_props['s'], 'g': 0.0,
+                'd_b': bolt_group_props['d_b'], 'tipo_agujero': bolt_group_props.get('tipo_agujero', 'STD'),
+                'Le_carga': bolt_group_props['Lev'], 'Le_lateral_1': bolt_group_props['Leh'],
+                't': tp, 'Fy': Fy_p, 'Fu': Fu_p, 'Ru': Vu
+            })
         
         # 4. Soldadura (¡llamando a nuestra nueva función!)
         res_soldadura = calcular_resistencia_soldadura_filete(weld_props, {'Fy': Fy_p, 'Fu': Fu_p})
@@ -203,9 +214,687 @@ def analizar_conexion_cortante(
         resultado["verificaciones"] = {
             "fluencia_cortante_placa_Rn_kips": Rn_fluencia_cortante,
             "ruptura_cortante_placa_Rn_kips": Rn_ruptura_cortante,
-            "soldadura_Rn_kips": Rn_soldadura_total
-            # "bloque_cortante": resultado_bs
+            "soldadura_Rn_kips": Rn_soldadura_total,
+            "bloque_cortante_Rn_kips": (float(resultado_bs["capacidad_Rn_kips"][0])
+                                        if resultado_bs and resultado_bs["status"] == "Exitoso" else None)
         }
     except KeyError as e:
         resultado["mensaje"] = f"Falta la propiedad requerida: {e}"
-    return resultado
\ No newline at end of file
+    return resultado
+
+# ==============================================================================
+# FUNCIÓN 6: GRUPO DE TORNILLOS EXCÉNTRICO (CENTRO INSTANTÁNEO DE ROTACIÓN)
+# ==============================================================================
+
+# Curva carga-deformación de un tornillo (AISC Manual, Parte 7; Crawford y Kulak):
+# R = Rult·(1 - e^(-10Δ))^0.55, con Δmax = 0.34 in en el tornillo más alejado del CI.
+DEFORMACION_MAXIMA_TORNILLO_IN = 0.34
+
+# Coeficientes C ya resueltos, con llave (patrón, excentricidad, ángulo).
+cache_coeficientes_icr = CacheLRU(capacidad=1024)
+
+def _fuerzas_tornillos_icr(tornillos: np.ndarray, centros: np.ndarray, direccion: np.ndarray,
+                           punto_carga: np.ndarray) -> np.ndarray:
+    """
+    Residuo de equilibrio de fuerzas para uno o varios centros instantáneos.
+
+    Para cada centro, las deformaciones de todos los tornillos se evalúan a la vez:
+    Δi = Δmax·ci/cmax, Ri = (1 - e^(-10Δi))^0.55 (Rult = 1). P sale del equilibrio
+    de momentos alrededor del CI y el residuo es P·u + ΣRi, que vale cero en la solución.
+
+    Args:
+        tornillos: (n, 2) coordenadas respecto al centroide del grupo.
+        centros: (k, 2) ubicaciones de prueba del CI.
+        direccion: (2,) vector unitario de la carga.
+        punto_carga: (2,) punto de la línea de acción de la carga.
+
+    Returns:
+        (k, 3): residuo (Fx, Fy) y la carga P (= C) de cada centro.
+    """
+    d = tornillos[None, :, :] - centros[:, None, :]             # (k, n, 2)
+    c = np.hypot(d[..., 0], d[..., 1])
+    c_max = c.max(axis=1, keepdims=True)
+    R = (1 - np.exp(-10 * DEFORMACION_MAXIMA_TORNILLO_IN * c / c_max))**0.55
+
+    # Brazo de la carga alrededor del CI (producto cruz con la dirección de la carga).
+    r = punto_carga[None, :] - centros
+    brazo = r[:, 0] * direccion[1] - r[:, 1] * direccion[0]
+    signo = np.sign(brazo)[:, None]
+    P = np.sum(R * c, axis=1) / np.abs(brazo)
+
+    # Cada tornillo reacciona perpendicular a su radio, oponiéndose al giro de la carga.
+    with np.errstate(invalid='ignore', divide='ignore'):
+        Rx = np.where(c > 0, signo * R * d[..., 1] / c, 0.0).sum(axis=1)
+        Ry = np.where(c > 0, -signo * R * d[..., 0] / c, 0.0).sum(axis=1)
+    return np.stack([P * direccion[0] + Rx, P * direccion[1] + Ry, P], axis=-1)
+
+def _carga_excentrica(excentricidad: float, angulo: float) -> tuple:
+    """
+    Dirección unitaria y un punto de la línea de acción de una carga con ángulo θ
+    respecto a la vertical, a una distancia horizontal e del centroide del grupo,
+    junto con el pie de la perpendicular desde el centroide y su distancia.
+    """
+    theta = math.radians(angulo)
+    direccion = np.array([math.sin(theta), -math.cos(theta)])
+    punto_carga = np.array([excentricidad, 0.0])
+    pie = punto_carga - punto_carga.dot(direccion) * direccion
+    return direccion, punto_carga, pie, float(np.hypot(*pie))
+
+# Número de condición a partir del cual el CI se trata como en el infinito (carga concéntrica).
+CONDICION_MAXIMA_JACOBIANO_ICR = 1e10
+
+def _iterar_centro_instantaneo(evaluar: Any, centro: np.ndarray, escala: float, lado: np.ndarray,
+                               tolerancia: float = 1e-8, max_iter: int = 50) -> Optional[Dict[str, Any]]:
+    """
+    Busca el CI con Newton (jacobiano por diferencias finitas) y pasos amortiguados.
+    'evaluar(centros)' recibe (k, 2) centros de prueba y devuelve (k, 3): el
+    residuo de fuerzas (Fx, Fy) y la carga P de cada centro.
+
+    Con el CI muy lejos del grupo todos los elementos se trasladan casi igual y el
+    residuo tiende a cero como 1/r, sin que haya solución. Por eso Newton trabaja
+    sobre el residuo multiplicado por la distancia del CI al centroide, solo acepta
+    pasos que dejan el CI del lado 'lado' (opuesto a la carga) y el paso de las
+    diferencias finitas crece con esa distancia.
+
+    Devuelve None si el jacobiano queda mal condicionado o si el CI se estanca
+    muy lejos del grupo: con excentricidades muy pequeñas el CI se aleja hacia
+    el infinito y la respuesta es la concéntrica.
+    """
+    def residuo_escalado(centros: np.ndarray) -> np.ndarray:
+        evaluacion = evaluar(centros)
+        distancia = np.hypot(centros[:, 0], centros[:, 1])
+        return evaluacion[:, :2] * ((distancia + escala) / escala)[:, None]
+
+    for iteracion in range(1, max_iter + 1):
+        h = 1e-7 * max(escala, float(np.hypot(*centro)))
+        pasos = np.array([[0.0, 0.0], [h, 0.0], [0.0, h]])
+        evaluacion = residuo_escalado(centro[None, :] + pasos)
+        residuo = evaluacion[0]
+        jacobiano = ((evaluacion[1:] - residuo) / h).T
+        if not np.all(np.isfinite(jacobiano)) or np.linalg.cond(jacobiano) > CONDICION_MAXIMA_JACOBIANO_ICR:
+            return None
+        paso = np.linalg.solve(jacobiano, -residuo)
+
+        # Amortiguamiento: se reduce el paso mientras no baje el residuo.
+        norma = np.hypot(*residuo)
+        factor = 1.0
+        while factor > 1e-4:
+            prueba = centro + factor * paso
+            nuevo = residuo_escalado(prueba[None, :])[0]
+            if prueba.dot(lado) > 0 and np.all(np.isfinite(nuevo)) and np.hypot(*nuevo) < norma:
+                break
+            factor /= 2
+        if factor < 1e-4 and np.hypot(*centro) > 1e3 * escala:
+            # Sin paso que baje el residuo con el CI prácticamente en el infinito.
+            return None
+        centro = prueba
+        fuerzas = evaluar(centro[None, :])[0]
+        if np.hypot(*fuerzas[:2]) <= tolerancia * max(fuerzas[2], 1.0):
+            return {"C": float(fuerzas[2]), "centro": (float(centro[0]), float(centro[1])),
+                    "iteraciones": iteracion}
+
+    raise ValueError(f"El centro instantáneo no convergió en {max_iter} iteraciones")
+
+def _resolver_coeficiente_icr(patron: tuple, excentricidad: float, angulo: float) -> Dict[str, Any]:
+    """Resuelve el CI de un grupo de tornillos y devuelve C."""
+    tornillos = np.array(patron, dtype=float)
+    tornillos = tornillos - tornillos.mean(axis=0)
+    n = tornillos.shape[0]
+    direccion, punto_carga, pie, e_perp = _carga_excentrica(excentricidad, angulo)
+
+    escala = max(float(np.abs(tornillos).max()), 1.0)
+    if n > 1 and e_perp > 1e-9 * escala:
+        # Punto de partida: CI del método elástico, r0 = Ip/(n·e), del lado opuesto a la carga.
+        Ip = float(np.sum(tornillos**2))
+        centro = -(Ip / (n * e_perp)) * pie / e_perp
+        solucion = _iterar_centro_instantaneo(
+            lambda centros: _fuerzas_tornillos_icr(tornillos, centros, direccion, punto_carga), centro, escala, -pie)
+        if solucion is not None:
+            return solucion
+
+    # Carga concéntrica (o CI en el infinito): todos los tornillos se deforman igual.
+    return {"C": float(n), "centro": None, "iteraciones": 0}
+
+def calcular_coeficiente_c_icr(
+    tornillos: Any,
+    excentricidad: float,
+    angulo: float = 0.0
+) -> Dict[str, Any]:
+    """
+    Calcula el coeficiente C de un grupo de tornillos con carga excéntrica por el
+    método del centro instantáneo de rotación (AISC Manual, Parte 7), para
+    cualquier disposición de tornillos.
+
+    El resultado se guarda en 'cache_coeficientes_icr' con llave (patrón,
+    excentricidad, ángulo), así que un tipo de conexión que se repite en el
+    proyecto se resuelve una sola vez.
+
+    Args:
+        tornillos (array_like): Coordenadas (x, y) de los tornillos (in), forma (n, 2).
+        excentricidad (float): Distancia horizontal del centroide del grupo a la
+            línea de acción de la carga, ex (in).
+        angulo (float): Ángulo de la carga respecto a la vertical (grados).
+
+    Returns:
+        dict: 'valor_calculado_C' (la resistencia del grupo es C·φrn) y, en
+              'detalles', la ubicación del CI respecto al centroide.
+    """
+    resultado = {
+        "valor_calculado_C": None,
+        "status": "Error",
+        "referencia_norma": "AISC Manual 16a Ed., Parte 7 (método del CI)",
+        "mensaje": "",
+        "detalles": {}
+    }
+
+    try:
+        coordenadas = np.asarray(tornillos, dtype=float)
+        if coordenadas.ndim != 2 or coordenadas.shape[1] != 2 or coordenadas.shape[0] == 0:
+            raise ValueError(f"Los tornillos deben tener forma (n, 2), no {coordenadas.shape}")
+        # La llave no depende del origen ni del orden de los tornillos.
+        relativas = np.round(coordenadas - coordenadas.mean(axis=0), 6) + 0.0
+        patron = tuple(sorted(map(tuple, relativas.tolist())))
+        clave = (patron, round(float(excentricidad), 6), round(float(angulo), 6))
+
+        solucion = cache_coeficientes_icr.obtener(
+            clave, lambda: _resolver_coeficiente_icr(patron, clave[1], clave[2]))
+
+        resultado["valor_calculado_C"] = solucion["C"]
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = f"Coeficiente C calculado para {len(patron)} tornillos."
+        resultado["detalles"] = {
+            "centro_instantaneo_in": solucion["centro"],
+            "iteraciones": solucion["iteraciones"],
+            "num_tornillos": len(patron)
+        }
+
+    except (ValueError, np.linalg.LinAlgError) as e:
+        resultado["mensaje"] = f"Error en los datos de entrada o cálculo: {e}."
+    except Exception as e:
+        resultado["mensaje"] = f"Error inesperado: {e}."
+
+    return resultado
+
+# ==============================================================================
+# FUNCIÓN 7: DISEÑO DE PLACAS BASE POR BÚSQUEDA EN MALLA (VECTORIZADO)
+# ==============================================================================
+
+# Peso volumétrico del acero (lb/in^3) para el criterio de peso mínimo.
+PESO_VOLUMETRICO_ACERO_LB_IN3 = 0.2836
+
+# Criterios de selección en 'disenar_placas_base'.
+CRITERIOS_PLACA_BASE = ("area", "peso")
+
+def disenar_placas_base(
+    columnas: Dict[str, Any],
+    candidatos: Dict[str, Any],
+    criterio: str = "peso",
+    holgura: float = 1.0,
+    tam_bloque: int = 500
+) -> Dict[str, Any]:
+    """
+    Selecciona la placa base más ligera (o de menor área) para muchas columnas
+    con carga axial concéntrica, evaluando toda la malla de candidatos B × N de
+    una vez (AISC 360-22, J8; AISC Design Guide 1, Sec. 4.3).
+
+    Para cada columna y cada (B, N) se calculan con NumPy:
+        φc·Pp = 0.65·0.85·f'c·A1·√(A2/A1), con √(A2/A1) ≤ 2     (J8-2)
+        tp_req = l·√(2·Pu / (0.9·Fy·B·N)),  l = max(m, n, λ·n')
+    y el espesor se redondea al menor espesor de la lista que cumple, de modo
+    que el eje de espesores no multiplica el tamaño de la malla. A diferencia de
+    'analizar_placa_base', se incluye el término λ·n' del Design Guide 1.
+
+    Args:
+        columnas (dict): Arreglos (m,) o escalares con 'd', 'bf' (in), 'Pu' (kips),
+            'fc' (ksi), 'Fy_p' (ksi) y opcionalmente 'A2' (in^2, área de concreto
+            de apoyo; si falta o es NaN se toma A2 = A1).
+        candidatos (dict): Listas 'B', 'N' (in) y 'tp' (in) de tamaños disponibles.
+        criterio (str): 'peso' (B·N·tp mínimo) o 'area' (B·N mínimo).
+        holgura (float): Distancia mínima del borde de la columna al de la placa (in).
+        tam_bloque (int): Columnas evaluadas por bloque, para acotar la memoria.
+
+    Returns:
+        dict: Arreglos (m,) con 'B', 'N', 'tp' (NaN si ningún candidato cumple),
+              'encontrado' y, en 'detalles', φcPp, tp requerido, área y peso.
+    """
+    resultado = {
+        "B": None, "N": None, "tp": None, "encontrado": None,
+        "status": "Error", "referencia_norma": "AISC 360-22, J8; AISC Design Guide 1",
+        "mensaje": "", "detalles": {}
+    }
+
+    try:
+        if criterio not in CRITERIOS_PLACA_BASE:
+            raise ValueError(f"Criterio '{criterio}' no reconocido; use uno de {CRITERIOS_PLACA_BASE}")
+        m = max(np.size(columnas[k]) for k in ('d', 'bf', 'Pu'))
+        def dato(nombre, omision=None):
+            valor = columnas.get(nombre, omision) if omision is not None else columnas[nombre]
+            return np.broadcast_to(np.asarray(valor, dtype=float), (m,))
+        d, bf, Pu, fc, Fy_p = dato('d'), dato('bf'), dato('Pu'), dato('fc'), dato('Fy_p')
+        A2 = dato('A2', np.nan)
+
+        B_lista = np.sort(np.asarray(candidatos['B'], dtype=float))
+        N_lista = np.sort(np.asarray(candidatos['N'], dtype=float))
+        tp_lista = np.sort(np.asarray(candidatos['tp'], dtype=float))
+        B, N = np.meshgrid(B_lista, N_lista, indexing='ij')
+        B, N = B.ravel(), N.ravel()
+        A1 = B * N
+        phi_c, phi_b = 0.65, 0.90
+
+        salida = {k: np.full(m, np.nan) for k in ("B", "N", "tp", "phi_Pp", "tp_req")}
+        for inicio in range(0, m, tam_bloque):
+            fin = min(inicio + tam_bloque, m)
+            col = slice(inicio, fin)
+            # Forma de la malla: (columnas del bloque, candidatos B·N).
+            d_c, bf_c, Pu_c = d[col, None], bf[col, None], Pu[col, None]
+            fc_c, Fy_c = fc[col, None], Fy_p[col, None]
+            A2_c = np.where(np.isnan(A2[col, None]), A1, A2[col, None])
+
+            # --- 1. Aplastamiento del concreto (J8-2) ---
+            confinamiento = np.clip(np.sqrt(np.maximum(A2_c, A1) / A1), 1.0, 2.0)
+            phi_Pp = phi_c * 0.85 * fc_c * A1 * confinamiento
+
+            # --- 2. Espesor requerido por flexión de la placa (DG1) ---
+            m_v = (N - 0.95 * d_c) / 2
+            n_v = (B - 0.80 * bf_c) / 2
+            X = np.minimum(4 * d_c * bf_c / (d_c + bf_c)**2 * Pu_c / phi_Pp, 1.0)
+            lam = np.minimum(2 * np.sqrt(X) / (1 + np.sqrt(1 - X)), 1.0)
+            l = np.maximum(np.maximum(m_v, n_v), lam * np.sqrt(d_c * bf_c) / 4)
+            tp_req = l * np.sqrt(2 * Pu_c / (phi_b * Fy_c * A1))
+
+            # --- 3. Espesor comercial y selección ---
+            i_tp = np.searchsorted(tp_lista, tp_req - 1e-12)
+            cabe = i_tp < tp_lista.size
+            tp = np.where(cabe, tp_lista[np.minimum(i_tp, tp_lista.size - 1)], np.inf)
+            cumple = (cabe & (phi_Pp >= Pu_c)
+                      & (N >= d_c + 2 * holgura) & (B >= bf_c + 2 * holgura))
+            costo = A1 * tp if criterio == "peso" else A1 + 1e-9 * tp  # desempate por espesor
+            costo = np.where(cumple, costo, np.inf)
+            mejor = np.argmin(costo, axis=1)
+            filas = np.arange(fin - inicio)
+            ok = np.isfinite(costo[filas, mejor])
+
+            for clave, valores in (("B", B[mejor]), ("N", N[mejor]), ("tp", tp[filas, mejor]),
+                                   ("phi_Pp", phi_Pp[filas, mejor]), ("tp_req", tp_req[filas, mejor])):
+                salida[clave][col] = np.where(ok, valores, np.nan)
+
+        encontrado = ~np.isnan(salida["B"])
+        area = salida["B"] * salida["N"]
+        resultado.update({"B": salida["B"], "N": salida["N"], "tp": salida["tp"], "encontrado": encontrado})
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = (f"Placas base diseñadas: {int(encontrado.sum())} de {m} columnas "
+                                f"con {B.size} candidatos B × N.")
+        resultado["detalles"] = {
+            "phi_Pp_kips": salida["phi_Pp"], "tp_requerido_in": salida["tp_req"],
+            "area_in2": area, "peso_lb": area * salida["tp"] * PESO_VOLUMETRICO_ACERO_LB_IN3
+        }
+
+    except (KeyError, ValueError) as e:
+        resultado["mensaje"] = f"Error en los datos de entrada: {e}."
+    except Exception as e:
+        resultado["mensaje"] = f"Error inesperado: {e}."
+
+    return resultado
+
+# ==============================================================================
+# FUNCIÓN 8: GRUPO DE SOLDADURAS EXCÉNTRICO (MÉTODO ELÁSTICO Y DEL CI)
+# ==============================================================================
+
+# Métodos de análisis en 'analizar_grupo_soldadura'.
+METODOS_GRUPO_SOLDADURA = ("elastico", "icr")
+
+# Coeficientes del grupo ya resueltos, con llave (geometría, excentricidad, ángulo, método).
+cache_coeficientes_soldadura = CacheLRU(capacidad=1024)
+
+def discretizar_lineas_soldadura(lineas: Any, segmentos_por_linea: int = 20) -> Dict[str, np.ndarray]:
+    """
+    Divide un conjunto de líneas de soldadura [((x1, y1), (x2, y2)), ...] en
+    segmentos iguales y los guarda como arreglos: punto medio (k, 2), longitud
+    (k,) y vector unitario del eje (k, 2), con coordenadas respecto al centroide
+    del grupo.
+    """
+    lineas = np.asarray(lineas, dtype=float)
+    if lineas.ndim != 3 or lineas.shape[1:] != (2, 2):
+        raise ValueError(f"Las líneas deben tener forma (n, 2, 2), no {lineas.shape}")
+    inicio, fin = lineas[:, 0, :], lineas[:, 1, :]
+    largo = np.hypot(*(fin - inicio).T)
+    if np.any(largo <= 0):
+        raise ValueError("Todas las líneas de soldadura deben tener longitud positiva")
+
+    fracciones = (np.arange(segmentos_por_linea) + 0.5) / segmentos_por_linea
+    medios = inicio[:, None, :] + fracciones[None, :, None] * (fin - inicio)[:, None, :]
+    longitudes = np.repeat(largo / segmentos_por_linea, segmentos_por_linea)
+    ejes = np.repeat((fin - inicio) / largo[:, None], segmentos_por_linea, axis=0)
+    medios = medios.reshape(-1, 2)
+    centroide = np.sum(medios * longitudes[:, None], axis=0) / longitudes.sum()
+    return {"medios": medios - centroide, "longitudes": longitudes, "ejes": ejes}
+
+def _resistencia_direccional(coseno: np.ndarray) -> tuple:
+    """
+    Ángulo θ (grados) entre el eje del segmento y su fuerza, y los parámetros de
+    la curva carga-deformación de la soldadura con tamaño unitario (AISC 360-22, J2-5):
+    factor 1 + 0.5·sin^1.5(θ), Δm/w y Δu/w.
+    """
+    theta = np.degrees(np.arccos(np.clip(np.abs(coseno), 0.0, 1.0)))
+    aumento = 1.0 + 0.50 * np.sin(np.radians(theta))**1.5
+    delta_m = 0.209 * (theta + 2)**-0.32
+    delta_u = np.minimum(1.087 * (theta + 6)**-0.65, 0.17)
+    return aumento, delta_m, delta_u
+
+def _curva_soldadura(p: np.ndarray) -> np.ndarray:
+    """f(p) = [p·(1.9 - 0.9·p)]^0.3, con p = Δ/Δm (AISC 360-22, J2-6)."""
+    return np.maximum(p * (1.9 - 0.9 * p), 0.0)**0.3
+
+def _fuerzas_soldadura_icr(segmentos: Dict[str, np.ndarray], centros: np.ndarray,
+                           direccion: np.ndarray, punto_carga: np.ndarray) -> np.ndarray:
+    """
+    Residuo de equilibrio para uno o varios CI, evaluando todos los segmentos a la
+    vez. La deformación es proporcional a la distancia al CI y la limita el segmento
+    con menor Δu/c; cada segmento resiste Li·(1 + 0.5·sin^1.5θ)·f(p) por unidad de
+    resistencia del metal de aporte (0.60·FEXX·0.707·w).
+    """
+    d = segmentos["medios"][None, :, :] - centros[:, None, :]     # (k, s, 2)
+    c = np.hypot(d[..., 0], d[..., 1])
+    # La fuerza de cada segmento es perpendicular a su radio.
+    ejes = segmentos["ejes"][None, :, :]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        coseno = (-d[..., 1] * ejes[..., 0] + d[..., 0] * ejes[..., 1]) / c
+    aumento, delta_m, delta_u = _resistencia_direccional(coseno)
+    razon = np.min(delta_u / c, axis=1, keepdims=True)
+    R = segmentos["longitudes"][None, :] * aumento * _curva_soldadura(razon * c / delta_m)
+
+    r = punto_carga[None, :] - centros
+    brazo = r[:, 0] * direccion[1] - r[:, 1] * direccion[0]
+    signo = np.sign(brazo)[:, None]
+    P = np.sum(R * c, axis=1) / np.abs(brazo)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        Rx = np.where(c > 0, signo * R * d[..., 1] / c, 0.0).sum(axis=1)
+        Ry = np.where(c > 0, -signo * R * d[..., 0] / c, 0.0).sum(axis=1)
+    return np.stack([P * direccion[0] + Rx, P * direccion[1] + Ry, P], axis=-1)
+
+def _resolver_grupo_soldadura(geometria: tuple, segmentos_por_linea: int, excentricidad: float,
+                              angulo: float, metodo: str) -> Dict[str, Any]:
+    """Resuelve la longitud efectiva del grupo con el método indicado."""
+    segmentos = discretizar_lineas_soldadura(geometria, segmentos_por_linea)
+    medios, longitudes = segmentos["medios"], segmentos["longitudes"]
+    direccion, punto_carga, pie, e_perp = _carga_excentrica(excentricidad, angulo)
+    longitud_total = float(longitudes.sum())
+    Ip = float(np.sum(longitudes * np.sum(medios**2, axis=1)) + np.sum(longitudes**3) / 12)
+    escala = max(float(np.abs(medios).max()), 1.0)
+
+    if metodo == "elastico":
+        # Fuerza por unidad de longitud y por unidad de carga en los extremos de cada segmento:
+        # componente directa P/L más la de torsión M·r/Ip, sumadas vectorialmente.
+        momento = punto_carga[0] * direccion[1] - punto_carga[1] * direccion[0]
+        mitades = (longitudes / 2)[:, None] * segmentos["ejes"]
+        puntos = np.concatenate([medios - mitades, medios + mitades])
+        fx = direccion[0] / longitud_total - momento * puntos[:, 1] / Ip
+        fy = direccion[1] / longitud_total + momento * puntos[:, 0] / Ip
+        return {"longitud_efectiva": float(1 / np.max(np.hypot(fx, fy))), "centro": None,
+                "iteraciones": 0}
+
+    if e_perp > 1e-9 * escala:
+        centro = -(Ip / (longitud_total * e_perp)) * pie / e_perp
+        solucion = _iterar_centro_instantaneo(
+            lambda centros: _fuerzas_soldadura_icr(segmentos, centros, direccion, punto_carga), centro, escala, -pie)
+        if solucion is not None:
+            return {"longitud_efectiva": solucion["C"], "centro": solucion["centro"],
+                    "iteraciones": solucion["iteraciones"]}
+
+    # Carga concéntrica (o CI en el infinito): todos los segmentos se desplazan igual
+    # en la dirección de la carga y el segmento con menor Δu limita la deformación.
+    aumento, delta_m, delta_u = _resistencia_direccional(segmentos["ejes"] @ direccion)
+    R = longitudes * aumento * _curva_soldadura(delta_u.min() / delta_m)
+    return {"longitud_efectiva": float(R.sum()), "centro": None, "iteraciones": 0}
+
+def analizar_grupo_soldadura(
+    lineas: Any,
+    excentricidad: float,
+    angulo: float = 0.0,
+    metodo: str = "icr",
+    weld_props: Dict[str, Any] = None,
+    segmentos_por_linea: int = 20
+) -> Dict[str, Any]:
+    """
+    Calcula la resistencia de un grupo de soldaduras de filete con carga excéntrica
+    (ménsulas, asientos) por el método elástico o por el del centro instantáneo
+    (AISC Manual, Parte 8; AISC 360-22, J2.4(b)), con líneas de soldadura arbitrarias.
+
+    El grupo se resume en una 'longitud efectiva' Le, independiente del tamaño y
+    del electrodo, tal que Rn = 0.60·FEXX·0.707·w·Le. Con el método del CI incluye
+    el aumento direccional 1 + 0.5·sin^1.5θ y la compatibilidad de deformaciones;
+    el elástico no. Le se guarda en 'cache_coeficientes_soldadura' con llave
+    (geometría, excentricidad, ángulo, método).
+
+    Args:
+        lineas (array_like): Líneas [((x1, y1), (x2, y2)), ...] en in.
+        excentricidad (float): Distancia horizontal del centroide del grupo a la
+            línea de acción de la carga (in).
+        angulo (float): Ángulo de la carga respecto a la vertical (grados).
+        metodo (str): 'icr' o 'elastico'.
+        weld_props (dict, opcional): 'Fexx' (ksi) y 'w_size' (in) para devolver Rn.
+        segmentos_por_linea (int): Segmentos en que se divide cada línea.
+
+    Returns:
+        dict: 'longitud_efectiva_in' y, si se dan 'weld_props', Rn y φRn (φ = 0.75).
+    """
+    resultado = {
+        "longitud_efectiva_in": None, "capacidad_Rn_kips": None, "capacidad_phi_Rn_kips": None,
+        "status": "Error", "referencia_norma": "AISC Manual 16a Ed., Parte 8; AISC 360-22, J2.4",
+        "mensaje": "", "detalles": {}
+    }
+
+    try:
+        if metodo not in METODOS_GRUPO_SOLDADURA:
+            raise ValueError(f"Método '{metodo}' no reconocido; use uno de {METODOS_GRUPO_SOLDADURA}")
+        lineas = np.asarray(lineas, dtype=float)
+        if lineas.ndim != 3 or lineas.shape[1:] != (2, 2):
+            raise ValueError(f"Las líneas deben tener forma (n, 2, 2), no {lineas.shape}")
+        # La llave no depende del origen: coordenadas respecto al punto medio del conjunto.
+        geometria = tuple(map(tuple, np.round(lineas - lineas.reshape(-1, 2).mean(axis=0), 6).reshape(-1, 4).tolist()))
+        geometria = tuple(((a, b), (c, d)) for a, b, c, d in geometria)
+        clave = (geometria, segmentos_por_linea, round(float(excentricidad), 6), round(float(angulo), 6), metodo)
+
+        solucion = cache_coeficientes_soldadura.obtener(
+            clave, lambda: _resolver_grupo_soldadura(geometria, segmentos_por_linea, clave[2], clave[3], metodo))
+
+        Le = solucion["longitud_efectiva"]
+        resultado["longitud_efectiva_in"] = Le
+        if weld_props is not None:
+            res_soldadura = calcular_resistencia_soldadura_filete(weld_props, {})
+            if res_soldadura["status"] != "Exitoso":
+                raise ValueError(res_soldadura["mensaje"])
+            resultado["capacidad_Rn_kips"] = res_soldadura["resistencia_por_pulgada"] * Le
+            resultado["capacidad_phi_Rn_kips"] = 0.75 * resultado["capacidad_Rn_kips"]
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = f"Grupo de soldaduras analizado por el método '{metodo}'."
+        resultado["detalles"] = {
+            "centro_instantaneo_in": solucion["centro"],
+            "iteraciones": solucion["iteraciones"],
+            "longitud_total_in": float(np.hypot(*(lineas[:, 1] - lineas[:, 0]).T).sum())
+        }
+
+    except (ValueError, np.linalg.LinAlgError) as e:
+        resultado["mensaje"] = f"Error en los datos de entrada o cálculo: {e}."
+    except Exception as e:
+        resultado["mensaje"] = f"Error inesperado: {e}."
+
+    return resultado
+
+# ==============================================================================
+# FUNCIÓN 9: TRAYECTORIAS DE BLOQUE DE CORTANTE Y VERIFICACIÓN POR LOTES
+# ==============================================================================
+
+# Tipos de agujero de la Tabla J3.3 y orientación de las ranuras respecto a la carga.
+TIPOS_AGUJERO = ("STD", "OVS", "SSL", "LSL")
+ORIENTACIONES_RANURA = ("perpendicular", "paralela")
+
+def _codigos(valores: Any, nombres: tuple, m: int) -> np.ndarray:
+    """Convierte nombres o códigos de 'nombres' en un arreglo de códigos (m,)."""
+    valores = np.asarray(valores)
+    if valores.dtype.kind in 'US':
+        codigos = {nombre: i for i, nombre in enumerate(nombres)}
+        valores = np.array([codigos[v] for v in valores.ravel()]).reshape(valores.shape)
+    return np.broadcast_to(valores.astype(np.intp), (m,))
+
+def dimensiones_agujero(d_b: Any, tipo_agujero: Any) -> tuple:
+    """
+    Dimensiones nominales del agujero (ancho, largo) en in según la Tabla J3.3
+    del AISC 360-22, para escalares o arreglos. En agujeros redondos ambas son iguales.
+    """
+    d_b = np.asarray(d_b, dtype=float)
+    tipo = _codigos(tipo_agujero, TIPOS_AGUJERO, d_b.size).reshape(d_b.shape)
+    estandar = d_b + np.where(d_b < 1.0, 1 / 16, 1 / 8)
+    sobredimensionado = d_b + np.select([d_b <= 0.5, d_b <= 0.875, d_b <= 1.0], [1 / 8, 3 / 16, 1 / 4], 5 / 16)
+    ranura_corta = d_b + np.select([d_b <= 0.5, d_b <= 0.875, d_b <= 1.0], [3 / 16, 1 / 4, 5 / 16], 3 / 8)
+    ranura_larga = 2.5 * d_b
+    ancho = np.where(tipo == 1, sobredimensionado, estandar)
+    largo = np.choose(tipo, [estandar, sobredimensionado, ranura_corta, ranura_larga])
+    return ancho, largo
+
+def generar_trayectorias_bloque_cortante(conexiones: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Genera todas las trayectorias candidatas de bloque de cortante de muchas
+    conexiones a partir de su disposición de tornillos (AISC 360-22, J4.3).
+
+    Los tornillos forman 'n_lineas' líneas paralelas a la carga (separadas 'g'),
+    con 'n_tornillos' tornillos cada una (paso 's'). Las trayectorias son:
+        - En L hacia el borde lateral 1 o 2: un plano de cortante a lo largo de la
+          línea k y un plano de tensión hasta el borde, arrancando las k líneas
+          más cercanas a ese borde.
+        - En U: dos planos de cortante en las líneas i y j y el plano de tensión
+          entre ellas, arrancando las líneas i..j.
+    Una trayectoria que solo arranca parte de las líneas toma la fracción de la
+    carga correspondiente ('fraccion'). El ancho del agujero para el área neta es
+    la dimensión nominal más 1/16 in (B4.3b), en la dirección de cada plano.
+
+    Args:
+        conexiones (dict): Arreglos (m,) o escalares con 'n_lineas', 'n_tornillos',
+            's', 'g', 'd_b', 'Le_carga' (distancia al borde cargado), 't' y
+            opcionalmente 'Le_lateral_1', 'Le_lateral_2' (NaN o ausente si no hay
+            borde de ese lado), 'tipo_agujero' y 'orientacion_ranura'.
+
+    Returns:
+        dict: Arreglos (m, trayectorias) 'Agv', 'Anv', 'Ant', 'fraccion' y 'valida',
+              más 'descripcion' con el nombre de cada trayectoria.
+    """
+    m = max(np.size(v) for v in conexiones.values())
+    def dato(nombre, omision=None):
+        valor = conexiones[nombre] if omision is None else conexiones.get(nombre, omision)
+        return np.broadcast_to(np.asarray(valor, dtype=float), (m,))
+
+    n_lineas = np.broadcast_to(np.asarray(conexiones['n_lineas'], dtype=int), (m,))
+    n_tornillos = dato('n_tornillos')
+    s, g, t, Le_carga = dato('s'), dato('g'), dato('t'), dato('Le_carga')
+    Le_1, Le_2 = dato('Le_lateral_1', np.nan), dato('Le_lateral_2', np.nan)
+    if np.any(n_lineas < 1) or np.any(n_tornillos < 1):
+        raise ValueError("Cada conexión necesita al menos una línea con un tornillo")
+
+    ancho, largo = dimensiones_agujero(dato('d_b'), conexiones.get('tipo_agujero', 'STD'))
+    paralela = _codigos(conexiones.get('orientacion_ranura', 'perpendicular'), ORIENTACIONES_RANURA, m) == 1
+    # Dimensión del agujero a lo largo de los planos de cortante (paralelos a la carga)
+    # y del plano de tensión (perpendicular a ella), más 1/16 in.
+    dh_v = np.where(paralela, largo, ancho) + 1 / 16
+    dh_t = np.where(paralela, ancho, largo) + 1 / 16
+
+    # Plantilla de trayectorias para el mayor número de líneas del proyecto:
+    # (tipo, primera línea, última línea), con líneas contadas desde el borde 1.
+    n_max = int(n_lineas.max())
+    plantilla = ([("L1", 0, k) for k in range(n_max)] + [("L2", k, None) for k in range(n_max)]
+                 + [("U", i, j) for i in range(n_max) for j in range(i + 1, n_max)])
+    tipo = np.array([p[0] for p in plantilla])
+    primera = np.array([p[1] for p in plantilla])[None, :]
+    ultima = np.array([p[2] if p[2] is not None else 0 for p in plantilla])[None, :]
+    es_l1, es_l2, es_u = (tipo == "L1")[None, :], (tipo == "L2")[None, :], (tipo == "U")[None, :]
+
+    n_l = n_lineas[:, None]
+    # Líneas arrancadas y validez de cada trayectoria para cada conexión.
+    lineas_bloque = np.where(es_l1, ultima + 1, np.where(es_l2, primera + 1, ultima - primera + 1))
+    valida = np.where(es_l1, (ultima < n_l) & ~np.isnan(Le_1[:, None]),
+                      np.where(es_l2, (primera < n_l) & ~np.isnan(Le_2[:, None]), ultima < n_l))
+
+    # --- Planos de cortante ---
+    planos = np.where(es_u, 2, 1)
+    longitud_v = (Le_carga + (n_tornillos - 1) * s)[:, None]
+    Agv = planos * longitud_v * t[:, None]
+    Anv = planos * (longitud_v - (n_tornillos[:, None] - 0.5) * dh_v[:, None]) * t[:, None]
+
+    # --- Plano de tensión ---
+    huecos = np.where(es_u, ultima - primera, lineas_bloque - 0.5)
+    longitud_t = np.where(es_l1, Le_1[:, None] + (lineas_bloque - 1) * g[:, None],
+                          np.where(es_l2, Le_2[:, None] + (lineas_bloque - 1) * g[:, None],
+                                   (ultima - primera) * g[:, None]))
+    Ant = (longitud_t - huecos * dh_t[:, None]) * t[:, None]
+
+    descripcion = [f"L hacia borde 1 ({p[2] + 1} líneas)" if p[0] == "L1" else
+                   f"L hacia borde 2 ({p[1] + 1} líneas)" if p[0] == "L2" else
+                   f"U entre líneas {p[1] + 1} y {p[2] + 1}" for p in plantilla]
+    return {"Agv": Agv, "Anv": Anv, "Ant": Ant, "fraccion": lineas_bloque / n_l,
+            "valida": valida, "descripcion": descripcion}
+
+def verificar_bloque_cortante_lote(
+    conexiones: Dict[str, Any],
+    phi: float = 0.75
+) -> Dict[str, Any]:
+    """
+    Verifica el bloque de cortante de todas las conexiones de un proyecto a la vez:
+    genera las trayectorias con 'generar_trayectorias_bloque_cortante', evalúa
+    la Ec. J4-5 en todas como arreglos y devuelve la que gobierna.
+
+        Rn = 0.60·Fu·Anv + Ubs·Fu·Ant ≤ 0.60·Fy·Agv + Ubs·Fu·Ant
+
+    La capacidad de una trayectoria parcial se divide entre la fracción de la
+    carga que le corresponde, para compararla con la carga total Ru.
+
+    Args:
+        conexiones (dict): Los datos de 'generar_trayectorias_bloque_cortante'
+            más 'Fy', 'Fu' (ksi), 'Ru' (kips) y opcionalmente 'Ubs' (1.0 por omisión).
+        phi (float): Factor de resistencia (0.75).
+
+    Returns:
+        dict: Arreglos (m,) con 'capacidad_Rn_kips', 'trayectoria_gobierna' (índice en
+              'detalles.descripcion'), 'ratio_demanda_capacidad' y 'pasa'.
+    """
+    resultado = {
+        "capacidad_Rn_kips": None, "trayectoria_gobierna": None,
+        "ratio_demanda_capacidad": None, "pasa": None,
+        "status": "Error", "referencia_norma": "AISC 360-22, J4.3", "mensaje": "", "detalles": {}
+    }
+
+    try:
+        trayectorias = generar_trayectorias_bloque_cortante(conexiones)
+        m = trayectorias["Agv"].shape[0]
+        def dato(nombre, omision=None):
+            valor = conexiones[nombre] if omision is None else conexiones.get(nombre, omision)
+            return np.broadcast_to(np.asarray(valor, dtype=float), (m,))[:, None]
+        Fy, Fu, Ubs = dato('Fy'), dato('Fu'), dato('Ubs', 1.0)
+        Ru = dato('Ru')[:, 0]
+
+        termino_tension = Ubs * Fu * trayectorias["Ant"]
+        Rn = np.minimum(0.6 * Fu * trayectorias["Anv"] + termino_tension,
+                        0.6 * Fy * trayectorias["Agv"] + termino_tension)
+        Rn_equivalente = np.where(trayectorias["valida"], Rn / trayectorias["fraccion"], np.inf)
+        gobierna = np.argmin(Rn_equivalente, axis=1)
+        filas = np.arange(m)
+        capacidad = Rn_equivalente[filas, gobierna]
+        if np.any(~np.isfinite(capacidad)):
+            raise ValueError("Hay conexiones sin trayectorias válidas (revise las distancias al borde)")
+
+        resultado["capacidad_Rn_kips"] = capacidad
+        resultado["trayectoria_gobierna"] = gobierna
+        resultado["ratio_demanda_capacidad"] = Ru / (phi * capacidad)
+        resultado["pasa"] = resultado["ratio_demanda_capacidad"] <= 1.0
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = (f"Bloque de cortante verificado para {m} conexiones "
+                                f"y {Rn.shape[1]} trayectorias candidatas.")
+        resultado["detalles"] = {"Rn_trayectorias_kips": np.where(trayectorias["valida"], Rn, np.nan),
+                                 "descripcion": trayectorias["descripcion"],
+                                 "Agv_in2": trayectorias["Agv"], "Anv_in2": trayectorias["Anv"],
+                                 "Ant_in2": trayectorias["Ant"]}
+
+    except (KeyError, ValueError) as e:
+        resultado["mensaje"] = f"Error en los datos de entrada: {e}."
+    except Exception as e:
+        resultado["mensaje"] = f"Error inesperado: {e}."
+
+    return resultado
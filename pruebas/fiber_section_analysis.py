@@ -0,0 +1,461 @@
+# -*- coding: utf-8 -*-
+"""
+Análisis de secciones por fibras con carga axial: superficies de interacción
+plásticas P-Mx-My y curvas momento-curvatura bajo carga axial.
+
+En los dos casos hay que encontrar, para muchos niveles de P a la vez, la
+posición del eje neutro que cumple el equilibrio axial. Como la fuerza axial
+crece de forma monótona con esa posición, se usa una bisección vectorizada:
+todas las incógnitas avanzan juntas en cada iteración y las fibras de la
+sección se evalúan con una sola difusión de NumPy.
+"""
+
+# fiber_section_analysis.py
+import numpy as np
+from typing import Dict, Any, Callable
+
+from material_models import MODELOS_CONSTITUTIVOS, MaterialMenegottoPintoCiclico
+from section_constants import obtener_constantes
+
+def discretizar_perfil_i(
+    seccion_props: Dict[str, float],
+    fibras_patin: tuple = (24, 4),
+    fibras_alma: tuple = (2, 40)
+) -> Dict[str, np.ndarray]:
+    """
+    Divide un perfil I en fibras rectangulares con coordenadas respecto al centroide.
+
+    Args:
+        seccion_props (dict): 'd', 'bf', 'tf', 'tw' (in).
+        fibras_patin (tuple): Fibras (a lo ancho, a lo alto) en cada patín.
+        fibras_alma (tuple): Fibras (a lo ancho, a lo alto) en el alma.
+
+    Returns:
+        dict: Arreglos (fibras,) 'x', 'y' (in), 'A' (in^2) y las dimensiones de
+              cada fibra 'bx', 'by' (in).
+    """
+    d, bf, tf, tw = (float(seccion_props[k]) for k in ('d', 'bf', 'tf', 'tw'))
+
+    def rectangulo(ancho, alto, y_centro, nx, ny):
+        x = (np.arange(nx) + 0.5) / nx * ancho - ancho / 2
+        y = (np.arange(ny) + 0.5) / ny * alto - alto / 2 + y_centro
+        X, Y = np.meshgrid(x, y)
+        return (X.ravel(), Y.ravel(), np.full(X.size, ancho * alto / (nx * ny)),
+                np.full(X.size, ancho / nx), np.full(X.size, alto / ny))
+
+    partes = [rectangulo(bf, tf, (d - tf) / 2, *fibras_patin),
+              rectangulo(bf, tf, -(d - tf) / 2, *fibras_patin),
+              rectangulo(tw, d - 2 * tf, 0.0, *fibras_alma)]
+    return {clave: np.concatenate([p[i] for p in partes]) for i, clave in enumerate(('x', 'y', 'A', 'bx', 'by'))}
+
+def biseccion_vectorizada(
+    funcion: Callable[[np.ndarray], np.ndarray],
+    objetivo: np.ndarray,
+    bajo: np.ndarray,
+    alto: np.ndarray,
+    iteraciones: int = 60
+) -> np.ndarray:
+    """
+    Resuelve funcion(c) = objetivo para todos los elementos a la vez, con
+    'funcion' creciente en c y la raíz entre 'bajo' y 'alto'. Cada iteración
+    evalúa 'funcion' una sola vez sobre el arreglo completo.
+    """
+    bajo, alto = np.broadcast_arrays(np.asarray(bajo, dtype=float), np.asarray(alto, dtype=float))
+    bajo, alto = bajo.copy(), alto.copy()
+    for _ in range(iteraciones):
+        medio = 0.5 * (bajo + alto)
+        menor = funcion(medio) < objetivo
+        bajo = np.where(menor, medio, bajo)
+        alto = np.where(menor, alto, medio)
+    return 0.5 * (bajo + alto)
+
+def _superficie_pm_plastica(fibras: Dict[str, np.ndarray], Fy: float,
+                            angulos: np.ndarray, fracciones_P: np.ndarray) -> Dict[str, Any]:
+    """Resuelve el eje neutro plástico para todos los (ángulo, P) a la vez."""
+    x, y, A = fibras['x'], fibras['y'], fibras['A']
+    Py = Fy * A.sum()
+    # Distancia de cada fibra medida en la dirección normal al eje neutro y su
+    # extensión en esa dirección: (ángulos, 1, fibras).
+    coseno, seno = np.cos(angulos)[:, None], np.sin(angulos)[:, None]
+    u = (coseno * x[None, :] + seno * y[None, :])[:, None, :]
+    extension = (np.abs(coseno) * fibras['bx'][None, :] + np.abs(seno) * fibras['by'][None, :])[:, None, :]
+    objetivo = np.broadcast_to(fracciones_P[None, :] * Py, (angulos.size, fracciones_P.size))
+
+    # Compresión (positiva) del lado u < c. La fibra que corta el eje neutro
+    # aporta la fracción de su área que queda comprimida, así que P(c) es
+    # continua y el equilibrio se cumple exactamente.
+    def esfuerzo(c):
+        comprimida = np.clip((c[..., None] - u) / extension + 0.5, 0.0, 1.0)
+        return Fy * (2 * comprimida - 1)
+
+    def fuerza_axial(c):
+        return np.sum(esfuerzo(c) * A, axis=-1)
+
+    limite = (np.abs(u) + extension).max(axis=-1)
+    c = biseccion_vectorizada(fuerza_axial, objetivo, -limite, limite)
+    esfuerzos = esfuerzo(c)
+    # Momentos de las fuerzas de compresión respecto a los ejes centroidales.
+    return {"P": np.sum(esfuerzos * A, axis=-1),
+            "Mx": -np.sum(esfuerzos * A * y, axis=-1),
+            "My": -np.sum(esfuerzos * A * x, axis=-1),
+            "Py": Py}
+
+def calcular_superficie_pm_plastica(
+    material_props: Dict[str, float],
+    seccion_props: Dict[str, Any],
+    num_angulos: int = 36,
+    num_niveles_P: int = 21,
+    fibras_patin: tuple = (24, 4),
+    fibras_alma: tuple = (2, 40)
+) -> Dict[str, Any]:
+    """
+    Calcula la superficie de interacción plástica P-Mx-My de un perfil I por
+    fibras, sin las aproximaciones de forma cerrada: para cada dirección del eje
+    neutro y cada nivel de P se busca la posición del eje que cumple el
+    equilibrio axial con bisección vectorizada sobre todos los (ángulo, P) a la vez.
+
+    El resultado se guarda en la caché de 'section_constants' por (perfil, Fy).
+
+    Args:
+        material_props (dict): 'Fy' y 'E' (ksi).
+        seccion_props (dict): 'd', 'bf', 'tf', 'tw' (in) y, para la caché, 'AISC_Manual_Label'.
+        num_angulos (int): Direcciones del eje neutro en [0, 2π).
+        num_niveles_P (int): Niveles de P entre -Py (tensión) y +Py (compresión).
+
+    Returns:
+        dict: 'P', 'Mx', 'My' (kips, kip-in) de forma (ángulos, niveles_P) y en
+              'detalles' Py y los momentos plásticos de las fibras.
+    """
+    resultado = {
+        "status": "Error", "mensaje": "", "P": None, "Mx": None, "My": None, "detalles": {}
+    }
+
+    try:
+        Fy = float(material_props['Fy'])
+        categoria = ('superficie_pm', num_angulos, num_niveles_P, tuple(fibras_patin), tuple(fibras_alma))
+
+        def calcular():
+            fibras = discretizar_perfil_i(seccion_props, fibras_patin, fibras_alma)
+            angulos = np.linspace(0.0, 2 * np.pi, num_angulos, endpoint=False)
+            superficie = _superficie_pm_plastica(fibras, Fy, angulos, np.linspace(-1.0, 1.0, num_niveles_P))
+            ejes = _superficie_pm_plastica(fibras, Fy, np.array([np.pi / 2, 0.0]), np.array([0.0]))
+            superficie.update({"angulos": angulos, "Mpx": float(abs(ejes["Mx"][0, 0])),
+                               "Mpy": float(abs(ejes["My"][1, 0]))})
+            return superficie
+
+        superficie = obtener_constantes(categoria, material_props, seccion_props, calcular)
+
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = "Superficie de interacción plástica P-Mx-My calculada por fibras."
+        resultado["P"], resultado["Mx"], resultado["My"] = superficie["P"], superficie["Mx"], superficie["My"]
+        resultado["detalles"] = {"Py_kips": superficie["Py"], "Mpx_kip_in": superficie["Mpx"],
+                                 "Mpy_kip_in": superficie["Mpy"], "angulos_eje_neutro": superficie["angulos"]}
+
+    except KeyError as e:
+        resultado["mensaje"] = f"Error en propiedades de entrada: {e}."
+    except Exception as e:
+        resultado["mensaje"] = f"Error inesperado en el análisis: {e}."
+
+    return resultado
+
+def calcular_momento_curvatura_carga_axial(
+    material_props: Dict[str, Any],
+    seccion_props: Dict[str, Any],
+    niveles_P: Any,
+    curvaturas: Any,
+    modelo: str = "elasto_plastico",
+    fibras_patin: tuple = (24, 4),
+    fibras_alma: tuple = (2, 40)
+) -> Dict[str, Any]:
+    """
+    Calcula curvas momento-curvatura de eje fuerte bajo carga axial constante
+    para varios niveles de P a la vez. Para cada (P, φ) se busca la deformación
+    axial ε0 tal que -Σσ(ε0 + φ·y)·A = P, con bisección vectorizada sobre todos
+    los pares, y se integra M = Σσ·A·y. Las fibras usan tensión positiva y P
+    compresión positiva, como '_superficie_pm_plastica'.
+
+    Se guarda en la caché de 'section_constants' por (perfil, Fy) y parámetros.
+
+    Args:
+        material_props (dict): 'E', 'Fy' y los parámetros del modelo.
+        seccion_props (dict): 'd', 'bf', 'tf', 'tw' (in).
+        niveles_P (array_like): Cargas axiales (kips, compresión positiva).
+        curvaturas (array_like): Curvaturas (rad/in).
+        modelo (str): Ley constitutiva de MODELOS_CONSTITUTIVOS.
+
+    Returns:
+        dict: 'momentos' (kip-in) y 'deformacion_axial' (ε0, tensión positiva) de
+              forma (niveles_P, curvaturas).
+    """
+    resultado = {
+        "status": "Error", "mensaje": "", "momentos": None, "deformacion_axial": None, "detalles": {}
+    }
+
+    try:
+        niveles_P = np.atleast_1d(np.asarray(niveles_P, dtype=float))
+        curvaturas = np.atleast_1d(np.asarray(curvaturas, dtype=float))
+        ley = MODELOS_CONSTITUTIVOS[modelo]
+        E, Fy = float(material_props['E']), float(material_props['Fy'])
+        categoria = ('momento_curvatura_P', modelo, tuple(niveles_P.tolist()), tuple(curvaturas.tolist()),
+                     tuple(fibras_patin), tuple(fibras_alma),
+                     tuple(sorted((k, v) for k, v in material_props.items() if np.ndim(v) == 0)))
+
+        def calcular():
+            fibras = discretizar_perfil_i(seccion_props, fibras_patin, fibras_alma)
+            y, A = fibras['y'], fibras['A']
+            if modelo == "elasto_plastico" and np.any(np.abs(niveles_P) >= Fy * A.sum()):
+                raise ValueError("Con el modelo elasto-plástico |P| debe ser menor que Py")
+            phi = curvaturas[None, :, None]                      # (1, curvaturas, 1)
+
+            def fuerza_axial(e0):
+                return np.sum(ley(e0[..., None] + phi * y, material_props) * A, axis=-1)
+
+            # Intervalo: la deformación de la fibra más alejada más un margen de varias εy.
+            limite = np.abs(curvaturas)[None, :] * np.abs(y).max() + 50 * Fy / E
+            objetivo = np.broadcast_to(-niveles_P[:, None], (niveles_P.size, curvaturas.size))
+            e0 = biseccion_vectorizada(fuerza_axial, objetivo, -limite, limite)
+            esfuerzos = ley(e0[..., None] + phi * y, material_props)
+            return {"momentos": np.sum(esfuerzos * A * y, axis=-1), "e0": e0}
+
+        curvas = obtener_constantes(categoria, material_props, seccion_props, calcular)
+
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = (f"Curvas momento-curvatura calculadas para {niveles_P.size} niveles de "
+                                f"carga axial y {curvaturas.size} curvaturas.")
+        resultado["momentos"] = curvas["momentos"]
+        resultado["deformacion_axial"] = curvas["e0"]
+        resultado["detalles"] = {"niveles_P_kips": niveles_P, "curvaturas": curvaturas}
+
+    except (KeyError, ValueError) as e:
+        resultado["mensaje"] = f"Error en los datos de entrada: {e}."
+    except Exception as e:
+        resultado["mensaje"] = f"Error inesperado en el análisis: {e}."
+
+    return resultado
+
+def calcular_momento_curvatura_ciclica(
+    material_props: Dict[str, Any],
+    seccion_props: Dict[str, Any],
+    historia_curvaturas: Any,
+    niveles_P: Any = 0.0,
+    tolerancia: float = 1e-8,
+    max_iter: int = 25,
+    fibras_patin: tuple = (24, 4),
+    fibras_alma: tuple = (2, 40)
+) -> Dict[str, Any]:
+    """
+    Respuesta momento-curvatura de eje fuerte para una historia cíclica de
+    curvaturas bajo carga axial constante, con el modelo de Menegotto-Pinto
+    cíclico (ver 'material_models.MaterialMenegottoPintoCiclico').
+
+    El estado de todas las fibras de todos los niveles de P avanza junto en cada
+    paso. En cada paso se busca ε0 con Newton usando la rigidez axial tangente
+    ΣEt·A, evaluando siempre desde el estado confirmado del paso anterior, y
+    después se confirma el estado y se integra M = Σσ·A·y.
+
+    Args:
+        material_props (dict): 'E', 'Fy' y los parámetros del modelo cíclico.
+        seccion_props (dict): 'd', 'bf', 'tf', 'tw' (in).
+        historia_curvaturas (array_like): Curvaturas de cada paso (rad/in).
+        niveles_P (array_like): Cargas axiales (kips, compresión positiva).
+        tolerancia (float): Tolerancia del equilibrio axial relativa a Py.
+
+    Returns:
+        dict: 'momentos' (kip-in) y 'deformacion_axial' (ε0, tensión positiva) de
+              forma (niveles_P, pasos); en 'detalles', los pasos que no convergieron.
+    """
+    resultado = {
+        "status": "Error", "mensaje": "", "momentos": None, "deformacion_axial": None, "detalles": {}
+    }
+
+    try:
+        historia = np.atleast_1d(np.asarray(historia_curvaturas, dtype=float))
+        niveles_P = np.atleast_1d(np.asarray(niveles_P, dtype=float))
+        fibras = discretizar_perfil_i(seccion_props, fibras_patin, fibras_alma)
+        y, A = fibras['y'], fibras['A']
+        tolerancia_P = tolerancia * float(material_props['Fy']) * A.sum()
+
+        material = MaterialMenegottoPintoCiclico(material_props, (niveles_P.size, y.size))
+        momentos = np.empty((niveles_P.size, historia.size))
+        deformacion_axial = np.empty((niveles_P.size, historia.size))
+        sin_converger = []
+        e0 = np.zeros(niveles_P.size)
+        for paso, phi in enumerate(historia):
+            for _ in range(max_iter):
+                esfuerzos, tangentes = material.intentar(e0[:, None] + phi * y)
+                # Fibras con tensión positiva, P con compresión positiva.
+                residuo = esfuerzos @ A + niveles_P
+                if np.all(np.abs(residuo) <= tolerancia_P):
+                    break
+                e0 = e0 - residuo / (tangentes @ A)
+            else:
+                sin_converger.append(paso)
+            material.confirmar()
+            momentos[:, paso] = esfuerzos @ (A * y)
+            deformacion_axial[:, paso] = e0
+
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = (f"Respuesta cíclica calculada para {historia.size} pasos y "
+                                f"{niveles_P.size} niveles de carga axial.")
+        resultado["momentos"] = momentos
+        resultado["deformacion_axial"] = deformacion_axial
+        resultado["detalles"] = {"niveles_P_kips": niveles_P, "curvaturas": historia,
+                                 "pasos_sin_converger": sin_converger}
+
+    except (KeyError, ValueError) as e:
+        resultado["mensaje"] = f"Error en los datos de entrada: {e}."
+    except Exception as e:
+        resultado["mensaje"] = f"Error inesperado en el análisis: {e}."
+
+    return resultado
+
+# ==============================================================================
+# SUPERFICIE PLÁSTICA TESELADA Y CONSULTA DE D/C POR INTERSECCIÓN DE RAYOS
+# ==============================================================================
+
+def _direcciones_esfera(n: int) -> np.ndarray:
+    """n direcciones unitarias casi uniformes sobre la esfera (espiral de Fibonacci)."""
+    k = np.arange(n) + 0.5
+    polar = np.arccos(1 - 2 * k / n)
+    azimut = np.pi * (1 + 5**0.5) * k
+    return np.stack([np.cos(polar), np.sin(polar) * np.cos(azimut), np.sin(polar) * np.sin(azimut)], axis=-1)
+
+def _triangulo_cubo(direcciones: np.ndarray, n: int) -> np.ndarray:
+    """
+    Triángulo de la malla que corta el rayo de cada dirección, en un mapa de cubo
+    de n × n celdas por cara partidas en dos triángulos. La cara es la de la
+    componente dominante y la posición en ella sale de las otras dos divididas
+    entre esa: como los vértices están sobre las caras del cubo, el triángulo que
+    contiene esa posición es exactamente el del rayo. Sin trigonometría ni polos.
+    """
+    absolutas = np.abs(direcciones)
+    eje = np.argmax(absolutas, axis=1)
+    filas = np.arange(direcciones.shape[0])
+    mayor = np.maximum(absolutas[filas, eje], 1e-30)
+    u = (direcciones[filas, (eje + 1) % 3] / mayor + 1) * (n / 2)
+    v = (direcciones[filas, (eje + 2) % 3] / mayor + 1) * (n / 2)
+    cara = 2 * eje + (direcciones[filas, eje] < 0)
+    i = np.clip(u.astype(np.intp), 0, n - 1)
+    j = np.clip(v.astype(np.intp), 0, n - 1)
+    segundo = (u - i) + (v - j) > 1
+    return ((cara * n + i) * n + j) * 2 + segundo
+
+def _vertices_cubo(n: int) -> np.ndarray:
+    """Direcciones (sin normalizar) de los vértices del mapa de cubo: (6, n+1, n+1, 3)."""
+    u = np.linspace(-1.0, 1.0, n + 1)
+    U, V = np.meshgrid(u, u, indexing='ij')
+    vertices = np.empty((6, n + 1, n + 1, 3))
+    for cara in range(6):
+        eje, signo = divmod(cara, 2)
+        vertices[cara, ..., eje] = -1.0 if signo else 1.0
+        vertices[cara, ..., (eje + 1) % 3] = U
+        vertices[cara, ..., (eje + 2) % 3] = V
+    return vertices
+
+def _calibre_plastico(direcciones: np.ndarray, brazo: np.ndarray, fuerza_fibras: np.ndarray,
+                      num_normales: int = 2000, paso_min: float = 1e-5, max_iter: int = 60) -> np.ndarray:
+    """
+    Función de calibre γ(u) de la superficie plástica (el punto de la superficie
+    sobre el rayo u es u/γ(u)), a partir de su función de soporte exacta por
+    fibras h(n) = Σ Fy·A·|n·brazo|: γ(u) = máx sobre normales n de n·u / h(n).
+
+    El máximo se arranca con la mejor de unas normales de Fibonacci y se afina
+    con una búsqueda por patrones en el plano tangente, para todas las
+    direcciones a la vez; el problema es convexo, así que converge al óptimo.
+    """
+    def soporte(normales):
+        return np.abs(normales @ brazo) @ fuerza_fibras
+
+    normales = _direcciones_esfera(num_normales)
+    normales = normales[np.argmax(direcciones @ (normales / soporte(normales)[:, None]).T, axis=1)]
+    valor = np.einsum('nc,nc->n', normales, direcciones) / soporte(normales)
+    paso = np.full(len(direcciones), 2.0 / np.sqrt(num_normales))
+    for _ in range(max_iter):
+        activas = np.nonzero(paso > paso_min)[0]
+        if activas.size == 0:
+            break
+        n, u, h = normales[activas], direcciones[activas], paso[activas, None]
+        t1 = np.cross(n, np.where(np.abs(n[:, :1]) < 0.9, [[1.0, 0.0, 0.0]], [[0.0, 1.0, 0.0]]))
+        t1 /= np.linalg.norm(t1, axis=1, keepdims=True)
+        t2 = np.cross(n, t1)
+        prueba = np.stack([n + h * t1, n - h * t1, n + h * t2, n - h * t2])
+        prueba /= np.linalg.norm(prueba, axis=2, keepdims=True)
+        valores = np.einsum('knc,nc->kn', prueba, u) / soporte(prueba.reshape(-1, 3)).reshape(4, -1)
+        mejor = np.argmax(valores, axis=0)
+        mejora = valores[mejor, np.arange(activas.size)] > valor[activas]
+        normales[activas[mejora]] = prueba[mejor[mejora], np.nonzero(mejora)[0]]
+        valor[activas[mejora]] = valores[mejor[mejora], np.nonzero(mejora)[0]]
+        paso[activas[~mejora]] *= 0.5
+    return valor
+
+def construir_superficie_teselada(
+    material_props: Dict[str, float],
+    seccion_props: Dict[str, Any],
+    celdas_por_cara: int = 32,
+    fibras_patin: tuple = (24, 4),
+    fibras_alma: tuple = (2, 40)
+) -> Dict[str, Any]:
+    """
+    Tesela la superficie plástica P-Mx-My de un perfil (geometría d, bf, tf, tw de
+    la tabla AISC) y la guarda en un formato compacto para consultas rápidas de D/C.
+
+    Las direcciones se indexan con un mapa de cubo (6 caras de n × n celdas, cada
+    celda en dos triángulos). Los vértices son los puntos exactos de la superficie
+    sobre las direcciones de la malla, calculados con la función de soporte por
+    fibras (ver '_calibre_plastico'). De cada triángulo solo se guarda el plano
+    w·x = 1 que pasa por sus tres vértices (float32, en P/Py, Mx/Mpx, My/Mpy).
+
+    Como la superficie es convexa y los vértices están sobre ella, la malla queda
+    por dentro: el D/C de la malla no es menor que el exacto salvo por la
+    tolerancia de la búsqueda del calibre (del orden de 0.1 %). Con 32 celdas por
+    cara el exceso típico es de 0.1 % y llega a 1.5-2 % cerca de P = ±Py.
+
+    Se guarda en la caché de 'section_constants' por (perfil, Fy).
+
+    Returns:
+        dict: 'planos' (6·n·n·2, 3), 'escalas' (Py, Mpx, Mpy) y 'celdas_por_cara'.
+    """
+    def calcular():
+        Fy = float(material_props['Fy'])
+        fibras = discretizar_perfil_i(seccion_props, fibras_patin, fibras_alma)
+        x, y, A = fibras['x'], fibras['y'], fibras['A']
+        ejes = _superficie_pm_plastica(fibras, Fy, np.array([np.pi / 2, 0.0]), np.array([0.0]))
+        escalas = np.array([Fy * A.sum(), abs(ejes["Mx"][0, 0]), abs(ejes["My"][1, 0])])
+        brazo = np.stack([np.ones_like(y), -y, -x]) / escalas[:, None]
+
+        n = celdas_por_cara
+        direcciones = _vertices_cubo(n)
+        calibre = _calibre_plastico(direcciones.reshape(-1, 3), brazo, Fy * A).reshape(direcciones.shape[:-1])
+        puntos = direcciones / calibre[..., None]
+
+        # Dos triángulos por celda: (00, 10, 01) y (11, 01, 10).
+        p00, p10, p01, p11 = puntos[:, :-1, :-1], puntos[:, 1:, :-1], puntos[:, :-1, 1:], puntos[:, 1:, 1:]
+        triangulos = np.stack([np.stack([p00, p10, p01], axis=-2),
+                               np.stack([p11, p01, p10], axis=-2)], axis=3)      # (6, n, n, 2, 3, 3)
+        planos = np.linalg.solve(triangulos, np.ones(triangulos.shape[:-1] + (1,)))[..., 0]
+
+        return {"planos": planos.reshape(-1, 3).astype(np.float32),
+                "escalas": escalas, "celdas_por_cara": n}
+
+    categoria = ('superficie_teselada', celdas_por_cara, tuple(fibras_patin), tuple(fibras_alma))
+    return obtener_constantes(categoria, material_props, seccion_props, calcular)
+
+def ratio_superficie_plastica(superficie: Dict[str, Any], demandas: Any) -> np.ndarray:
+    """
+    Razón demanda/capacidad de muchos puntos (P, Mx, My) contra una superficie
+    teselada: D/C es la distancia al origen de la demanda entre la del punto donde
+    su rayo corta la malla.
+
+    Cada demanda cuesta una búsqueda de su triángulo en el mapa de cubo y un
+    producto punto con el plano de ese triángulo.
+
+    Args:
+        superficie (dict): Salida de 'construir_superficie_teselada'.
+        demandas (array_like): (n, 3) con P (compresión positiva, kips), Mx y My (kip-in).
+
+    Returns:
+        np.ndarray: D/C de forma (n,); 0 para la demanda nula.
+    """
+    d = (np.asarray(demandas, dtype=float).reshape(-1, 3) / superficie["escalas"]).astype(np.float32)
+    planos = superficie["planos"][_triangulo_cubo(d, superficie["celdas_por_cara"])]
+    return np.einsum('nc,nc->n', planos, d).astype(float)
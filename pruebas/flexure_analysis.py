@@ -7,8 +7,115 @@ Created on Wed Aug 20 12:55:11 2025
 
 # flexure_analysis.py
 import math
+import numpy as np
 from typing import Dict, Any
 
+from section_constants import obtener_constantes
+
+def _constantes_flexion(
+    material_props: Dict[str, float],
+    seccion_props: Dict[str, float],
+    tipo: str,
+    eje: str
+) -> Dict[str, Any]:
+    """
+    Calcula las cantidades de flexión que solo dependen del perfil y del material:
+    Mp, Lp, Lr, límites λp/λr y la resistencia por pandeo local (Ml). Lo único que
+    queda por evaluar en cada llamada es el pandeo lateral-torsional, que depende de Lb y Cb.
+    """
+    Fy, E = material_props['Fy'], material_props['E']
+
+    # ======================================================================
+    # CASO 1: PERFILES I y C (W, M, S, HP, C, MC)
+    # ======================================================================
+    if tipo in ['W', 'M', 'S', 'HP', 'C', 'MC']:
+        if eje == 'mayor':
+            # --- Lógica para Eje Fuerte (AISC F2-F5) ---
+            Zx, Sx, ry = seccion_props['Zx'], seccion_props['Sx'], seccion_props['ry']
+            rts, J, Cw, ho = seccion_props['rts'], seccion_props['J'], seccion_props['Cw'], seccion_props['ho']
+            bf, tf, d, tw = seccion_props['bf'], seccion_props['tf'], seccion_props['d'], seccion_props['tw']
+
+            # Estado Límite de Fluencia
+            Mp = Fy * Zx
+
+            # Estado Límite de Pandeo Lateral-Torsional (LTB)
+            Lp = 1.76 * ry * math.sqrt(E / Fy)
+            c = 1.0
+            if tipo in ['C', 'MC'] and Cw > 0: c = (ho / 2) * math.sqrt(seccion_props.get('Iy', 0) / Cw)
+
+            Fcr_term = (J * c) / (Sx * ho)
+            Lr_sqrt_term = Fcr_term**2 + 6.76 * (0.7 * Fy / E)**2
+            Lr = 1.95 * rts * (E / (0.7 * Fy)) * math.sqrt(Fcr_term + math.sqrt(Lr_sqrt_term))
+
+            # Estado Límite de Pandeo Local
+            lambda_p_f = 0.38 * math.sqrt(E / Fy); lambda_r_f = 1.0 * math.sqrt(E / Fy)
+            lambda_f = bf / (2 * tf)
+            if lambda_f <= lambda_p_f: Ml = Mp
+            elif lambda_p_f < lambda_f <= lambda_r_f: Ml = Mp - (Mp - 0.7 * Fy * Sx) * ((lambda_f - lambda_p_f) / (lambda_r_f - lambda_p_f))
+            else: kc = min(max(4 / math.sqrt((d - 2*tf) / tw), 0.35), 0.76); Fcr_local = (0.9 * E * kc) / lambda_f**2; Ml = Fcr_local * Sx
+
+            return {"Mp": Mp, "Mr": 0.7 * Fy * Sx, "Lp": Lp, "Lr": Lr, "Fcr_term": Fcr_term,
+                    "rts": rts, "Sx": Sx, "lambda_p_f": lambda_p_f, "lambda_r_f": lambda_r_f, "Ml": Ml,
+                    "mensaje": f"Análisis de flexión en eje fuerte para perfil {tipo} completado."}
+
+        elif eje == 'menor':
+            # --- Lógica para Eje Débil (AISC F6) ---
+            Zy, Sy = seccion_props['Zy'], seccion_props['Sy']
+            bf, tf = seccion_props['bf'], seccion_props['tf']
+
+            Mp = min(Fy * Zy, 1.6 * Fy * Sy)
+            lambda_p_f = 0.38 * math.sqrt(E / Fy)
+            lambda_r_f = 1.0 * math.sqrt(E / Fy)
+            lambda_f = bf / (2 * tf)
+
+            if lambda_f <= lambda_p_f: Ml = Mp
+            elif lambda_p_f < lambda_f <= lambda_r_f: Ml = Mp - (Mp - 0.7 * Fy * Sy) * ((lambda_f - lambda_p_f) / (lambda_r_f - lambda_p_f))
+            else: Fcr_local = 0.69 * E / lambda_f**2; Ml = Fcr_local * Sy
+
+            return {"Mp": Mp, "lambda_p_f": lambda_p_f, "lambda_r_f": lambda_r_f, "Ml": Ml,
+                    "Mn": min(Mp, Ml),
+                    "mensaje": f"Análisis de flexión en eje débil para perfil {tipo} completado."}
+
+        return {"Mn": 0, "mensaje": ""}
+
+    # ======================================================================
+    # CASO 2: PERFILES HSS RECTANGULARES ("HSS")
+    # ======================================================================
+    elif tipo == 'HSS' and seccion_props.get('B', 0) > 0:
+        # --- Lógica para HSS Rectangular (AISC F7) ---
+        h, b, t = seccion_props['H'], seccion_props['B'], seccion_props.get('t_des', seccion_props.get('t', 0))
+        Zx, Sx = (seccion_props['Zx'], seccion_props['Sx']) if eje == 'mayor' else (seccion_props['Zy'], seccion_props['Sy'])
+
+        # Estado Límite de Fluencia
+        Mp = Fy * Zx
+
+        # Estado Límite de Pandeo Local
+        lambda_f = (b - 3*t) / t if eje == 'mayor' else (h - 3*t) / t
+        lambda_p_f = 1.12 * math.sqrt(E / Fy)
+        lambda_r_f = 1.40 * math.sqrt(E / Fy)
+
+        if lambda_f <= lambda_p_f: # Compacto
+            Ml = Mp
+        elif lambda_p_f < lambda_f <= lambda_r_f: # No compacto
+            Ml = Mp - (Mp - Fy * Sx) * (3.57 * lambda_f * math.sqrt(Fy/E) - 4.0)
+        else: # Esbelto
+            # Cálculo de sección efectiva es complejo. Usaremos una aproximación.
+            be = 1.92 * t * math.sqrt(E/Fy) * (1 - (0.38 / lambda_f) * math.sqrt(E/Fy))
+            be = min(be, b - 3*t) # o h-3t para el alma
+            # Se requiere un cálculo de Módulo de Sección Efectivo (Seff)
+            # Como simplificación, muchos programas usan Fcr.
+            Fcr_local = 0.9 * E * (t / lambda_f)**2
+            Ml = Fcr_local * Sx
+
+        # Para HSS, LTB no controla si la sección es compacta o no compacta.
+        return {"Mp": Mp, "lambda_p_f": lambda_p_f, "lambda_r_f": lambda_r_f, "Ml": Ml,
+                "Mn": min(Mp, Ml),
+                "mensaje": f"Análisis de flexión para HSS rectangular en eje {eje} completado."}
+
+    # ... (otros casos para barras, etc. que ya habíamos definido) ...
+
+    raise NotImplementedError(f"El análisis de flexión para el tipo '{tipo}' no está soportado en esta versión.")
+
 def calcular_resistencia_flexion(
     material_props: Dict[str, float],
     seccion_props: Dict[str, float],
@@ -20,6 +127,8 @@ def calcular_resistencia_flexion(
 
     Implementa las especificaciones del AISC 360-22, Capítulo F.
     Esta es la versión consolidada y definitiva para el paquete 'acero_analysis'.
+    Las constantes del perfil se toman de la caché de 'section_constants', de modo
+    que en cada llamada solo se evalúa el pandeo lateral-torsional.
 
     Args:
         material_props (dict): Propiedades del material ('Fy', 'E').
@@ -35,105 +144,27 @@ def calcular_resistencia_flexion(
     }
 
     try:
-        Fy, E = material_props['Fy'], material_props['E']
+        E = material_props['E']
         tipo = seccion_props.get('type', 'W')
         Lb = beam_params.get('Lb', 0)
         Cb = beam_params.get('Cb', 1.0)
         eje = beam_params.get('eje', 'mayor')
-        
-        Mn = 0
-
-        # ======================================================================
-        # CASO 1: PERFILES I y C (W, M, S, HP, C, MC)
-        # ======================================================================
-        if tipo in ['W', 'M', 'S', 'HP', 'C', 'MC']:
-            if eje == 'mayor':
-                # --- Lógica para Eje Fuerte (AISC F2-F5) ---
-                Zx, Sx, ry = seccion_props['Zx'], seccion_props['Sx'], seccion_props['ry']
-                rts, J, Cw, ho = seccion_props['rts'], seccion_props['J'], seccion_props['Cw'], seccion_props['ho']
-                bf, tf, d, tw = seccion_props['bf'], seccion_props['tf'], seccion_props['d'], seccion_props['tw']
-                
-                # Estado Límite de Fluencia
-                Mp = Fy * Zx
-                
-                # Estado Límite de Pandeo Lateral-Torsional (LTB)
-                Lp = 1.76 * ry * math.sqrt(E / Fy)
-                c = 1.0
-                if tipo in ['C', 'MC'] and Cw > 0: c = (ho / 2) * math.sqrt(seccion_props.get('Iy', 0) / Cw)
-                
-                Fcr_term = (J * c) / (Sx * ho)
-                Lr_sqrt_term = Fcr_term**2 + 6.76 * (0.7 * Fy / E)**2
-                Lr = 1.95 * rts * (E / (0.7 * Fy)) * math.sqrt(Fcr_term + math.sqrt(Lr_sqrt_term))
-                
-                if Lb <= Lp: Mtb = Mp
-                elif Lp < Lb <= Lr: Mtb = Cb * (Mp - (Mp - 0.7 * Fy * Sx) * ((Lb - Lp) / (Lr - Lp)))
-                else: Fcr_elastic = ((Cb * math.pi**2 * E) / (Lb / rts)**2) * math.sqrt(1 + 0.078 * Fcr_term * (Lb / rts)**2); Mtb = Fcr_elastic * Sx
-                Mtb = min(Mtb, Mp)
-                
-                # Estado Límite de Pandeo Local
-                lambda_p_f = 0.38 * math.sqrt(E / Fy); lambda_r_f = 1.0 * math.sqrt(E / Fy)
-                lambda_f = bf / (2 * tf)
-                if lambda_f <= lambda_p_f: Ml = Mp
-                elif lambda_p_f < lambda_f <= lambda_r_f: Ml = Mp - (Mp - 0.7 * Fy * Sx) * ((lambda_f - lambda_p_f) / (lambda_r_f - lambda_p_f))
-                else: kc = min(max(4 / math.sqrt((d - 2*tf) / tw), 0.35), 0.76); Fcr_local = (0.9 * E * kc) / lambda_f**2; Ml = Fcr_local * Sx
-                
-                Mn = min(Mp, Mtb, Ml)
-                resultado["mensaje"] = f"Análisis de flexión en eje fuerte para perfil {tipo} completado."
-
-            elif eje == 'menor':
-                # --- Lógica para Eje Débil (AISC F6) ---
-                Zy, Sy = seccion_props['Zy'], seccion_props['Sy']
-                bf, tf = seccion_props['bf'], seccion_props['tf']
-                
-                Mp = min(Fy * Zy, 1.6 * Fy * Sy)
-                lambda_p_f = 0.38 * math.sqrt(E / Fy)
-                lambda_r_f = 1.0 * math.sqrt(E / Fy)
-                lambda_f = bf / (2 * tf)
-                
-                if lambda_f <= lambda_p_f: Ml = Mp
-                elif lambda_p_f < lambda_f <= lambda_r_f: Ml = Mp - (Mp - 0.7 * Fy * Sy) * ((lambda_f - lambda_p_f) / (lambda_r_f - lambda_p_f))
-                else: Fcr_local = 0.69 * E / lambda_f**2; Ml = Fcr_local * Sy
-                
-                Mn = min(Mp, Ml)
-                resultado["mensaje"] = f"Análisis de flexión en eje débil para perfil {tipo} completado."
-
-        # ======================================================================
-        # CASO 2: PERFILES HSS RECTANGULARES ("HSS")
-        # ======================================================================
-        elif tipo == 'HSS' and seccion_props.get('B', 0) > 0:
-            # --- Lógica para HSS Rectangular (AISC F7) ---
-            h, b, t = seccion_props['H'], seccion_props['B'], seccion_props.get('t_des', seccion_props.get('t', 0))
-            Zx, Sx = (seccion_props['Zx'], seccion_props['Sx']) if eje == 'mayor' else (seccion_props['Zy'], seccion_props['Sy'])
 
-            # Estado Límite de Fluencia
-            Mp = Fy * Zx
-            
-            # Estado Límite de Pandeo Local
-            lambda_f = (b - 3*t) / t if eje == 'mayor' else (h - 3*t) / t
-            lambda_p_f = 1.12 * math.sqrt(E / Fy)
-            lambda_r_f = 1.40 * math.sqrt(E / Fy)
-            
-            if lambda_f <= lambda_p_f: # Compacto
-                Ml = Mp
-            elif lambda_p_f < lambda_f <= lambda_r_f: # No compacto
-                Ml = Mp - (Mp - Fy * Sx) * (3.57 * lambda_f * math.sqrt(Fy/E) - 4.0)
-            else: # Esbelto
-                # Cálculo de sección efectiva es complejo. Usaremos una aproximación.
-                be = 1.92 * t * math.sqrt(E/Fy) * (1 - (0.38 / lambda_f) * math.sqrt(E/Fy))
-                be = min(be, b - 3*t) # o h-3t para el alma
-                # Se requiere un cálculo de Módulo de Sección Efectivo (Seff)
-                # Como simplificación, muchos programas usan Fcr.
-                Fcr_local = 0.9 * E * (t / lambda_f)**2
-                Ml = Fcr_local * Sx
-
-            # Para HSS, LTB no controla si la sección es compacta o no compacta.
-            Mn = min(Mp, Ml)
-            resultado["mensaje"] = f"Análisis de flexión para HSS rectangular en eje {eje} completado."
-        
-        # ... (otros casos para barras, etc. que ya habíamos definido) ...
+        k = obtener_constantes(('flexion', tipo, eje), material_props, seccion_props,
+                               lambda: _constantes_flexion(material_props, seccion_props, tipo, eje))
 
+        if "Mn" in k:
+            Mn = k["Mn"]
         else:
-            raise NotImplementedError(f"El análisis de flexión para el tipo '{tipo}' no está soportado en esta versión.")
+            # Estado Límite de Pandeo Lateral-Torsional (LTB): única parte que depende de Lb y Cb
+            Mp, Lp, Lr, rts = k["Mp"], k["Lp"], k["Lr"], k["rts"]
+            if Lb <= Lp: Mtb = Mp
+            elif Lp < Lb <= Lr: Mtb = Cb * (Mp - (Mp - k["Mr"]) * ((Lb - Lp) / (Lr - Lp)))
+            else: Fcr_elastic = ((Cb * math.pi**2 * E) / (Lb / rts)**2) * math.sqrt(1 + 0.078 * k["Fcr_term"] * (Lb / rts)**2); Mtb = Fcr_elastic * k["Sx"]
+            Mtb = min(Mtb, Mp)
+
+            Mn = min(Mp, Mtb, k["Ml"])
+        resultado["mensaje"] = k["mensaje"]
 
         resultado["valor_calculado_Mn"] = Mn
         resultado["status"] = "Exitoso"
@@ -145,4 +176,122 @@ def calcular_resistencia_flexion(
     except Exception as e:
         resultado["mensaje"] = f"Error inesperado: {e}."
 
-    return resultado
\ No newline at end of file
+    return resultado
+
+# ==============================================================================
+# VERSIÓN VECTORIZADA: PERFILES × Lb × Cb
+# ==============================================================================
+
+# Códigos del estado límite que controla en 'estado_limite_controla'.
+ESTADOS_LIMITE_FLEXION = ("Fluencia", "PLT inelástico", "PLT elástico", "Pandeo local del patín")
+
+def calcular_resistencia_flexion_vectorizada(
+    material_props: Dict[str, float],
+    secciones: Dict[str, Any],
+    Lb: Any,
+    Cb: Any = 1.0,
+    por_miembro: bool = False
+) -> Dict[str, Any]:
+    """
+    Calcula Mn en el eje fuerte para muchos perfiles I y C a la vez, y para
+    arreglos de longitudes no arriostradas y factores Cb.
+
+    Usa las mismas ecuaciones que 'calcular_resistencia_flexion' (AISC 360-22,
+    F2-F3): fluencia, pandeo lateral-torsional y pandeo local del patín, pero
+    evaluadas con NumPy sin bucles de Python.
+
+    Args:
+        material_props (dict): Propiedades del material ('Fy', 'E').
+        secciones (dict): Arreglos de forma (n,) con 'Zx', 'Sx', 'ry', 'rts', 'J',
+            'Cw', 'ho', 'bf', 'tf', 'd', 'tw' y, para canales, 'Iy' y 'Type'.
+            Acepta directamente la salida de 'DatabaseAISC.obtener_arreglos_perfiles'.
+        Lb (array_like): Longitudes no arriostradas.
+        Cb (array_like): Factores de modificación de PLT, compatibles con Lb.
+        por_miembro (bool): Si es True, el primer eje de Lb y Cb corresponde a los
+            perfiles (un Lb por miembro, forma (n, ...)) en lugar de difundirse
+            contra todos ellos.
+
+    Returns:
+        dict: Resultados con arreglos de forma (n,) + forma(Lb, Cb) (o forma(Lb, Cb)
+              si 'por_miembro'):
+              'valor_calculado_Mn' y 'estado_limite_controla' (índices de
+              ESTADOS_LIMITE_FLEXION), más Mp, Lp y Lr por perfil en 'detalles'.
+    """
+    resultado = {
+        "valor_calculado_Mn": None, "estado_limite_controla": None, "status": "Error",
+        "referencia_norma": "AISC 360-22, Cap. F", "mensaje": "", "detalles": {}
+    }
+
+    try:
+        Fy, E = material_props['Fy'], material_props['E']
+        Lb, Cb = np.broadcast_arrays(np.asarray(Lb, dtype=float), np.asarray(Cb, dtype=float))
+
+        # Propiedades como columnas (n, 1, ..., 1) para que difundan contra Lb y Cb.
+        forma_seccion = (-1,) + (1,) * (Lb.ndim - 1 if por_miembro else Lb.ndim)
+        def prop(nombre):
+            return np.asarray(secciones[nombre], dtype=float).reshape(forma_seccion)
+
+        Zx, Sx, ry, rts = prop('Zx'), prop('Sx'), prop('ry'), prop('rts')
+        J, Cw, ho = prop('J'), prop('Cw'), prop('ho')
+        bf, tf, d, tw = prop('bf'), prop('tf'), prop('d'), prop('tw')
+
+        # Coeficiente c (F2-8): 1.0 en perfiles doblemente simétricos, F2-8b en canales.
+        c = np.ones_like(Zx)
+        if 'Type' in secciones and 'Iy' in secciones:
+            es_canal = np.isin(np.asarray(secciones['Type']), ['C', 'MC']).reshape(forma_seccion)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                c_canal = (ho / 2) * np.sqrt(prop('Iy') / Cw)
+            c = np.where(es_canal & (Cw > 0), c_canal, c)
+
+        # Estado Límite de Fluencia
+        Mp = Fy * Zx
+        Mr = 0.7 * Fy * Sx
+
+        # Estado Límite de Pandeo Lateral-Torsional (LTB)
+        Lp = 1.76 * ry * np.sqrt(E / Fy)
+        Fcr_term = (J * c) / (Sx * ho)
+        Lr = 1.95 * rts * (E / (0.7 * Fy)) * np.sqrt(Fcr_term + np.sqrt(Fcr_term**2 + 6.76 * (0.7 * Fy / E)**2))
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            Mtb_inelastico = Cb * (Mp - (Mp - Mr) * ((Lb - Lp) / (Lr - Lp)))
+            esbeltez_sq = (Lb / rts)**2
+            Fcr_elastico = (Cb * np.pi**2 * E / esbeltez_sq) * np.sqrt(1 + 0.078 * Fcr_term * esbeltez_sq)
+        Mtb = np.where(Lb <= Lp, Mp, np.where(Lb <= Lr, Mtb_inelastico, Fcr_elastico * Sx))
+        Mtb = np.minimum(Mtb, Mp)
+
+        # Estado Límite de Pandeo Local del Patín
+        lambda_p_f = 0.38 * np.sqrt(E / Fy)
+        lambda_r_f = 1.0 * np.sqrt(E / Fy)
+        lambda_f = bf / (2 * tf)
+        kc = np.clip(4 / np.sqrt((d - 2 * tf) / tw), 0.35, 0.76)
+        Ml_no_compacto = Mp - (Mp - Mr) * ((lambda_f - lambda_p_f) / (lambda_r_f - lambda_p_f))
+        Ml_esbelto = (0.9 * E * kc / lambda_f**2) * Sx
+        Ml = np.where(lambda_f <= lambda_p_f, Mp, np.where(lambda_f <= lambda_r_f, Ml_no_compacto, Ml_esbelto))
+
+        forma_salida = np.broadcast_shapes(Mp.shape, Lb.shape)
+        Mn = np.minimum(Mtb, Ml)
+        Mn = np.broadcast_to(Mn, forma_salida)
+
+        # Estado que controla: en empate con Mp se reporta fluencia.
+        codigo_ltb = np.where(Lb <= Lr, 1, 2)
+        control = np.where(Mtb < Mp, codigo_ltb, 0)
+        control = np.where(Ml < np.minimum(Mtb, Mp), 3, control)
+        control = np.broadcast_to(control, forma_salida).astype(np.int8)
+
+        resultado["valor_calculado_Mn"] = Mn
+        resultado["estado_limite_controla"] = control
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = f"Análisis de flexión vectorizado completado para {forma_salida[0]} perfiles."
+        resultado["detalles"] = {
+            "Estado_limite_fluencia_Mp": Mp.reshape(-1),
+            "Lp": Lp.reshape(-1),
+            "Lr": Lr.reshape(-1),
+            "estados_limite": ESTADOS_LIMITE_FLEXION
+        }
+
+    except (KeyError, ValueError) as e:
+        resultado["mensaje"] = f"Error en datos de entrada o propiedades: {e}."
+    except Exception as e:
+        resultado["mensaje"] = f"Error inesperado: {e}."
+
+    return resultado
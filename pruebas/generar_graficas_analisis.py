@@ -21,8 +21,8 @@ import matplotlib.pyplot as plt
 
 # --- Importaciones de Nuestro Paquete de Análisis ---
 from aisc_database import DatabaseAISC
-from compression_analysis import calcular_resistencia_compresion
-from flexure_analysis import calcular_resistencia_flexion
+from compression_analysis import calcular_resistencia_compresion_vectorizada
+from flexure_analysis import calcular_resistencia_flexion_vectorizada
 from combined_effects_analysis import generar_diagrama_interaccion_pm
 from moment_curvature_analysis import calcular_momento_curvatura
 from hinge_rotation_analysis import calcular_momento_rotacion
@@ -34,12 +34,10 @@ from hinge_rotation_analysis import calcular_momento_rotacion
 def plot_compresion_vs_longitud(ax, seccion, material):
     """Genera la gráfica de Pn vs. Longitud."""
     longitudes_ft = np.linspace(1, 50, 100)
-    Pn_vector = []
-    for L_ft in longitudes_ft:
-        L_in = L_ft * 12
-        params = {'Lx': L_in, 'Ly': L_in, 'Lz': L_in, 'Kx': 1.0, 'Ky': 1.0, 'Kz': 1.0}
-        res = calcular_resistencia_compresion(material, seccion, params)
-        Pn_vector.append(res['valor_calculado_Pn'] if res['status'] == 'Exitoso' else 0)
+    L_in = longitudes_ft * 12
+    params = {'Lx': L_in, 'Ly': L_in, 'Lz': L_in, 'Kx': 1.0, 'Ky': 1.0, 'Kz': 1.0}
+    res = calcular_resistencia_compresion_vectorizada(material, seccion, params)
+    Pn_vector = res['valor_calculado_Pn'][0] if res['status'] == 'Exitoso' else np.zeros_like(longitudes_ft)
     
     ax.plot(longitudes_ft, Pn_vector, color='red', linewidth=2)
     ax.set_title('Compresión vs. Longitud', fontsize=10)
@@ -50,11 +48,8 @@ def plot_compresion_vs_longitud(ax, seccion, material):
 def plot_flexion_vs_longitud(ax, seccion, material):
     """Genera la gráfica de Mn vs. Longitud no Arriostrada."""
     longitudes_ft = np.linspace(0.1, 50, 100)
-    Mn_vector = []
-    for Lb_ft in longitudes_ft:
-        params = {'Lb': Lb_ft * 12, 'Cb': 1.0, 'eje': 'mayor'}
-        res = calcular_resistencia_flexion(material, seccion, params)
-        Mn_vector.append(res['valor_calculado_Mn'] / 12 if res['status'] == 'Exitoso' else 0)
+    res = calcular_resistencia_flexion_vectorizada(material, seccion, Lb=longitudes_ft * 12, Cb=1.0)
+    Mn_vector = res['valor_calculado_Mn'][0] / 12 if res['status'] == 'Exitoso' else np.zeros_like(longitudes_ft)
 
     ax.plot(longitudes_ft, Mn_vector, color='blue', linewidth=2)
     ax.set_title('Flexión vs. Longitud no Arriostrada', fontsize=10)
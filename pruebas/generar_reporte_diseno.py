@@ -17,13 +17,8 @@ Este programa utiliza el paquete 'acero_analysis' para:
 Este script reemplaza la funcionalidad de 'Estados límites.py' y otros
 scripts monolíticos.
 """
-import pandas as pd
-
 # --- Importaciones de Nuestro Paquete de Análisis ---
-from aisc_database import DatabaseAISC
-from compression_analysis import calcular_resistencia_compresion
-from flexure_analysis import calcular_resistencia_flexion
-from combined_effects_analysis import verificar_interaccion_flexo_compresion
+from batch_design import procesar_lote
 
 def main():
     # ==========================================================================
@@ -50,75 +45,18 @@ def main():
     
     material = {'Fy': 50, 'E': 29000, 'G': 11200} # ksi
     phi_c, phi_b = 0.90, 0.90 # Factores de reducción LRFD
-    
-    # ==========================================================================
-    # --- 2. INICIALIZACIÓN ---
-    # ==========================================================================
-    try:
-        db = DatabaseAISC()
-    except FileNotFoundError:
-        print("Error: No se encontró 'aisc-shapes-database-v15.0.xlsx'.")
-        return
+    nombre_reporte = "reporte_diseno_acero.xlsx"
 
-    resultados_diseno = []
-
-    # ==========================================================================
-    # --- 3. BUCLE DE ANÁLISIS POR LOTES ---
-    # ==========================================================================
-    for miembro in miembros_a_revisar:
-        print(f"Procesando miembro: {miembro['id']} ({miembro['perfil']})...")
-        
-        # Obtener propiedades del perfil
-        respuesta_db = db.obtener_propiedades_perfil(miembro['perfil'])
-        if respuesta_db['status'] == 'Error':
-            print(f"  -> ADVERTENCIA: {respuesta_db['mensaje']}")
-            resultados_diseno.append({"ID": miembro['id'], "Perfil": miembro['perfil'], "Estado": "Error en Perfil"})
-            continue
-        
-        seccion = respuesta_db['propiedades']
-        
-        # Preparar parámetros de análisis
-        L_in = miembro['longitud_ft'] * 12
-        params_columna = {'Lx': L_in, 'Ly': L_in, 'Lz': L_in, 'Kx': 1.0, 'Ky': 1.0, 'Kz': 1.0}
-        params_viga = {'Lb': L_in, 'Cb': 1.0, 'eje': 'mayor'}
-        
-        # Calcular resistencias disponibles
-        Pn = calcular_resistencia_compresion(material, seccion, params_columna)['valor_calculado_Pn']
-        Mnx = calcular_resistencia_flexion(material, seccion, params_viga)['valor_calculado_Mn']
-        Mny = material['Fy'] * seccion.get('Zy', 0)
-        
-        resistencias_disponibles = {'Pc': Pn * phi_c, 'Mcx': Mnx * phi_b, 'Mcy': Mny * phi_b}
-        
-        # Realizar verificación por interacción
-        resultado_interaccion = verificar_interaccion_flexo_compresion(
-            miembro['cargas'],
-            resistencias_disponibles
-        )
-        
-        # Almacenar resultados para el reporte
-        resultados_diseno.append({
-            "ID": miembro['id'],
-            "Perfil": miembro['perfil'],
-            "Estado": resultado_interaccion['status'],
-            "Ratio D/C": f"{resultado_interaccion.get('ratio_demanda_capacidad', 0):.3f}",
-            "φcPn (kips)": f"{resistencias_disponibles['Pc']:.2f}",
-            "Pr (kips)": f"{miembro['cargas']['Pr']:.2f}",
-            "φbMnx (kip-ft)": f"{resistencias_disponibles['Mcx']/12:.2f}",
-            "Mrx (kip-ft)": f"{miembro['cargas']['Mrx']/12:.2f}",
-        })
-        
     # ==========================================================================
-    # --- 4. GENERACIÓN DE REPORTE EN EXCEL ---
+    # --- 2. REVISIÓN POR LOTES Y REPORTE EN EXCEL ---
     # ==========================================================================
-    if resultados_diseno:
-        df_reporte = pd.DataFrame(resultados_diseno)
-        nombre_reporte = "reporte_diseno_acero.xlsx"
-        
-        try:
-            df_reporte.to_excel(nombre_reporte, index=False, sheet_name='Resumen de Diseño')
-            print(f"\n¡Reporte de diseño generado exitosamente en '{nombre_reporte}'!")
-        except Exception as e:
-            print(f"\nError al escribir el archivo Excel: {e}")
+    # El motor por lotes calcula compresión, flexión e interacción por bloques
+    # en varios procesos y escribe el Excel a medida que avanza.
+    resumen = procesar_lote(miembros_a_revisar, nombre_reporte, material, phi_c=phi_c, phi_b=phi_b)
+    print(resumen['mensaje'])
+    if resumen['status'] == 'Exitoso':
+        print(f"  - No pasan: {resumen['no_pasan']} | Perfiles inválidos: {resumen['errores_perfil']}")
+        print(f"\n¡Reporte de diseño generado exitosamente en '{nombre_reporte}'!")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
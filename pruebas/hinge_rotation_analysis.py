@@ -6,6 +6,10 @@ Created on Wed Aug 20 12:50:41 2025
 """
 
 # hinge_rotation_analysis.py
+import hashlib
+import os
+import zipfile
+import numpy as np
 from typing import Dict, Any
 
 def calcular_momento_rotacion(
@@ -45,39 +49,10 @@ def calcular_momento_rotacion(
         E, Fy = material_props['E'], material_props['Fy']
         L = beam_params['L']
         
-        # --- 2. Calcular Momentos Característicos ---
-        My = Fy * Sx
-        Mp = Fy * Zx
-        
-        # --- 3. Calcular Rotaciones Caracterísitcas (basado en fórmulas empíricas) ---
-        h = d - 2 * tf
-        
-        # Parámetros adimensionales
-        h_tw = h / tw if tw > 0 else 0
-        bf_2tf = bf / (2 * tf) if tf > 0 else 0
-        L_d = L / d if d > 0 else 0
-        
-        # Conversiones para fórmulas empíricas (pueden requerir ajuste)
-        d_533 = (d * 25.4) / 533
-        Fy_355 = (Fy * 6.895) / 355
-        
-        # Rotación en la fluencia
-        theta_y = (My * L) / (6 * E * Ix) if E * Ix > 0 else 0
-
-        # Rotación plástica y de plastificación completa (capping)
-        # Estas fórmulas son altamente empíricas y específicas del paper/código de origen
-        if d <= 21: # Condición del script original
-            theta_p = (0.0865 * (h_tw)**-0.365) * ((bf_2tf)**-0.14) * \
-                      ((d_533)**-0.721) * ((Fy_355)**-0.23) * ((L_d)**0.34)
-            
-            theta_pc = (5.63 * (h_tw)**-0.565) * ((bf_2tf)**-0.781) * \
-                       ((d_533)**-0.583) * ((Fy_355)**-0.652) * ((L_d)**1.49)
-        else: # d > 21
-            theta_p = (0.0544 * (h_tw)**-0.456) * ((bf_2tf)**-0.09) * \
-                      ((d_533)**-0.892) * ((Fy_355)**-0.384) * ((L_d)**0.641)
-
-            theta_pc = (2.26 * (h_tw)**-0.53) * ((bf_2tf)**-0.613) * \
-                       ((d_533)**-0.12) * ((Fy_355)**-0.511) * ((L_d)**1.14)
+        # --- 2. y 3. Momentos y rotaciones característicos (ver 'parametros_rotula') ---
+        parametros = parametros_rotula(d, bf, tf, tw, Ix, Zx, Sx, E, Fy, L)
+        My, Mp = float(parametros["My"]), float(parametros["Mp"])
+        theta_y, theta_p, theta_pc = (float(parametros[k]) for k in ("theta_y", "theta_p", "theta_pc"))
         
         # --- 4. Ensamblar los puntos de la curva ---
         # (Momento, Rotación)
@@ -97,4 +72,223 @@ def calcular_momento_rotacion(
     except Exception as e:
         resultado["mensaje"] = f"Error inesperado en el análisis: {e}."
 
-    return resultado
\ No newline at end of file
+    return resultado
+
+
+# ==============================================================================
+# VERSIÓN VECTORIZADA Y TABLA DE RÓTULAS PARA TODA LA BASE DE DATOS
+# ==============================================================================
+
+# Cambia cuando cambian las fórmulas, para invalidar las tablas guardadas en disco.
+VERSION_TABLA_ROTULAS = 1
+
+# Parámetros de la curva de cada rótula, en el orden de las columnas de la tabla.
+PARAMETROS_ROTULA = ("My", "Mp", "theta_y", "theta_p", "theta_pc")
+
+# Leyes de potencia c·(h/tw)^a·(bf/2tf)^b·(d/533)^e·(Fy/355)^f·(L/d)^g, como
+# (c, a, b, e, f, g), para perfiles con d ≤ 21 in y d > 21 in.
+LEYES_THETA_P = ((0.0865, -0.365, -0.14, -0.721, -0.23, 0.34),
+                 (0.0544, -0.456, -0.09, -0.892, -0.384, 0.641))
+LEYES_THETA_PC = ((5.63, -0.565, -0.781, -0.583, -0.652, 1.49),
+                  (2.26, -0.53, -0.613, -0.12, -0.511, 1.14))
+
+def _ley_potencia(peralte_menor: np.ndarray, variables: tuple, leyes: tuple) -> np.ndarray:
+    """Evalúa la ley de potencia que corresponde a cada elemento según su peralte."""
+    coeficientes = np.where(peralte_menor[..., None], leyes[0], leyes[1])
+    resultado = coeficientes[..., 0]
+    for k, variable in enumerate(variables, start=1):
+        resultado = resultado * variable**coeficientes[..., k]
+    return resultado
+
+def parametros_rotula(d, bf, tf, tw, Ix, Zx, Sx, E, Fy, L) -> Dict[str, np.ndarray]:
+    """
+    Versión para arreglos de 'calcular_momento_rotacion': los argumentos se
+    difunden entre sí (ej. perfiles × razones L/d × grados) y se devuelve un
+    arreglo por parámetro de PARAMETROS_ROTULA con la forma difundida.
+
+    Las leyes de potencia de θp y θpc se eligen por máscara según d ≤ 21 in,
+    igual que en la versión escalar.
+    """
+    d, bf, tf, tw, Ix, Zx, Sx, E, Fy, L = np.broadcast_arrays(
+        *(np.asarray(v, dtype=float) for v in (d, bf, tf, tw, Ix, Zx, Sx, E, Fy, L)))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        My = Fy * Sx
+        Mp = Fy * Zx
+
+        # Parámetros adimensionales, con las mismas guardas que la versión escalar.
+        h = d - 2 * tf
+        variables = (np.where(tw > 0, h / tw, 0.0), np.where(tf > 0, bf / (2 * tf), 0.0),
+                     (d * 25.4) / 533, (Fy * 6.895) / 355, np.where(d > 0, L / d, 0.0))
+        theta_y = np.where(E * Ix > 0, (My * L) / (6 * E * Ix), 0.0)
+        theta_p = _ley_potencia(d <= 21, variables, LEYES_THETA_P)
+        theta_pc = _ley_potencia(d <= 21, variables, LEYES_THETA_PC)
+    return {"My": My, "Mp": Mp, "theta_y": theta_y, "theta_p": theta_p, "theta_pc": theta_pc}
+
+class TablaRotulas:
+    """
+    Parámetros de rótula de todos los perfiles × razones L/d × grados en
+    arreglos de forma (perfiles, razones, grados), con búsqueda por etiqueta.
+
+    Las rotaciones son leyes de potencia de L/d (θy es proporcional a L), así
+    que entre razones de la tabla se interpolan en escala log-log sin error; My
+    y Mp no dependen de L/d.
+    """
+    def __init__(self, etiquetas, razones_L_d, grados, Fy, E, valores: Dict[str, np.ndarray]):
+        self.etiquetas = np.asarray(etiquetas)
+        self.razones_L_d = np.asarray(razones_L_d, dtype=float)
+        self.grados = np.asarray(grados)
+        self.Fy = np.asarray(Fy, dtype=float)
+        self.E = np.asarray(E, dtype=float)
+        self.valores = valores
+        # Búsqueda por nombre con 'searchsorted' sobre los nombres ordenados.
+        self._orden_perfiles = np.argsort(self.etiquetas)
+        self._orden_grados = np.argsort(self.grados)
+
+    @property
+    def forma(self) -> tuple:
+        return self.valores["theta_p"].shape
+
+    @staticmethod
+    def _indices(disponibles: np.ndarray, orden: np.ndarray, nombres: np.ndarray, tipo: str) -> np.ndarray:
+        ordenados = disponibles[orden]
+        posicion = np.clip(np.searchsorted(ordenados, nombres), 0, ordenados.size - 1)
+        encontrado = ordenados[posicion] == nombres
+        if not encontrado.all():
+            raise KeyError(f"{tipo} no encontrados en la tabla de rótulas: {np.unique(nombres[~encontrado])[:5].tolist()}")
+        return orden[posicion]
+
+    def consultar_lote(self, perfiles, razones_L_d, grados) -> Dict[str, np.ndarray]:
+        """
+        Parámetros de muchas rótulas a la vez: perfiles, razones L/d y grados se
+        difunden entre sí. Las razones fuera del rango de la tabla dan NaN.
+        """
+        perfiles, razones, grados = np.broadcast_arrays(np.asarray(perfiles), np.asarray(razones_L_d, dtype=float),
+                                                        np.asarray(grados))
+        i = self._indices(self.etiquetas, self._orden_perfiles, perfiles, "Perfiles")
+        k = self._indices(self.grados, self._orden_grados, grados, "Grados")
+
+        # Posición en log(L/d) entre dos razones de la tabla.
+        log_r, log_tabla = np.log(razones), np.log(self.razones_L_d)
+        j = np.clip(np.searchsorted(log_tabla, log_r) - 1, 0, max(log_tabla.size - 2, 0))
+        j1 = np.minimum(j + 1, log_tabla.size - 1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = np.where(j1 > j, (log_r - log_tabla[j]) / (log_tabla[j1] - log_tabla[j]), 0.0)
+        dentro = (razones >= self.razones_L_d[0]) & (razones <= self.razones_L_d[-1])
+
+        resultado = {"My": self.valores["My"][i, k], "Mp": self.valores["Mp"][i, k]}
+        for clave in ("theta_y", "theta_p", "theta_pc"):
+            tabla = np.log(self.valores[clave])
+            valor = np.exp(tabla[i, j, k] + t * (tabla[i, j1, k] - tabla[i, j, k]))
+            resultado[clave] = np.where(dentro, valor, np.nan)
+        return resultado
+
+    def consultar(self, perfil: str, razon_L_d: float, grado: str) -> Dict[str, Any]:
+        """Puntos de la curva de una rótula, en el formato de 'calcular_momento_rotacion'."""
+        p = {k: float(v) for k, v in self.consultar_lote(perfil, razon_L_d, grado).items()}
+        return {
+            "punto_origen": (0, 0),
+            "punto_fluencia": (p["My"], p["theta_y"]),
+            "punto_plastico": (p["Mp"], p["theta_p"]),
+            "punto_capping": (p["Mp"], p["theta_pc"])
+        }
+
+    def guardar(self, ruta: str, clave: str = "") -> None:
+        """Guarda la tabla en un archivo '.npz' comprimido."""
+        np.savez_compressed(ruta, clave=np.array(clave), etiquetas=self.etiquetas, razones_L_d=self.razones_L_d,
+                            grados=self.grados, Fy=self.Fy, E=self.E,
+                            **{f"valor_{k}": v for k, v in self.valores.items()})
+
+    @classmethod
+    def cargar(cls, ruta: str) -> tuple:
+        """Lee una tabla guardada con 'guardar'. Devuelve (tabla, clave)."""
+        with np.load(ruta, allow_pickle=False) as datos:
+            valores = {k: datos[f"valor_{k}"] for k in PARAMETROS_ROTULA}
+            tabla = cls(datos["etiquetas"], datos["razones_L_d"], datos["grados"], datos["Fy"], datos["E"], valores)
+            return tabla, str(datos["clave"])
+
+def _clave_tabla_rotulas(perfiles: Dict[str, Any], razones_L_d: np.ndarray, grados: Dict[str, Dict]) -> str:
+    """Huella de las entradas de la tabla, para saber si la del disco sigue vigente."""
+    h = hashlib.sha256(f"v{VERSION_TABLA_ROTULAS}".encode())
+    h.update("|".join(map(str, perfiles['AISC_Manual_Label'])).encode())
+    for k in ('d', 'bf', 'tf', 'tw', 'Ix', 'Zx', 'Sx'):
+        h.update(np.ascontiguousarray(perfiles[k], dtype=float).tobytes())
+    h.update(np.ascontiguousarray(razones_L_d, dtype=float).tobytes())
+    h.update(repr(sorted((n, float(m['Fy']), float(m['E'])) for n, m in grados.items())).encode())
+    return h.hexdigest()
+
+def generar_tabla_rotulas(
+    perfiles: Dict[str, Any],
+    grados: Dict[str, Dict[str, float]],
+    razones_L_d: Any = None,
+    ruta_cache: str = None
+) -> Dict[str, Any]:
+    """
+    Genera la tabla de parámetros de rótula (My, Mp, θy, θp, θpc) de todos los
+    perfiles × razones L/d × grados en una sola evaluación vectorizada.
+
+    Con 'ruta_cache' la tabla se guarda en disco ('.npz') y en las siguientes
+    llamadas se lee de ahí si las entradas no cambiaron (se comparan con una
+    huella de los perfiles, razones, grados y la versión de las fórmulas).
+
+    Args:
+        perfiles (dict): Arreglos (n,) con 'AISC_Manual_Label', 'd', 'bf', 'tf', 'tw',
+            'Ix', 'Zx' y 'Sx', por ejemplo la salida de
+            'DatabaseAISC.obtener_arreglos_perfiles(["W"], ...)'.
+        grados (dict): {nombre: {'Fy', 'E'}} (ksi), ej. {"A992": {"Fy": 50, "E": 29000}}.
+        razones_L_d (array_like, opcional): Razones L/d crecientes (por omisión 41
+            valores en escala logarítmica entre 2 y 50).
+        ruta_cache (str, opcional): Archivo '.npz' de la caché en disco (la extensión
+            se agrega si falta). Un archivo dañado se regenera.
+
+    Returns:
+        dict: 'tabla' (TablaRotulas) y en 'detalles' si se leyó del disco y su forma.
+    """
+    resultado = {"status": "Error", "mensaje": "", "tabla": None, "detalles": {}}
+    try:
+        razones = np.geomspace(2.0, 50.0, 41) if razones_L_d is None else np.asarray(razones_L_d, dtype=float)
+        if razones.ndim != 1 or np.any(razones <= 0) or np.any(np.diff(razones) <= 0):
+            raise ValueError("Las razones L/d deben ser positivas y crecientes.")
+        if not grados:
+            raise ValueError("Se requiere al menos un grado de acero.")
+
+        clave = _clave_tabla_rotulas(perfiles, razones, grados)
+        if ruta_cache and not os.fspath(ruta_cache).endswith('.npz'):
+            ruta_cache = os.fspath(ruta_cache) + '.npz'  # np.savez_compressed agrega la extensión por su cuenta
+        if ruta_cache and os.path.exists(ruta_cache):
+            try:
+                tabla, clave_guardada = TablaRotulas.cargar(ruta_cache)
+            except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile):
+                clave_guardada = None  # Archivo dañado o ilegible: se regenera y se sobrescribe.
+            if clave_guardada == clave:
+                resultado.update(status="Exitoso", tabla=tabla,
+                                 mensaje=f"Tabla de rótulas leída de '{ruta_cache}'.",
+                                 detalles={"desde_disco": True, "forma": tabla.forma})
+                return resultado
+
+        # Forma (perfiles, razones, grados).
+        nombres = list(grados)
+        Fy = np.array([grados[n]['Fy'] for n in nombres], dtype=float)
+        E = np.array([grados[n]['E'] for n in nombres], dtype=float)
+        def prop(nombre):
+            return np.asarray(perfiles[nombre], dtype=float)[:, None, None]
+        d = prop('d')
+        valores = parametros_rotula(d, prop('bf'), prop('tf'), prop('tw'), prop('Ix'), prop('Zx'), prop('Sx'),
+                                    E[None, None, :], Fy[None, None, :], razones[None, :, None] * d)
+        # My y Mp no dependen de L/d.
+        valores["My"], valores["Mp"] = valores["My"][:, 0, :], valores["Mp"][:, 0, :]
+        tabla = TablaRotulas(perfiles['AISC_Manual_Label'], razones, nombres, Fy, E, valores)
+        if ruta_cache:
+            tabla.guardar(ruta_cache, clave)
+
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = (f"Tabla de rótulas generada para {tabla.forma[0]} perfiles, "
+                                f"{razones.size} razones L/d y {len(nombres)} grados.")
+        resultado["tabla"] = tabla
+        resultado["detalles"] = {"desde_disco": False, "forma": tabla.forma}
+
+    except KeyError as e:
+        resultado["mensaje"] = f"Error: Falta la propiedad requerida: {e}."
+    except Exception as e:
+        resultado["mensaje"] = f"Error inesperado en el análisis: {e}."
+
+    return resultado
@@ -6,7 +6,7 @@ Created on Wed Aug 20 12:47:21 2025
 """
 
 # material_models.py
-import math
+import numpy as np
 from typing import Dict, Any
 
 # --- MODELO 1: ELASTO-PLÁSTICO PERFECTO ---
@@ -16,14 +16,8 @@ def modelo_elasto_plastico(strain: float, material_props: Dict[str, float]) -> D
     """
     resultado = {"valor_calculado_stress": None, "status": "Error", "mensaje": ""}
     try:
-        E, Fy = material_props['E'], material_props['Fy']
-        strain_fluencia = Fy / E
-        
-        if abs(strain) < strain_fluencia:
-            stress = strain * E
-        else:
-            stress = math.copysign(Fy, strain)
-            
+        stress = float(esfuerzo_elasto_plastico(strain, material_props))
+
         resultado["valor_calculado_stress"] = stress
         resultado["status"] = "Exitoso"
     except KeyError as e:
@@ -35,25 +29,15 @@ def modelo_ramberg_osgood(strain: float, material_props: Dict[str, float]) -> Di
     """
     Calcula el esfuerzo usando el modelo de Ramberg-Osgood, que describe
     el comportamiento no-lineal. Rescatado de tarea_2_modelosconstitutivos.py.
+
+    'K' es el coeficiente de resistencia y 'n' el exponente de endurecimiento;
+    si falta 'K' se usa el de la deformación permanente de 0.2% en Fy.
     """
     resultado = {"valor_calculado_stress": None, "status": "Error", "mensaje": ""}
     try:
-        E, Fy = material_props['E'], material_props['Fy']
-        K = material_props.get('K', E) # Coeficiente de resistencia
-        n = material_props.get('n', 10) # Exponente de endurecimiento
-        
-        # Ecuación de Ramberg-Osgood: strain = stress/E + (stress/K)^n
-        # No se puede despejar el esfuerzo directamente, se usa la forma inversa
-        # Nota: La implementación original en el script era para graficar, no para cálculo inverso.
-        # Esta es una implementación simplificada que asume una forma directa.
-        # Una implementación completa requeriría un solver numérico.
-        # Aquí se usa la forma strain = f(stress), por lo que para una implementación
-        # directa, se simplificará. La implementación del script original era:
-        # s = E * e / (1 + (abs(E*e/Fy))**n)**(1/n)
-        
-        e_term = strain * E
-        denom = (1 + (abs(e_term / Fy))**n)**(1/n)
-        stress = e_term / denom
+        # Ecuación de Ramberg-Osgood: strain = stress/E + (stress/K)^n.
+        # El esfuerzo se obtiene invirtiéndola con Newton (ver 'esfuerzo_ramberg_osgood').
+        stress = float(esfuerzo_ramberg_osgood(strain, material_props))
         
         resultado["valor_calculado_stress"] = stress
         resultado["status"] = "Exitoso"
@@ -68,19 +52,13 @@ def modelo_manegotto_pinto(strain: float, material_props: Dict[str, float]) -> D
     """
     Calcula el esfuerzo usando el modelo de Manegotto-Pinto.
     Estructura basada en tarea_2_modelosconstitutivos.py.
+
+    'b' es la razón de endurecimiento y 'R0' el parámetro de curvatura de la transición.
     """
     resultado = {"valor_calculado_stress": None, "status": "Error", "mensaje": ""}
     try:
-        E, Fy = material_props['E'], material_props['Fy']
-        b = material_props.get('b', 0.002) # Parámetro de transición
-        R0 = material_props.get('R0', 20)  # Parámetro de curvatura inicial
-        
-        e_y = Fy / E
-        e_ratio = strain / e_y
-        
-        # Ecuación simplificada de Manegotto-Pinto
-        denom = (1 + abs(e_ratio)**R0)**(1/R0)
-        stress = E * strain / denom + b * e_ratio
+        # Curva monotónica de Menegotto-Pinto (ver 'esfuerzo_menegotto_pinto')
+        stress = float(esfuerzo_menegotto_pinto(strain, material_props))
         
         resultado["valor_calculado_stress"] = stress
         resultado["status"] = "Exitoso"
@@ -96,4 +74,253 @@ def ajustar_fy_por_strain_rate(fy_nominal: float, strain_rate: float) -> float:
     """
     # fs = 0.973 + 0.45*ev**0.33
     factor_incremento = 0.973 + 0.45 * strain_rate**0.33
-    return fy_nominal * factor_incremento
\ No newline at end of file
+    return fy_nominal * factor_incremento
+
+
+# ==============================================================================
+# VERSIONES PARA ARREGLOS (ESTILO UFUNC)
+# ==============================================================================
+# Reciben deformaciones escalares o arreglos de cualquier forma y devuelven un
+# arreglo de esfuerzos de la misma forma, sin diccionarios ni bucles por punto.
+# Las propiedades del material pueden ser escalares o arreglos difundibles.
+
+def esfuerzo_elasto_plastico(strain: Any, material_props: Dict[str, Any]) -> np.ndarray:
+    """Modelo elasto-plástico perfecto: σ = E·ε limitado a ±Fy."""
+    Fy = np.asarray(material_props['Fy'], dtype=float)
+    return np.clip(np.asarray(material_props['E'], dtype=float) * np.asarray(strain, dtype=float), -Fy, Fy)
+
+def esfuerzo_ramberg_osgood(
+    strain: Any,
+    material_props: Dict[str, Any],
+    tolerancia: float = 1e-12,
+    max_iter: int = 50,
+    devolver_convergencia: bool = False
+) -> Any:
+    """
+    Invierte la ecuación de Ramberg-Osgood, ε = σ/E + (σ/K)^n, con Newton
+    vectorizado. Solo se siguen iterando los puntos que no han convergido
+    (máscara de convergencia), así que el costo lo fija el punto más difícil
+    y no el número de puntos.
+
+    El punto de partida σ0 = min(E·|ε|, K·|ε|^(1/n)) es una cota superior de la
+    solución y la función es convexa para σ > 0, así que Newton converge de
+    forma monótona sin pasarse.
+
+    Args:
+        strain: Deformaciones (escalar o arreglo).
+        material_props (dict): 'E', 'Fy' y opcionalmente 'n' (10) y 'K'
+            (por omisión Fy/0.002^(1/n), deformación permanente de 0.2% en Fy).
+        tolerancia (float): Tolerancia relativa en la deformación.
+        devolver_convergencia (bool): Si es True devuelve (esfuerzos, convergio).
+
+    Returns:
+        np.ndarray: Esfuerzos con la forma de 'strain' (y la máscara si se pide).
+    """
+    strain = np.asarray(strain, dtype=float)
+    n = np.asarray(material_props.get('n', 10), dtype=float)
+    E = np.asarray(material_props['E'], dtype=float)
+    K = np.asarray(material_props.get('K', np.asarray(material_props['Fy'], dtype=float) / 0.002**(1 / n)),
+                   dtype=float)
+    forma = np.broadcast_shapes(strain.shape, E.shape, K.shape, n.shape)
+    e = np.abs(np.broadcast_to(strain, forma)).ravel()
+    E_p, K_p, n_p = (np.broadcast_to(v, forma).ravel() for v in (E, K, n))
+
+    sigma = np.minimum(E_p * e, K_p * e**(1 / n_p))
+    pendientes = np.flatnonzero(e > 0)
+    convergio = np.ones(e.shape, dtype=bool)
+    for _ in range(max_iter):
+        if pendientes.size == 0:
+            break
+        s, Ei, Ki, ni, ei = sigma[pendientes], E_p[pendientes], K_p[pendientes], n_p[pendientes], e[pendientes]
+        potencia = (s / Ki)**ni
+        residuo = s / Ei + potencia - ei
+        derivada = 1 / Ei + ni * potencia / s
+        sigma[pendientes] = s - residuo / derivada
+        pendientes = pendientes[np.abs(residuo) > tolerancia * ei]
+    convergio[pendientes] = False
+
+    sigma = np.copysign(sigma, np.broadcast_to(strain, forma).ravel()).reshape(forma)
+    if devolver_convergencia:
+        return sigma, convergio.reshape(forma)
+    return sigma
+
+def esfuerzo_menegotto_pinto(strain: Any, material_props: Dict[str, Any]) -> np.ndarray:
+    """
+    Curva monotónica de Menegotto-Pinto en variables normalizadas
+    (ε* = ε/εy, σ* = σ/Fy):  σ* = b·ε* + (1 - b)·ε* / (1 + |ε*|^R0)^(1/R0).
+    'b' (0.002) es la razón de endurecimiento y 'R0' (20) la curvatura de la transición.
+    """
+    E = np.asarray(material_props['E'], dtype=float)
+    Fy = np.asarray(material_props['Fy'], dtype=float)
+    b = np.asarray(material_props.get('b', 0.002), dtype=float)
+    R0 = np.asarray(material_props.get('R0', 20), dtype=float)
+    e_ratio = np.asarray(strain, dtype=float) * E / Fy
+    return Fy * (b * e_ratio + (1 - b) * e_ratio / (1 + np.abs(e_ratio)**R0)**(1 / R0))
+
+
+# ==============================================================================
+# MENEGOTTO-PINTO CÍCLICO CON ESTADO POR FIBRA
+# ==============================================================================
+
+# Tramo de carga de cada fibra en 'MaterialMenegottoPintoCiclico.direccion'.
+SIN_CARGA, CARGA_POSITIVA, CARGA_NEGATIVA = 0, 1, 2
+
+class MaterialMenegottoPintoCiclico:
+    """
+    Modelo cíclico de Menegotto-Pinto (con las modificaciones de Filippou et al.,
+    1983, como el Steel02 de OpenSees) con el estado de todas las fibras en
+    arreglos de NumPy.
+
+    Cada rama parte del último punto de inversión (εr, σr) hacia el cruce de las
+    asíntotas (ε0, σ0):
+        ε* = (ε - εr)/(ε0 - εr),   σ* = b·ε* + (1 - b)·ε*/(1 + |ε*|^R)^(1/R)
+        σ  = σr + σ*·(σ0 - σr)
+    y la curvatura de la transición se degrada con la excursión plástica previa ξ:
+    R = R0·(1 - cR1·ξ/(cR2 + ξ)). Con 'a1'...'a4' se activa el endurecimiento
+    isotrópico (por omisión no hay).
+
+    El estado confirmado (inversión, asíntotas, deformaciones extremas, dirección
+    de carga) vive en arreglos con la forma de las fibras. 'intentar' evalúa una
+    deformación de prueba para todas las fibras a partir del estado confirmado
+    sin modificarlo, lo que permite iterar el equilibrio de la sección;
+    'confirmar' la vuelve el nuevo estado.
+    """
+    def __init__(self, material_props: Dict[str, Any], forma: Any):
+        """
+        Args:
+            material_props (dict): 'E', 'Fy' y opcionalmente 'b' (0.002), 'R0' (20),
+                'cR1' (0.925), 'cR2' (0.15) y 'a1'...'a4' (0, 1, 0, 1). Pueden ser
+                escalares o arreglos difundibles a 'forma'.
+            forma: Forma de los arreglos de estado (ej. (secciones, fibras)).
+        """
+        self.forma = tuple(np.atleast_1d(forma).tolist()) if np.ndim(forma) else (int(forma),)
+        def propiedad(clave, omision=None):
+            valor = material_props[clave] if omision is None else material_props.get(clave, omision)
+            return np.broadcast_to(np.asarray(valor, dtype=float), self.forma)
+        self.E, self.Fy = propiedad('E'), propiedad('Fy')
+        self.b = propiedad('b', 0.002)
+        self.R0, self.cR1, self.cR2 = propiedad('R0', 20.0), propiedad('cR1', 0.925), propiedad('cR2', 0.15)
+        self.a1, self.a2 = propiedad('a1', 0.0), propiedad('a2', 1.0)
+        self.a3, self.a4 = propiedad('a3', 0.0), propiedad('a4', 1.0)
+        self.epsy = self.Fy / self.E
+        self.reiniciar()
+
+    def reiniciar(self) -> None:
+        """Vuelve todas las fibras al estado virgen (sin deformación ni historia)."""
+        cero = np.zeros(self.forma)
+        self.deformacion, self.esfuerzo, self.tangente = cero.copy(), cero.copy(), self.E.copy()
+        self.eps_r, self.sig_r = cero.copy(), cero.copy()
+        self.eps_0, self.sig_0 = self.epsy.copy(), self.Fy.copy()
+        self.eps_pl = self.epsy.copy()
+        self.eps_max, self.eps_min = self.epsy.copy(), -self.epsy
+        self.direccion = np.full(self.forma, SIN_CARGA, dtype=np.int8)
+        self._prueba = None
+
+    def intentar(self, deformacion: Any) -> tuple:
+        """
+        Evalúa una deformación de prueba en todas las fibras a partir del estado
+        confirmado, en una sola actualización vectorizada.
+
+        Returns:
+            tuple: (esfuerzos, módulos tangentes) con la forma de las fibras.
+        """
+        eps = np.broadcast_to(np.asarray(deformacion, dtype=float), self.forma)
+        d_eps = eps - self.deformacion
+        # El estado confirmado no se modifica en sitio: cada cambio crea un arreglo nuevo.
+        direccion = self.direccion.copy()
+        eps_r, sig_r, eps_0, sig_0, eps_pl = self.eps_r, self.sig_r, self.eps_0, self.sig_0, self.eps_pl
+        eps_max, eps_min = self.eps_max, self.eps_min
+        E, Fy, b, epsy = self.E, self.Fy, self.b, self.epsy
+        Esh = b * E
+
+        # Primera carga: la dirección la fija el signo del incremento.
+        virgen = direccion == SIN_CARGA
+        arranca = virgen & (d_eps != 0)
+        if arranca.any():
+            negativa = arranca & (d_eps < 0)
+            direccion[arranca] = np.where(negativa, CARGA_NEGATIVA, CARGA_POSITIVA)[arranca]
+            eps_0 = np.where(negativa, -epsy, eps_0)
+            sig_0 = np.where(negativa, -Fy, sig_0)
+            eps_pl = np.where(negativa, -epsy, eps_pl)
+
+        # Inversión de negativa a positiva: nueva rama desde el último punto confirmado.
+        sube = (direccion == CARGA_NEGATIVA) & (d_eps > 0) & ~arranca
+        if sube.any():
+            eps_min = np.where(sube, np.minimum(eps_min, self.deformacion), eps_min)
+            corrimiento = 1 + self.a3 * ((eps_max - eps_min) / (2 * self.a4 * epsy))**0.8
+            nuevo_eps_0 = (Fy * corrimiento - Esh * epsy * corrimiento - self.esfuerzo + E * self.deformacion) / (E - Esh)
+            eps_0 = np.where(sube, nuevo_eps_0, eps_0)
+            sig_0 = np.where(sube, Fy * corrimiento + Esh * (nuevo_eps_0 - epsy * corrimiento), sig_0)
+            eps_pl = np.where(sube, eps_max, eps_pl)
+        # Inversión de positiva a negativa.
+        baja = (direccion == CARGA_POSITIVA) & (d_eps < 0) & ~arranca
+        if baja.any():
+            eps_max = np.where(baja, np.maximum(eps_max, self.deformacion), eps_max)
+            corrimiento = 1 + self.a1 * ((eps_max - eps_min) / (2 * self.a2 * epsy))**0.8
+            nuevo_eps_0 = (-Fy * corrimiento + Esh * epsy * corrimiento - self.esfuerzo + E * self.deformacion) / (E - Esh)
+            eps_0 = np.where(baja, nuevo_eps_0, eps_0)
+            sig_0 = np.where(baja, -Fy * corrimiento + Esh * (nuevo_eps_0 + epsy * corrimiento), sig_0)
+            eps_pl = np.where(baja, eps_min, eps_pl)
+        invierte = sube | baja
+        if invierte.any():
+            eps_r = np.where(invierte, self.deformacion, eps_r)
+            sig_r = np.where(invierte, self.esfuerzo, sig_r)
+            direccion[sube], direccion[baja] = CARGA_POSITIVA, CARGA_NEGATIVA
+
+        xi = np.abs((eps_pl - eps_0) / epsy)
+        R = self.R0 * (1 - self.cR1 * xi / (self.cR2 + xi))
+        eps_rel = (eps - eps_r) / (eps_0 - eps_r)
+        base = 1 + np.abs(eps_rel)**R
+        raiz = base**(1 / R)
+        esfuerzo = sig_r + (b * eps_rel + (1 - b) * eps_rel / raiz) * (sig_0 - sig_r)
+        tangente = (b + (1 - b) / (base * raiz)) * (sig_0 - sig_r) / (eps_0 - eps_r)
+
+        # Las fibras vírgenes sin incremento siguen en el origen con el módulo elástico.
+        quieta = virgen & ~arranca
+        if quieta.any():
+            esfuerzo = np.where(quieta, self.esfuerzo, esfuerzo)
+            tangente = np.where(quieta, E, tangente)
+
+        self._prueba = (eps.copy(), esfuerzo, tangente, direccion, eps_r, sig_r, eps_0, sig_0, eps_pl,
+                        eps_max, eps_min)
+        return esfuerzo, tangente
+
+    def confirmar(self) -> None:
+        """Convierte el último estado de prueba en el estado confirmado de las fibras."""
+        if self._prueba is None:
+            return
+        (self.deformacion, self.esfuerzo, self.tangente, self.direccion, self.eps_r, self.sig_r,
+         self.eps_0, self.sig_0, self.eps_pl, self.eps_max, self.eps_min) = self._prueba
+        self._prueba = None
+
+    def avanzar(self, deformacion: Any) -> tuple:
+        """Aplica un incremento de deformación a todas las fibras y lo confirma."""
+        resultado = self.intentar(deformacion)
+        self.confirmar()
+        return resultado
+
+def esfuerzos_menegotto_pinto_ciclico(historia: Any, material_props: Dict[str, Any]) -> np.ndarray:
+    """
+    Esfuerzos de Menegotto-Pinto cíclico para una historia de deformaciones.
+
+    Args:
+        historia (array_like): (pasos, ...) deformaciones; los ejes restantes son fibras
+            independientes que avanzan juntas en cada paso.
+        material_props (dict): Ver 'MaterialMenegottoPintoCiclico'.
+
+    Returns:
+        np.ndarray: Esfuerzos con la forma de 'historia'.
+    """
+    historia = np.asarray(historia, dtype=float)
+    material = MaterialMenegottoPintoCiclico(material_props, historia.shape[1:] or (1,))
+    esfuerzos = np.empty(historia.shape)
+    for paso, deformacion in enumerate(historia):
+        esfuerzos[paso] = material.avanzar(deformacion)[0].reshape(deformacion.shape)
+    return esfuerzos
+
+# Modelos disponibles para los análisis de fibras, por nombre.
+MODELOS_CONSTITUTIVOS = {
+    "elasto_plastico": esfuerzo_elasto_plastico,
+    "ramberg_osgood": esfuerzo_ramberg_osgood,
+    "menegotto_pinto": esfuerzo_menegotto_pinto,
+}
@@ -9,8 +9,8 @@ Created on Wed Aug 20 12:49:00 2025
 import numpy as np
 from typing import Dict, Any
 
-# ¡Importamos el modelo de material que creamos en el paso anterior!
-from material_models import modelo_elasto_plastico
+# Leyes constitutivas para arreglos: evalúan todas las fibras en una sola llamada.
+from material_models import MODELOS_CONSTITUTIVOS, esfuerzo_elasto_plastico
 
 def calcular_momento_curvatura(
     seccion_props: Dict[str, float],
@@ -67,31 +67,17 @@ def calcular_momento_curvatura(
         y_coords = np.concatenate([y_alma, y_patin])
         A_fibras = np.concatenate([np.full_like(y_alma, A_alma), np.full_like(y_patin, A_patin)])
 
-        # --- 3. Bucle de Análisis: Incrementar la curvatura (phi) ---
+        # --- 3. Análisis: todas las curvaturas (phi) y fibras en un solo arreglo ---
         curvaturas = np.linspace(0, curvatura_max, 100)
-        momentos = []
-
-        for phi in curvaturas:
-            momento_total = 0
-            
-            # Calcular el strain en cada fibra: strain = y * phi
-            strains = y_coords * phi
-            
-            # Calcular el stress en cada fibra usando nuestro modelo de material
-            stresses = np.array([
-                modelo_elasto_plastico(s, material_props)["valor_calculado_stress"]
-                for s in strains
-            ])
-            
-            # Calcular la fuerza en cada fibra: F = stress * Area
-            fuerzas = stresses * A_fibras
-            
-            # Calcular el momento de cada fibra: M = F * y
-            momentos_fibras = fuerzas * y_coords
-            
-            # Sumar el momento de todas las fibras y duplicar por simetría
-            momento_total = np.sum(momentos_fibras) * 2
-            momentos.append(momento_total)
+
+        # Strain en cada fibra para cada curvatura: strain = y * phi, forma (pasos, fibras)
+        strains = curvaturas[:, None] * y_coords[None, :]
+
+        # Stress en cada fibra con la ley elasto-plástica evaluada sobre el arreglo completo
+        stresses = esfuerzo_elasto_plastico(strains, material_props)
+
+        # Momento de cada fibra: M = stress * A * y; se suma y se duplica por simetría
+        momentos = (2 * np.sum(stresses * (A_fibras * y_coords)[None, :], axis=1)).tolist()
 
         resultado["status"] = "Exitoso"
         resultado["mensaje"] = "Análisis de Momento-Curvatura completado."
@@ -105,4 +91,102 @@ def calcular_momento_curvatura(
     except Exception as e:
         resultado["mensaje"] = f"Error inesperado en el análisis: {e}."
 
-    return resultado
\ No newline at end of file
+    return resultado
+
+
+def calcular_momento_curvatura_vectorizada(
+    secciones: Dict[str, Any],
+    material_props: Dict[str, float],
+    analysis_params: Dict[str, Any] = None,
+    tam_bloque: int = 256
+) -> Dict[str, Any]:
+    """
+    Calcula las curvas momento-curvatura de muchos perfiles I a la vez por
+    integración de fibras, sin bucles de Python por curvatura ni por fibra.
+
+    Todos los perfiles usan el mismo número de fibras (capas de igual espesor en
+    el patín y en la mitad del alma, con el punto medio de cada capa), así que las
+    deformaciones de todos los pasos × fibras de un bloque de perfiles son una
+    sola difusión de NumPy: ε = y·φ con forma (perfiles, pasos, fibras).
+
+    Args:
+        secciones (dict): Arreglos (n,) con 'd', 'bf', 'tf', 'tw' (in), por ejemplo
+            la salida de 'DatabaseAISC.obtener_arreglos_perfiles'.
+        material_props (dict): 'E' y 'Fy' (ksi).
+        analysis_params (dict, opcional):
+            - 'fibras_patin': Capas por patín (8 por omisión).
+            - 'fibras_alma': Capas en media alma (40 por omisión).
+            - 'num_pasos': Número de curvaturas (100 por omisión).
+            - 'modelo': Ley constitutiva de MODELOS_CONSTITUTIVOS
+              ('elasto_plastico' por omisión); 'material_props' lleva sus parámetros.
+            - 'curvatura_max': Curvatura máxima (rad/in), común a todos los perfiles;
+              si falta se usa 'ductilidad_max' (20 por omisión) veces la curvatura
+              de fluencia de cada perfil, φy = 2·Fy/(E·d).
+        tam_bloque (int): Perfiles por bloque, para acotar la memoria.
+
+    Returns:
+        dict: 'curvaturas' y 'momentos' (kip-in) de forma (n, pasos), y en
+              'detalles' el momento de fluencia y el plástico de las fibras.
+    """
+    resultado = {
+        "status": "Error",
+        "mensaje": "",
+        "curvaturas": None,
+        "momentos": None,
+        "detalles": {}
+    }
+
+    try:
+        # --- 1. Extraer propiedades y parámetros ---
+        params = analysis_params or {}
+        def prop(nombre):
+            return np.atleast_1d(np.asarray(secciones[nombre], dtype=float))
+        d, bf, tf, tw = prop('d'), prop('bf'), prop('tf'), prop('tw')
+        E, Fy = material_props['E'], material_props['Fy']
+        fibras_patin = int(params.get('fibras_patin', 8))
+        fibras_alma = int(params.get('fibras_alma', 40))
+        num_pasos = int(params.get('num_pasos', 100))
+        modelo = MODELOS_CONSTITUTIVOS[params.get('modelo', 'elasto_plastico')]
+
+        # --- 2. Fibras de media sección (n, fibras): alma y luego patín ---
+        h_alma = d - 2 * tf
+        capas_alma = (np.arange(fibras_alma) + 0.5) / fibras_alma
+        capas_patin = (np.arange(fibras_patin) + 0.5) / fibras_patin
+        y_fibras = np.concatenate([capas_alma[None, :] * (h_alma / 2)[:, None],
+                                   (h_alma / 2)[:, None] + capas_patin[None, :] * tf[:, None]], axis=1)
+        A_fibras = np.concatenate([np.repeat((tw * h_alma / 2 / fibras_alma)[:, None], fibras_alma, axis=1),
+                                   np.repeat((bf * tf / fibras_patin)[:, None], fibras_patin, axis=1)], axis=1)
+
+        # --- 3. Curvaturas (n, pasos) ---
+        fracciones = np.linspace(0.0, 1.0, num_pasos)
+        if 'curvatura_max' in params:
+            curvatura_max = np.full(d.shape, float(params['curvatura_max']))
+        else:
+            curvatura_max = params.get('ductilidad_max', 20.0) * 2 * Fy / (E * d)
+        curvaturas = curvatura_max[:, None] * fracciones[None, :]
+
+        # --- 4. Integración por bloques de perfiles ---
+        momentos = np.empty_like(curvaturas)
+        brazo = A_fibras * y_fibras  # A·y de cada fibra
+        for inicio in range(0, d.shape[0], tam_bloque):
+            b = slice(inicio, inicio + tam_bloque)
+            strains = curvaturas[b, :, None] * y_fibras[b, None, :]
+            stresses = modelo(strains, material_props)
+            momentos[b] = 2 * np.einsum('spf,sf->sp', stresses, brazo[b])
+
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = f"Curvas momento-curvatura calculadas para {d.shape[0]} perfiles."
+        resultado["curvaturas"] = curvaturas
+        resultado["momentos"] = momentos
+        resultado["detalles"] = {
+            "My_fibras_kip_in": 2 * Fy * np.sum(brazo * y_fibras, axis=1) / (d / 2),
+            "Mp_fibras_kip_in": 2 * Fy * np.sum(brazo, axis=1),
+            "num_fibras": 2 * (fibras_alma + fibras_patin)
+        }
+
+    except KeyError as e:
+        resultado["mensaje"] = f"Error: Falta la propiedad requerida: {e}."
+    except Exception as e:
+        resultado["mensaje"] = f"Error inesperado en el análisis: {e}."
+
+    return resultado
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+"""
+Caché de constantes de sección para los módulos de resistencia.
+
+Las funciones 'calcular_resistencia_*' dependen de dos tipos de datos: los que
+solo dependen del perfil y del material (Mp, Lp, Lr, límites λp/λr, Cv, Tn, los
+términos de Fe que no dependen de la longitud...) y los que dependen de la
+longitud o de la carga (Lb, Cb, KL). En corridas por lotes se repite un puñado
+de perfiles miles de veces, así que las constantes se guardan en una caché LRU
+acotada con llave (etiqueta del perfil, Fy, E).
+"""
+
+# section_constants.py
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+class CacheLRU:
+    """Caché de tamaño acotado que descarta primero la entrada usada hace más tiempo."""
+
+    def __init__(self, capacidad: int = 512):
+        if capacidad <= 0:
+            raise ValueError("La capacidad de la caché debe ser positiva.")
+        self.capacidad = capacidad
+        self._entradas = OrderedDict()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def obtener(self, clave: Hashable, calcular: Callable[[], Any]) -> Any:
+        """Devuelve el valor de 'clave'; si no existe lo calcula con 'calcular()' y lo guarda."""
+        if clave in self._entradas:
+            self._entradas.move_to_end(clave)
+            self.aciertos += 1
+            return self._entradas[clave]
+
+        valor = calcular()  # Si el cálculo falla, no se guarda nada.
+        self.fallos += 1
+        self._entradas[clave] = valor
+        if len(self._entradas) > self.capacidad:
+            self._entradas.popitem(last=False)
+        return valor
+
+    def limpiar(self) -> None:
+        """Vacía la caché y reinicia las estadísticas."""
+        self._entradas.clear()
+        self.aciertos = 0
+        self.fallos = 0
+
+    def info(self) -> Dict[str, int]:
+        """Estadísticas de uso: aciertos, fallos, tamaño y capacidad."""
+        return {"aciertos": self.aciertos, "fallos": self.fallos,
+                "tamano": len(self._entradas), "capacidad": self.capacidad}
+
+    def __len__(self) -> int:
+        return len(self._entradas)
+
+
+# Caché compartida por todos los módulos de resistencia.
+cache_constantes = CacheLRU(capacidad=512)
+
+def obtener_constantes(
+    categoria: Hashable,
+    material_props: Dict[str, float],
+    seccion_props: Dict[str, Any],
+    calcular: Callable[[], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Devuelve las constantes de 'categoria' (ej. 'flexion_mayor', 'cortante') para
+    el perfil y material dados, calculándolas solo la primera vez.
+
+    La llave es (categoria, etiqueta del perfil, Fy, E). Si la sección no trae
+    etiqueta ('AISC_Manual_Label', como en propiedades armadas a mano), no hay
+    forma segura de identificarla y las constantes se calculan sin caché.
+
+    Los diccionarios devueltos se comparten entre llamadas: no deben modificarse.
+    """
+    etiqueta = seccion_props.get('AISC_Manual_Label')
+    if etiqueta is None:
+        return calcular()
+    clave = (categoria, etiqueta, material_props['Fy'], material_props['E'])
+    return cache_constantes.obtener(clave, calcular)
@@ -6,8 +6,149 @@ Created on Wed Aug 20 15:42:07 2025
 """
 
 # shear_analysis.py
-import math
-from typing import Dict, Any
+import numpy as np
+from typing import Dict, Any, Iterable
+
+from section_constants import obtener_constantes
+
+# Casos de Cv1 (AISC 360-22, G2.1), en el orden de los códigos de 'caso_cv'
+# (los mismos que 'clase' en 'design.acero.shear_table.coeficientes_cortante').
+CASOS_CV = ("G2.1(a) (No pandea, φv = 1.0)", "G2-3 (No pandea)", "G2-4 (Pandeo del alma)")
+
+# Perfiles I rolados, los únicos a los que aplica G2.1(a).
+TIPOS_I_ROLADOS = ('W', 'S', 'M', 'HP')
+
+# Tablas precalculadas por grado de acero: {(Fy, E): {"indice": {etiqueta: i}, <columna>: arreglo}}.
+_tablas_cortante: Dict[tuple, Dict[str, Any]] = {}
+
+def calcular_resistencia_cortante_vectorizada(
+    material_props: Dict[str, float],
+    secciones: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Calcula Cv1, Cv2, φv y Vn para muchos perfiles a la vez (AISC 360-22, G2.1
+    y G2.2), sin bucles de Python. Es también la ruta para grados de acero que
+    no tienen tabla precalculada.
+
+    Args:
+        material_props (dict): Propiedades del material ('Fy', 'E').
+        secciones (dict): Arreglos de forma (n,) con 'd', 'tf', 'tw' y 'kdes'
+            (si falta 'kdes' se usa 'tf'). Acepta la salida de
+            'DatabaseAISC.obtener_arreglos_perfiles'. Opcionales: 'h/tw' del
+            catálogo (si falta, h = d - 2·kdes) y 'Type'; G2.1(a) solo aplica a
+            TIPOS_I_ROLADOS (sin 'Type' se suponen perfiles I rolados).
+
+    Returns:
+        dict: Resultados con arreglos de forma (n,): 'valor_calculado_Vn',
+              'phi_Vn' y, en 'detalles', Aw, h/tw, Cv1, Cv2, φv y 'caso_cv'
+              (índices de CASOS_CV).
+    """
+    resultado = {
+        "valor_calculado_Vn": None, "phi_Vn": None, "status": "Error",
+        "referencia_norma": "AISC 360-22, Cap. G", "mensaje": "", "detalles": {}
+    }
+
+    try:
+        # --- 1. Extraer Datos ---
+        Fy, E = material_props['Fy'], material_props['E']
+        d = np.asarray(secciones['d'], dtype=float)
+        tf = np.asarray(secciones['tf'], dtype=float)
+        tw = np.asarray(secciones['tw'], dtype=float)
+        kdes = np.asarray(secciones.get('kdes', tf), dtype=float) # Usar tf si kdes no está
+
+        # --- 2. Calcular Propiedades del Alma ---
+        Aw = d * tw                      # Área del alma
+        h = d - 2 * kdes                 # Altura libre del alma
+        with np.errstate(divide='ignore', invalid='ignore'):
+            h_tw = np.where(tw > 0, h / tw, 0.0)  # Razón de esbeltez del alma
+        if 'h/tw' in secciones:
+            # La del catálogo, igual que la tabla de la capa de diseño, donde exista.
+            h_tw_catalogo = np.asarray(secciones['h/tw'], dtype=float)
+            h_tw = np.where(np.isnan(h_tw_catalogo), h_tw, h_tw_catalogo)
+        tipo = secciones.get('Type')
+        perfil_i_rolado = True if tipo is None else np.isin(np.asarray(tipo, dtype=str), TIPOS_I_ROLADOS)
+
+        # --- 3. Calcular Coeficientes de Cortante (G2.1 y G2.2) ---
+        kv = 5.34 # Para almas sin rigidizadores transversales
+        limite_a = 2.24 * np.sqrt(E / Fy)            # G2.1(a), perfiles I rolados
+        limite_inelastico = 1.10 * np.sqrt(kv * E / Fy)
+        limite_elastico = 1.37 * np.sqrt(kv * E / Fy)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            caso_a = (h_tw <= limite_a) & perfil_i_rolado
+            sin_pandeo = caso_a | (h_tw <= limite_inelastico)
+            Cv1 = np.where(sin_pandeo, 1.0, limite_inelastico / h_tw)                         # G2-3 / G2-4
+            Cv2 = np.where(h_tw <= limite_inelastico, 1.0,
+                           np.where(h_tw <= limite_elastico, limite_inelastico / h_tw,
+                                    1.51 * kv * E / (h_tw**2 * Fy)))                           # G2-9 a G2-11
+        phi_v = np.where(caso_a, 1.00, 0.90)
+        caso_cv = np.where(caso_a, 0, np.where(sin_pandeo, 1, 2)).astype(np.int8)
+
+        # --- 4. Calcular Resistencia Nominal a Cortante (Vn), Ecuación G2-1 ---
+        Vn = 0.6 * Fy * Aw * Cv1
+
+        resultado["valor_calculado_Vn"] = Vn
+        resultado["phi_Vn"] = phi_v * Vn
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = f"Cálculo de cortante vectorizado completado para {Vn.size} perfiles."
+        resultado["detalles"] = {
+            "Area_alma_Aw_in2": Aw, "Esbeltez_alma_h_tw": h_tw, "Limite_esbeltez": limite_a,
+            "Coeficiente_Cv1": Cv1, "Coeficiente_Cv2": Cv2, "Factor_phi_v": phi_v,
+            "caso_cv": caso_cv, "casos": CASOS_CV
+        }
+
+    except (KeyError, ValueError) as e:
+        resultado["mensaje"] = f"Error en los datos de entrada o cálculo: {e}."
+    except Exception as e:
+        resultado["mensaje"] = f"Error inesperado: {e}."
+
+    return resultado
+
+def precalcular_tablas_cortante(
+    secciones: Dict[str, Any],
+    grados: Iterable[Dict[str, float]]
+) -> None:
+    """
+    Precalcula la resistencia a cortante de todos los perfiles de 'secciones'
+    (salida de 'DatabaseAISC.obtener_arreglos_perfiles') para cada grado de
+    acero ({'Fy', 'E'}). Después, 'calcular_resistencia_cortante' resuelve esos
+    perfiles con una búsqueda O(1).
+    """
+    for material in grados:
+        calculo = calcular_resistencia_cortante_vectorizada(material, secciones)
+        if calculo['status'] != 'Exitoso':
+            raise ValueError(calculo['mensaje'])
+        tabla = dict(calculo['detalles'])
+        tabla["Vn"], tabla["phi_Vn"] = calculo['valor_calculado_Vn'], calculo['phi_Vn']
+        tabla["indice"] = {etiqueta: i for i, etiqueta in enumerate(secciones['AISC_Manual_Label'])}
+        _tablas_cortante[(material['Fy'], material['E'])] = tabla
+
+def _fila_tabla(tabla: Dict[str, Any], i: int) -> Dict[str, Any]:
+    """Extrae los valores de un perfil de una tabla de cortante."""
+    return {"Aw": float(tabla["Area_alma_Aw_in2"][i]), "h_tw": float(tabla["Esbeltez_alma_h_tw"][i]),
+            "limite_esbeltez": float(tabla["Limite_esbeltez"]), "Cv1": float(tabla["Coeficiente_Cv1"][i]),
+            "Cv2": float(tabla["Coeficiente_Cv2"][i]), "phi_v": float(tabla["Factor_phi_v"][i]),
+            "caso_cv": CASOS_CV[tabla["caso_cv"][i]], "Vn": float(tabla["Vn"][i]),
+            "phi_Vn": float(tabla["phi_Vn"][i])}
+
+def _constantes_cortante(
+    material_props: Dict[str, float],
+    seccion_props: Dict[str, float]
+) -> Dict[str, Any]:
+    """
+    Calcula Aw, la esbeltez del alma, Cv1/Cv2, φv y Vn de un perfil con el
+    cálculo vectorizado. Sin rigidizadores transversales, todo depende solo del
+    perfil y del material.
+    """
+    secciones = {k: np.array([seccion_props[k]], dtype=float) for k in ('d', 'tf', 'tw', 'kdes', 'h/tw') if k in seccion_props}
+    if 'Type' in seccion_props:
+        secciones['Type'] = np.array([seccion_props['Type']])
+    calculo = calcular_resistencia_cortante_vectorizada(material_props, secciones)
+    if calculo['status'] != 'Exitoso':
+        raise ValueError(calculo['mensaje'])
+    tabla = dict(calculo['detalles'])
+    tabla["Vn"], tabla["phi_Vn"] = calculo['valor_calculado_Vn'], calculo['phi_Vn']
+    return _fila_tabla(tabla, 0)
 
 def calcular_resistencia_cortante(
     material_props: Dict[str, float],
@@ -19,7 +160,9 @@ def calcular_resistencia_cortante(
 
     Implementa las especificaciones del AISC 360-22, Capítulo G. El cálculo
     incluye la determinación del coeficiente de cortante Cv (Cv1 o Cv2)
-    basado en la esbeltez del alma.
+    basado en la esbeltez del alma, y el factor φv de G2.1(a). El resultado se
+    toma de la tabla del grado de acero ('precalcular_tablas_cortante') o de la
+    caché de 'section_constants' cuando el perfil ya se calculó con el mismo material.
 
     Args:
         material_props (dict): Propiedades del material ('Fy', 'E').
@@ -28,6 +171,7 @@ def calcular_resistencia_cortante(
             - 'tf': Espesor del patín (in).
             - 'tw': Espesor del alma (in).
             - 'kdes': Distancia de diseño k (in).
+            - 'h/tw' y 'Type' (opcionales): ver 'calcular_resistencia_cortante_vectorizada'.
 
     Returns:
         dict: Un diccionario con los resultados del cálculo, incluyendo el estado,
@@ -42,63 +186,27 @@ def calcular_resistencia_cortante(
     }
 
     try:
-        # --- 1. Extraer Datos ---
-        Fy, E = material_props['Fy'], material_props['E']
-        d, tf = seccion_props['d'], seccion_props['tf']
-        tw, kdes = seccion_props['tw'], seccion_props.get('kdes', tf) # Usar tf si kdes no está
-
-        # --- 2. Calcular Propiedades del Alma ---
-        # Aw: Área del alma
-        Aw = d * tw
-        # h: Altura libre del alma
-        h = d - 2 * kdes
-        # h/tw: Razón de esbeltez del alma
-        h_tw = h / tw if tw > 0 else 0
-
-        # --- 3. Calcular Coeficiente de Cortante (Cv) ---
-        # Límite para almas no rigidizadas
-        limite_esbeltez = 2.24 * math.sqrt(E / Fy)
-        kv = 5.34 # Para almas no rigidizadas con h/tw < 260
-        
-        Cv1 = 1.0
-        Cv2 = 0.0
-        
-        if h_tw <= limite_esbeltez:
-            # Caso (G2-3): El alma no pandea
-            Cv1 = 1.0
-            caso_cv = "G2-3 (No pandea)"
+        # Búsqueda O(1) en la tabla del grado si se precalculó; si no, caché por perfil.
+        tabla = _tablas_cortante.get((material_props['Fy'], material_props['E']))
+        i = tabla["indice"].get(seccion_props.get('AISC_Manual_Label')) if tabla else None
+        if i is not None:
+            k = _fila_tabla(tabla, i)
         else:
-            # Caso (G2-4 y G2-5): Pandeo inelástico o elástico
-            limite_inelastico = 1.10 * math.sqrt(kv * E / Fy)
-            limite_elastico = 1.37 * math.sqrt(kv * E / Fy)
-            
-            if h_tw <= limite_inelastico:
-                # Pandeo inelástico (G2-4)
-                Cv1 = limite_inelastico / h_tw
-                caso_cv = "G2-4 (Pandeo inelástico)"
-            elif h_tw <= limite_elastico:
-                # Pandeo elástico (G2-5)
-                Cv2 = (1.51 * kv * E) / (h_tw**2 * Fy)
-                caso_cv = "G2-5 (Pandeo elástico)"
-            else:
-                 raise ValueError("La esbeltez del alma h/tw excede los límites de esta sección.")
-        
-        # El coeficiente final es Cv1 o Cv2, dependiendo del caso
-        Cv = Cv1 if Cv1 != 1.0 else Cv2 if Cv2 != 0 else 1.0
-
-        # --- 4. Calcular Resistencia Nominal a Cortante (Vn) ---
-        # Ecuación G2-1
-        Vn = 0.6 * Fy * Aw * Cv
+            k = obtener_constantes('cortante', material_props, seccion_props,
+                                   lambda: _constantes_cortante(material_props, seccion_props))
 
         # --- 5. Ensamblar Resultados ---
-        resultado["valor_calculado_Vn"] = Vn
+        resultado["valor_calculado_Vn"] = k["Vn"]
         resultado["status"] = "Exitoso"
-        resultado["mensaje"] = f"Cálculo de cortante completado. {caso_cv} aplica."
+        resultado["mensaje"] = f"Cálculo de cortante completado. {k['caso_cv']} aplica."
         resultado["detalles"] = {
-            "Area_alma_Aw_in2": Aw,
-            "Esbeltez_alma_h_tw": h_tw,
-            "Limite_esbeltez": limite_esbeltez,
-            "Coeficiente_Cv": Cv
+            "Area_alma_Aw_in2": k["Aw"],
+            "Esbeltez_alma_h_tw": k["h_tw"],
+            "Limite_esbeltez": k["limite_esbeltez"],
+            "Coeficiente_Cv": k["Cv1"],
+            "Coeficiente_Cv2": k["Cv2"],
+            "Factor_phi_v": k["phi_v"],
+            "Resistencia_diseno_phi_Vn": k["phi_Vn"]
         }
 
     except (KeyError, ValueError, ZeroDivisionError) as e:
@@ -115,7 +223,6 @@ if __name__ == "__main__":
     # --- 1. Configuración ---
     perfil_nombre = "W18X50"
     material = {'Fy': 50, 'E': 29000}
-    phi_v = 0.90 # Factor de reducción LRFD para cortante
 
     # --- 2. Obtener Datos del Perfil ---
     try:
@@ -138,9 +245,10 @@ if __name__ == "__main__":
 
     if resultado['status'] == 'Exitoso':
         Vn = resultado['valor_calculado_Vn']
-        phi_Vn = Vn * phi_v
+        phi_Vn = resultado['detalles']['Resistencia_diseno_phi_Vn']
         print("\nResultados:")
         print(f"  - Esbeltez del alma (h/tw): {resultado['detalles']['Esbeltez_alma_h_tw']:.2f}")
         print(f"  - Coeficiente de Cortante (Cv): {resultado['detalles']['Coeficiente_Cv']:.3f}")
+        print(f"  - Factor de Resistencia (φv):  {resultado['detalles']['Factor_phi_v']:.2f}")
         print(f"  - Resistencia Nominal (Vn):   {Vn:.2f} kips")
         print(f"  - Resistencia de Diseño (φVn): {phi_Vn:.2f} kips")
\ No newline at end of file
@@ -6,6 +6,7 @@ Created on Wed Aug 20 12:41:28 2025
 """
 
 # shear_lag_analysis.py
+import numpy as np
 from typing import Dict, Any
 
 def calcular_factor_u(
@@ -65,9 +66,12 @@ def calcular_factor_u(
                     if 'solo_patin' in elementos:
                         caso_aplicado = "Caso 7 (Alternativo): Conexión al patín"
                         U = 0.90 if bf >= (2/3 * d) else 0.85
-                    elif 'solo_alma' in elementos:
+                    elif 'solo_alma' in elementos and num_tornillos >= 4:
                         caso_aplicado = "Caso 7 (Alternativo): Conexión al alma"
                         U = 0.70
+                    else: # Alma con menos de 4 tornillos por línea: el Caso 7 no aplica
+                        U = 0.85
+                        caso_aplicado = "Caso genérico/conservador"
                 elif tipo == 'L' and num_tornillos >= 4:
                      caso_aplicado = "Caso 8 (Alternativo): Ángulo simple"
                      U = 0.80
@@ -88,4 +92,126 @@ def calcular_factor_u(
     except Exception as e:
         resultado["mensaje"] = f"Error inesperado durante el cálculo de U: {e}"
 
-    return resultado
\ No newline at end of file
+    return resultado
+
+# ==============================================================================
+# TABLA PRECALCULADA DE U POR (PERFIL, CONFIGURACIÓN DE CONEXIÓN)
+# ==============================================================================
+
+# Elementos conectados, en el orden de los códigos de configuración.
+CONFIGURACIONES_CONEXION = ("todos", "solo_patin", "solo_alma", "ala_larga", "ala_corta")
+
+# Casos de la Tabla D3.1, en el orden de los códigos de 'caso_u'.
+CASOS_FACTOR_U = ("Caso 1", "Caso 2", "Caso 7 (Alternativo)", "Caso 8 (Alternativo)", "Caso genérico/conservador")
+
+# Clases por número de tornillos en la línea de carga (índice del último eje de 'U_alternativo').
+_CLASES_TORNILLOS = ("menos de 3", "3", "4 o más")
+
+def construir_tabla_factor_u(secciones: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Precalcula, para cada perfil y cada configuración de conexión, las partes de
+    U que no dependen de la longitud de la conexión (AISC 360-22, Tabla D3.1):
+    la excentricidad x̄ del Caso 2 y el valor alternativo de los Casos 7/8 para
+    cada clase de número de tornillos.
+
+    x̄ se toma de la base de datos cuando existe (C, WT, L) y se calcula con la
+    geometría de las placas en perfiles I (mitad en T al conectar solo los
+    patines, mitad en canal al conectar solo el alma).
+
+    Args:
+        secciones (dict): Salida de 'DatabaseAISC.obtener_arreglos_perfiles'
+            ('AISC_Manual_Label', 'Type', 'd', 'bf', 'tf', 'tw', 'x', 'y').
+
+    Returns:
+        dict: 'x_bar' (perfiles, configuraciones), 'U_alternativo' (perfiles,
+              configuraciones, 3), 'caso_alternativo' con los códigos de
+              CASOS_FACTOR_U, 'Ag' y 'indice' {etiqueta: posición}.
+    """
+    tipo = np.asarray(secciones['Type'])
+    n = tipo.shape[0]
+    def prop(nombre):
+        return np.asarray(secciones.get(nombre, np.full(n, np.nan)), dtype=float)
+    d, bf, tf, tw, x, y = prop('d'), prop('bf'), prop('tf'), prop('tw'), prop('x'), prop('y')
+
+    perfil_i = np.isin(tipo, ['W', 'M', 'S', 'HP'])
+    canal = np.isin(tipo, ['C', 'MC'])
+    te = np.isin(tipo, ['WT', 'MT', 'ST'])
+    angulo = tipo == 'L'
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Perfil I conectado por los patines: cada mitad es una T; x̄ desde la cara exterior del patín.
+        A_patin, h_alma = bf * tf, d / 2 - tf
+        x_te = (A_patin * tf / 2 + h_alma * tw * (tf + h_alma / 2)) / (A_patin + h_alma * tw)
+        # Perfil I conectado por el alma: cada mitad es un canal; x̄ desde el eje del alma.
+        A_alma_mitad, A_patines_mitad = (d - 2 * tf) * tw / 2, bf * tf
+        x_canal = (A_alma_mitad * tw / 4 + A_patines_mitad * bf / 4) / (A_alma_mitad + A_patines_mitad)
+
+    x_bar = np.full((n, len(CONFIGURACIONES_CONEXION)), np.nan)
+    x_bar[:, 0] = 0.0
+    x_bar[:, 1] = np.where(perfil_i, x_te, np.where(te, y, np.nan))
+    x_bar[:, 2] = np.where(perfil_i, x_canal, np.where(canal, x, np.nan))
+    # En ángulos la menor distancia al centroide corresponde al ala larga.
+    x_bar[:, 3] = np.where(angulo, np.fmin(x, y), np.nan)
+    x_bar[:, 4] = np.where(angulo, np.fmax(x, y), np.nan)
+
+    # Valores alternativos por clase de tornillos: (< 3, 3, >= 4).
+    U_alt = np.full((n, len(CONFIGURACIONES_CONEXION), 3), 0.85)
+    caso = np.full(U_alt.shape, 4, dtype=np.int8)
+    U_alt[:, 0, :], caso[:, 0, :] = 1.0, 0
+    # Caso 7: patines de perfiles I con 3 o más tornillos; alma con 4 o más.
+    U_patin = np.where(bf >= 2 / 3 * d, 0.90, 0.85)
+    U_alt[perfil_i, 1, 1:] = U_patin[perfil_i, None]
+    caso[perfil_i, 1, 1:] = 2
+    U_alt[perfil_i, 2, 2], caso[perfil_i, 2, 2] = 0.70, 2
+    # Caso 8: ángulos simples, 0.80 con 4 o más tornillos y 0.60 con menos.
+    for configuracion in (3, 4):
+        U_alt[angulo, configuracion, :] = 0.60
+        U_alt[angulo, configuracion, 2] = 0.80
+        caso[angulo, configuracion, :] = 3
+
+    return {
+        "x_bar": x_bar, "U_alternativo": U_alt, "caso_alternativo": caso,
+        "Ag": prop('A'),
+        "indice": {etiqueta: i for i, etiqueta in enumerate(secciones['AISC_Manual_Label'])}
+    }
+
+def consultar_factor_u(
+    tabla: Dict[str, Any],
+    indices_perfil: Any,
+    configuracion: Any,
+    L: Any,
+    num_tornillos_linea: Any
+) -> Dict[str, Any]:
+    """
+    Obtiene U para arreglos de miembros a partir de la tabla de
+    'construir_tabla_factor_u'. Igual que 'calcular_factor_u', usa el Caso 2
+    (U = 1 - x̄/L) cuando hay longitud de conexión y x̄, y si no el valor alternativo.
+
+    Args:
+        tabla (dict): Tabla precalculada de U.
+        indices_perfil (array_like): Posición de cada perfil en la tabla.
+        configuracion (array_like): Códigos o nombres de CONFIGURACIONES_CONEXION.
+        L (array_like): Longitud de la conexión (0 si no aplica).
+        num_tornillos_linea (array_like): Tornillos en la línea de carga.
+
+    Returns:
+        dict: 'U' y 'caso_u' (códigos de CASOS_FACTOR_U), arreglos de forma (n,).
+    """
+    configuracion = np.asarray(configuracion)
+    if configuracion.dtype.kind in 'US':
+        codigos = {nombre: i for i, nombre in enumerate(CONFIGURACIONES_CONEXION)}
+        configuracion = np.array([codigos[c] for c in configuracion.ravel()]).reshape(configuracion.shape)
+    indices_perfil = np.asarray(indices_perfil, dtype=np.intp)
+    L = np.asarray(L, dtype=float)
+    num_tornillos = np.asarray(num_tornillos_linea)
+    clase_tornillos = np.where(num_tornillos >= 4, 2, np.where(num_tornillos >= 3, 1, 0))
+
+    x_bar = tabla["x_bar"][indices_perfil, configuracion]
+    caso_2 = (configuracion != 0) & (L > 0) & (x_bar > 0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        U_caso_2 = 1 - x_bar / L
+    U = np.where(caso_2, U_caso_2, tabla["U_alternativo"][indices_perfil, configuracion, clase_tornillos])
+    caso = np.where(caso_2, 1, tabla["caso_alternativo"][indices_perfil, configuracion, clase_tornillos])
+
+    # El valor de U no puede ser mayor a 1.0
+    return {"U": np.minimum(U, 1.0), "caso_u": caso.astype(np.int8)}
@@ -6,9 +6,10 @@ Created on Wed Aug 20 12:43:31 2025
 """
 
 # tension_analysis.py
+import numpy as np
 from typing import Dict, Any
 # ¡Importamos nuestra nueva función independiente!
-from shear_lag_analysis import calcular_factor_u
+from shear_lag_analysis import calcular_factor_u, consultar_factor_u
 
 def calcular_resistencia_tension(
     material_props: Dict[str, float],
@@ -55,8 +56,11 @@ def calcular_resistencia_tension(
         Pn_fractura = Fu * Ae
 
         # --- 4. Determinar Resistencia Nominal (Pn) ---
-        Pn = min(Pn_fluencia, Pn_fractura)
-        estado_limite_controla = "Fluencia" if Pn == Pn_fluencia else "Fractura"
+        # El estado que controla es el de menor φPn, no el de menor Pn (φ distintos).
+        if 0.90 * Pn_fluencia <= 0.75 * Pn_fractura:
+            Pn, estado_limite_controla = Pn_fluencia, "Fluencia"
+        else:
+            Pn, estado_limite_controla = Pn_fractura, "Fractura"
 
         # --- 5. Llenar el Diccionario de Resultados ---
         resultado["valor_calculado_Pn"] = Pn
@@ -74,4 +78,92 @@ def calcular_resistencia_tension(
     except Exception as e:
         resultado["mensaje"] = f"Error inesperado: {e}."
 
-    return resultado
\ No newline at end of file
+    return resultado
+
+
+# ==============================================================================
+# VERSIÓN VECTORIZADA: ARREGLOS DE MIEMBROS
+# ==============================================================================
+
+# Códigos del estado límite que controla en 'estado_limite_controla'.
+ESTADOS_LIMITE_TENSION = ("Fluencia", "Fractura")
+
+def calcular_resistencia_tension_vectorizada(
+    material_props: Dict[str, Any],
+    tabla_u: Dict[str, Any],
+    miembros: Dict[str, Any]
+) -> Dict[str, Any]:
+    """
+    Calcula Pn por fluencia en el área bruta (D2-1) y fractura en el área neta
+    efectiva (D2-2) para muchos miembros a la vez. U se obtiene de la tabla
+    precalculada por (perfil, configuración de conexión) de
+    'shear_lag_analysis.construir_tabla_factor_u', sin llamar a
+    'calcular_factor_u' por miembro.
+
+    Args:
+        material_props (dict): 'Fy' y 'Fu' (escalares o arreglos de forma (n,)).
+        tabla_u (dict): Tabla de U construida para la misma lista de perfiles.
+        miembros (dict): Arreglos de forma (n,):
+            - 'perfil' (etiquetas AISC) o 'indice_perfil' (posición en la tabla).
+            - 'configuracion': nombres o códigos de CONFIGURACIONES_CONEXION.
+            - 'L': Longitud de la conexión (in); 0 si no aplica (opcional).
+            - 'num_tornillos_linea': Tornillos en la línea de carga (opcional).
+            - 'An': Área neta (in^2); NaN o ausente = Ag (opcional).
+
+    Returns:
+        dict: 'estado_limite_controla' (índices de ESTADOS_LIMITE_TENSION, el
+              estado que fija φPn), 'valor_calculado_Pn' y 'phi_Pn' (LRFD: 0.90
+              fluencia, 0.75 fractura) de ese estado,
+              más Pn por estado límite, U y Ae en 'detalles'.
+    """
+    resultado = {
+        "valor_calculado_Pn": None, "phi_Pn": None, "estado_limite_controla": None,
+        "status": "Error", "referencia_norma": "AISC 360-22, Cap. D", "mensaje": "", "detalles": {}
+    }
+
+    try:
+        # --- 1. Extraer Datos de Entrada ---
+        if 'indice_perfil' in miembros:
+            indices = np.asarray(miembros['indice_perfil'], dtype=np.intp)
+        else:
+            indices = np.array([tabla_u['indice'][p] for p in miembros['perfil']], dtype=np.intp)
+        n = indices.shape[0]
+        Fy = np.asarray(material_props['Fy'], dtype=float)
+        Fu = np.asarray(material_props['Fu'], dtype=float)
+        Ag = tabla_u['Ag'][indices]
+        An = np.asarray(miembros.get('An', np.full(n, np.nan)), dtype=float)
+        An = np.where(np.isnan(An), Ag, An)
+
+        # --- 2. Estado Límite de Fluencia (AISC D2-1) ---
+        Pn_fluencia = Fy * Ag
+
+        # --- 3. Estado Límite de Fractura (AISC D2-2) ---
+        factor_u = consultar_factor_u(tabla_u, indices, miembros['configuracion'],
+                                      miembros.get('L', np.zeros(n)),
+                                      miembros.get('num_tornillos_linea', np.zeros(n)))
+        Ae = An * factor_u['U']
+        Pn_fractura = Fu * Ae
+
+        # --- 4. Determinar Resistencia Nominal (Pn) ---
+        # El estado que controla es el de menor φPn, no el de menor Pn (φ distintos).
+        phi_Pn_fluencia, phi_Pn_fractura = 0.90 * Pn_fluencia, 0.75 * Pn_fractura
+        control = np.where(phi_Pn_fluencia <= phi_Pn_fractura, 0, 1).astype(np.int8)
+
+        resultado["valor_calculado_Pn"] = np.where(control == 0, Pn_fluencia, Pn_fractura)
+        resultado["phi_Pn"] = np.where(control == 0, phi_Pn_fluencia, phi_Pn_fractura)
+        resultado["estado_limite_controla"] = control
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = f"Cálculo de tensión vectorizado completado para {n} miembros."
+        resultado["detalles"] = {
+            "Pn_fluencia_kips": Pn_fluencia, "Pn_fractura_kips": Pn_fractura,
+            "Area_bruta_Ag_in2": Ag, "Area_neta_An_in2": An,
+            "Factor_cortante_diferido_U": factor_u['U'], "caso_u": factor_u['caso_u'],
+            "Area_neta_efectiva_Ae_in2": Ae, "estados_limite": ESTADOS_LIMITE_TENSION
+        }
+
+    except (KeyError, ValueError, IndexError) as e:
+        resultado["mensaje"] = f"Error en los datos de entrada: {e}."
+    except Exception as e:
+        resultado["mensaje"] = f"Error inesperado: {e}."
+
+    return resultado
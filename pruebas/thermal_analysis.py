@@ -6,9 +6,17 @@ Created on Wed Aug 20 12:52:36 2025
 """
 
 # thermal_analysis.py
-import math
+import numpy as np
 from typing import Dict, Any
 
+from fiber_section_analysis import biseccion_vectorizada
+
+# Las constantes del modelo NIST están calibradas en MPa.
+MPA_POR_KSI = 6.894757
+
+# Partes del perfil I con temperatura propia, en el orden del último eje de 'temperaturas'.
+PARTES_PERFIL_INCENDIO = ("patin_superior", "alma", "patin_inferior")
+
 def modelo_nist_temperatura(
     strain: float,
     fy_nominal: float,
@@ -37,28 +45,15 @@ def modelo_nist_temperatura(
         "mensaje": ""
     }
     try:
-        # Fórmulas del modelo NIST para los parámetros K y n
         # Nota: Las constantes del script original (734, 575, etc.) parecen
         # estar calibradas para unidades específicas (posiblemente MPa y °C).
         # Se asume que Fy se introduce en ksi y se convierte si es necesario,
         # aunque el script original parece usarlo directamente.
         # Mantendremos la consistencia con el script original.
-        
+        # Las fórmulas de K y n están en 'esfuerzo_nist_temperatura'.
         T = temperatura_c
-        Fy = fy_nominal
-
-        # Coeficiente de resistencia K
-        K = (734 + 0.315 * Fy) * math.exp(-(T / 575)**4.92)
-
-        # Exponente de endurecimiento por deformación n
-        n = (0.329 - 0.000423 * Fy) * math.exp(-(T / 637)**4.51)
-
-        # Cálculo de un esfuerzo intermedio (similar a un esfuerzo verdadero)
-        sigma = K * (strain**n) if strain > 0 else 0
+        stress = float(esfuerzo_nist_temperatura(strain, fy_nominal, T))
 
-        # Conversión a esfuerzo ingenieril (stress)
-        stress = sigma / (1 + strain) if (1 + strain) != 0 else sigma
-            
         resultado["valor_calculado_stress"] = stress
         resultado["status"] = "Exitoso"
         resultado["mensaje"] = f"Esfuerzo calculado para T={T}°C."
@@ -68,9 +63,423 @@ def modelo_nist_temperatura(
 
     return resultado
 
+
+# ==============================================================================
+# VERSIONES PARA ARREGLOS Y ANÁLISIS DE SECCIONES EN INCENDIO
+# ==============================================================================
+
+def parametros_nist_temperatura(fy_nominal: Any, temperatura_c: Any) -> tuple:
+    """Coeficiente de resistencia K y exponente n del modelo NIST, difundidos entre Fy y T."""
+    Fy = np.asarray(fy_nominal, dtype=float)
+    T = np.asarray(temperatura_c, dtype=float)
+    K = (734 + 0.315 * Fy) * np.exp(-(T / 575)**4.92)
+    n = (0.329 - 0.000423 * Fy) * np.exp(-(T / 637)**4.51)
+    return K, n
+
+def esfuerzo_nist_temperatura(strain: Any, fy_nominal: Any, temperatura_c: Any) -> np.ndarray:
+    """
+    Versión para arreglos de 'modelo_nist_temperatura': σ = K(T)·ε^n(T)/(1 + ε)
+    para ε > 0 y 0 en otro caso, con deformaciones, Fy y temperaturas que se
+    difunden entre sí. Por ejemplo, una superficie esfuerzo-deformación-
+    temperatura completa es
+    'esfuerzo_nist_temperatura(strains[:, None], fy, temperaturas[None, :])'.
+    """
+    strain = np.asarray(strain, dtype=float)
+    K, n = parametros_nist_temperatura(fy_nominal, temperatura_c)
+    positiva = strain > 0
+    e = np.where(positiva, strain, 1.0)
+    return np.where(positiva, K * e**n / (1 + e), 0.0)
+
+def modulo_elastico_nist(E: Any, temperatura_c: Any) -> np.ndarray:
+    """
+    Módulo elástico a temperatura elevada del modelo NIST (Seif et al., 2016):
+    E(T) = E·exp(-½(T/639)^3.768 - ½(T/1650)^1.834).
+    """
+    T = np.asarray(temperatura_c, dtype=float)
+    return np.asarray(E, dtype=float) * np.exp(-0.5 * (T / 639)**3.768 - 0.5 * (T / 1650)**1.834)
+
+def esfuerzo_fibra_incendio(strain: Any, material_props: Dict[str, float], temperatura_c: Any) -> np.ndarray:
+    """
+    Esfuerzo (ksi) de fibras a temperatura elevada para el análisis de secciones:
+    la curva NIST en MPa (con Fy convertido de ksi), limitada por la rama
+    elástica E(T)·ε y extendida con simetría a compresión.
+    """
+    strain = np.asarray(strain, dtype=float)
+    e = np.abs(strain)
+    potencia = esfuerzo_nist_temperatura(e, material_props['Fy'] * MPA_POR_KSI, temperatura_c) / MPA_POR_KSI
+    return np.copysign(np.minimum(modulo_elastico_nist(material_props['E'], temperatura_c) * e, potencia), strain)
+
+def calcular_momento_curvatura_incendio(
+    secciones: Dict[str, Any],
+    material_props: Dict[str, float],
+    temperaturas: Any,
+    analysis_params: Dict[str, Any] = None,
+    tam_bloque: int = 256
+) -> Dict[str, Any]:
+    """
+    Calcula las curvas momento-curvatura y el momento resistente a temperatura
+    elevada de muchos perfiles I a la vez, con temperatura distinta en cada
+    patín y en el alma (ver PARTES_PERFIL_INCENDIO).
+
+    Todos los perfiles usan las mismas capas de fibras a lo alto de la sección,
+    así que las deformaciones de todos los perfiles × curvaturas × fibras de un
+    bloque son una sola difusión de NumPy. Como la temperatura no es uniforme el
+    eje neutro se desplaza: para cada (perfil, curvatura) se busca la deformación
+    axial ε0 que cumple -Σσ·A = P con bisección vectorizada. Las deformaciones son
+    mecánicas (no se incluye la expansión térmica).
+
+    Args:
+        secciones (dict): Arreglos (n,) con 'd', 'bf', 'tf', 'tw' (in).
+        material_props (dict): 'E' y 'Fy' (ksi) a temperatura ambiente.
+        temperaturas (array_like): Temperaturas (°C) difundibles a (n, 3), en el orden
+            (patín superior, alma, patín inferior).
+        analysis_params (dict, opcional):
+            - 'fibras_patin': Capas por patín (8 por omisión).
+            - 'fibras_alma': Capas en el alma (40 por omisión).
+            - 'num_pasos': Número de curvaturas (50 por omisión).
+            - 'deformacion_max': Deformación de la fibra extrema en la última
+              curvatura, φmax = εmax/(d/2) (0.02 por omisión).
+            - 'P': Carga axial constante (kips, compresión positiva; 0 por omisión).
+        tam_bloque (int): Perfiles por bloque, para acotar la memoria.
+
+    Returns:
+        dict: 'curvaturas', 'momentos' (kip-in) y 'deformacion_axial' de forma
+              (n, pasos) y 'momento_resistente' (n,), el máximo de cada curva; en
+              'detalles' el momento plástico Fy·Z de las fibras, el momento
+              resistente del mismo modelo a 20 °C y el factor de reducción
+              Mn(T)/Mn(20 °C).
+    """
+    resultado = {
+        "status": "Error",
+        "mensaje": "",
+        "curvaturas": None,
+        "momentos": None,
+        "deformacion_axial": None,
+        "momento_resistente": None,
+        "detalles": {}
+    }
+
+    try:
+        # --- 1. Extraer propiedades y parámetros ---
+        params = analysis_params or {}
+        def prop(nombre):
+            return np.atleast_1d(np.asarray(secciones[nombre], dtype=float))
+        d, bf, tf, tw = prop('d'), prop('bf'), prop('tf'), prop('tw')
+        E, Fy = material_props['E'], material_props['Fy']
+        fibras_patin = int(params.get('fibras_patin', 8))
+        fibras_alma = int(params.get('fibras_alma', 40))
+        num_pasos = int(params.get('num_pasos', 50))
+        deformacion_max = float(params.get('deformacion_max', 0.02))
+        P = float(params.get('P', 0.0))
+        temperaturas = np.broadcast_to(np.asarray(temperaturas, dtype=float), (d.size, 3))
+
+        # --- 2. Capas de fibras (n, fibras): patín superior, alma y patín inferior ---
+        capas_patin = (np.arange(fibras_patin) + 0.5) / fibras_patin
+        capas_alma = (np.arange(fibras_alma) + 0.5) / fibras_alma
+        h_alma = d - 2 * tf
+        y_fibras = np.concatenate([(h_alma / 2)[:, None] + capas_patin[None, :] * tf[:, None],
+                                   (capas_alma[None, :] - 0.5) * h_alma[:, None],
+                                   -(h_alma / 2)[:, None] - capas_patin[None, :] * tf[:, None]], axis=1)
+        A_fibras = np.concatenate([np.repeat((bf * tf / fibras_patin)[:, None], fibras_patin, axis=1),
+                                   np.repeat((tw * h_alma / fibras_alma)[:, None], fibras_alma, axis=1),
+                                   np.repeat((bf * tf / fibras_patin)[:, None], fibras_patin, axis=1)], axis=1)
+        parte = np.repeat(np.arange(3), [fibras_patin, fibras_alma, fibras_patin])
+        T_fibras = temperaturas[:, parte]
+
+        # --- 3. Curvaturas (n, pasos) ---
+        curvaturas = (deformacion_max / (d / 2))[:, None] * np.linspace(0.0, 1.0, num_pasos)[None, :]
+
+        # --- 4. Equilibrio axial e integración por bloques de perfiles ---
+        def curvas(T_fibras):
+            momentos = np.empty_like(curvaturas)
+            deformacion_axial = np.empty_like(curvaturas)
+            for inicio in range(0, d.shape[0], tam_bloque):
+                b = slice(inicio, inicio + tam_bloque)
+                y, A, T = y_fibras[b, None, :], A_fibras[b, None, :], T_fibras[b, None, :]
+                phi = curvaturas[b, :, None]
+
+                def fuerza_axial(e0):
+                    return np.sum(esfuerzo_fibra_incendio(e0[..., None] + phi * y, material_props, T) * A, axis=-1)
+
+                limite = curvaturas[b] * (d[b] / 2)[:, None] + 0.1
+                # Fibras con tensión positiva, P con compresión positiva.
+                e0 = biseccion_vectorizada(fuerza_axial, np.full(limite.shape, -P), -limite, limite, iteraciones=40)
+                esfuerzos = esfuerzo_fibra_incendio(e0[..., None] + phi * y, material_props, T)
+                momentos[b] = np.sum(esfuerzos * A * y, axis=-1)
+                deformacion_axial[b] = e0
+            return momentos, deformacion_axial
+
+        momentos, deformacion_axial = curvas(T_fibras)
+        momento_resistente = momentos.max(axis=1)
+        # La curva NIST supera Fy a deformaciones grandes, así que Mn(T)/Mp pasa de 1
+        # a 20 °C; el factor de reducción se toma respecto al mismo modelo a 20 °C.
+        momento_20c = curvas(np.full_like(T_fibras, 20.0))[0].max(axis=1)
+        Mp = Fy * np.sum(A_fibras * np.abs(y_fibras), axis=1)
+
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = f"Curvas momento-curvatura en incendio calculadas para {d.shape[0]} perfiles."
+        resultado["curvaturas"] = curvaturas
+        resultado["momentos"] = momentos
+        resultado["deformacion_axial"] = deformacion_axial
+        resultado["momento_resistente"] = momento_resistente
+        resultado["detalles"] = {
+            "Mp_fibras_kip_in": Mp,
+            "momento_resistente_20c_kip_in": momento_20c,
+            "factor_reduccion": momento_resistente / momento_20c,
+            "temperaturas_c": temperaturas,
+            "partes": PARTES_PERFIL_INCENDIO
+        }
+
+    except KeyError as e:
+        resultado["mensaje"] = f"Error: Falta la propiedad requerida: {e}."
+    except Exception as e:
+        resultado["mensaje"] = f"Error inesperado en el análisis: {e}."
+
+    return resultado
+
+# ==============================================================================
+# RESISTENCIA AL FUEGO EN EL TIEMPO (MIEMBROS SIN PROTECCIÓN)
+# ==============================================================================
+
+# Tipos de miembro en 'miembros["tipo"]' de 'analizar_resistencia_fuego'.
+TIPOS_MIEMBRO_INCENDIO = ("viga", "columna")
+
+# Lados expuestos por omisión: la viga soporta la losa (3 lados), la columna 4.
+LADOS_EXPUESTOS_OMISION = {"viga": 3, "columna": 4}
+
+# Transferencia de calor (EN 1993-1-2 y EN 1991-1-2).
+DENSIDAD_ACERO_KG_M3 = 7850.0
+CONVECCION_W_M2K = 25.0
+EMISIVIDAD_RESULTANTE = 0.7
+STEFAN_BOLTZMANN = 5.67e-8
+M_POR_IN = 0.0254
+
+def curva_iso_834(t_min: Any) -> np.ndarray:
+    """Temperatura de los gases de la curva estándar ISO 834 (°C): 20 + 345·log10(8t + 1)."""
+    return 20 + 345 * np.log10(8 * np.asarray(t_min, dtype=float) + 1)
+
+def curva_astm_e119(t_min: Any) -> np.ndarray:
+    """
+    Curva ASTM E119 en su forma paramétrica (Lie, 1995), con t en horas:
+    T = 20 + 750·(1 - exp(-3.79553·√t)) + 170.41·√t (°C).
+    """
+    raiz = np.sqrt(np.asarray(t_min, dtype=float) / 60)
+    return 20 + 750 * (1 - np.exp(-3.79553 * raiz)) + 170.41 * raiz
+
+CURVAS_INCENDIO = {"ISO834": curva_iso_834, "ASTM_E119": curva_astm_e119}
+
+def calor_especifico_acero(temperatura_c: Any) -> np.ndarray:
+    """Calor específico del acero ca(T) en J/(kg·K) según EN 1993-1-2, 3.4.1.2."""
+    T = np.clip(np.asarray(temperatura_c, dtype=float), 20.0, 1200.0)
+    return np.select(
+        [T < 600, T < 735, T < 900],
+        [425 + 0.773 * T - 1.69e-3 * T**2 + 2.22e-6 * T**3,
+         666 + 13002 / (738 - np.minimum(T, 734.9)),
+         545 + 17820 / (np.maximum(T, 731.1) - 731)],
+        650.0)
+
+def factores_seccion(miembros: Dict[str, Any]) -> tuple:
+    """
+    Factor de sección Am/V (1/m) y factor de sombra ksh de perfiles I sin protección
+    (EN 1993-1-2, 4.2.5.1), a partir de la geometría de la tabla de perfiles.
+    Con 'Am_V' en 'miembros' se usa ese valor en lugar del calculado.
+    """
+    d, bf, tw, A = (np.asarray(miembros[k], dtype=float) for k in ('d', 'bf', 'tw', 'A'))
+    lados = np.asarray(miembros['lados_expuestos'])
+    tres = lados == 3
+    # Perímetro del contorno y de la caja que lo envuelve (sin el patín superior si son 3 lados).
+    contorno = 2 * d + np.where(tres, 3, 4) * bf - 2 * tw
+    caja = 2 * d + np.where(tres, 1, 2) * bf
+    Am_V = np.asarray(miembros['Am_V'], dtype=float) if 'Am_V' in miembros else contorno / A / M_POR_IN
+    return Am_V, 0.9 * caja / contorno
+
+def factores_reduccion_nist(material_props: Dict[str, float], temperatura_c: Any,
+                            deformacion_referencia: float = 0.02) -> tuple:
+    """
+    Factores de reducción de Fy y E del modelo NIST: ky es el esfuerzo a la
+    deformación de referencia a la temperatura T entre el de 20 °C, y kE = E(T)/E.
+    """
+    Fy_mpa = material_props['Fy'] * MPA_POR_KSI
+    k_y = (esfuerzo_nist_temperatura(deformacion_referencia, Fy_mpa, temperatura_c)
+           / esfuerzo_nist_temperatura(deformacion_referencia, Fy_mpa, 20.0))
+    return k_y, modulo_elastico_nist(1.0, temperatura_c)
+
+def _avanzar_temperatura_acero(Ta, Tg, Am_V, k_sh, dt):
+    """
+    Un paso del modelo de capacidad concentrada, ρ·ca·dTa/dt = ksh·(Am/V)·ḣnet,
+    con el flujo linealizado en el paso: h = αc + ε·σ·(Tg⁴ - Ta⁴)/(Tg - Ta) y
+    Ta tiende a Tg de forma exponencial, así que es estable con pasos largos.
+    """
+    Tg_k, Ta_k = Tg + 273.15, Ta + 273.15
+    h = CONVECCION_W_M2K + EMISIVIDAD_RESULTANTE * STEFAN_BOLTZMANN * (Tg_k**2 + Ta_k**2) * (Tg_k + Ta_k)
+    tasa = k_sh * Am_V * h / (DENSIDAD_ACERO_KG_M3 * calor_especifico_acero(Ta))
+    return Ta + (Tg - Ta) * -np.expm1(-tasa * dt)
+
+def _ratio_incendio(miembros, material_props, es_columna, temperatura_c, phi, deformacion_referencia):
+    """Demanda entre resistencia reducida por temperatura (AISC 360-22, Apéndice 4)."""
+    k_y, k_E = factores_reduccion_nist(material_props, temperatura_c, deformacion_referencia)
+    Fy_T = k_y * material_props['Fy']
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Columnas: Fcr(T) = 0.42^√(Fy(T)/Fe(T))·Fy(T), Fe(T) = π²E(T)/(KL/r)² (A-4-9).
+        Fe_T = np.pi**2 * k_E * material_props['E'] / miembros['esbeltez']**2
+        Fcr_T = 0.42**np.sqrt(Fy_T / Fe_T) * Fy_T
+        capacidad = phi * np.where(es_columna, Fcr_T * miembros['A'], Fy_T * miembros['Zx'])
+        return miembros['demanda'] / capacidad
+
+def analizar_resistencia_fuego(
+    miembros: Dict[str, Any],
+    material_props: Dict[str, float],
+    curva: str = "ISO834",
+    duracion_min: float = 240.0,
+    paso_min: float = 1.0,
+    subpasos_refinamiento: int = 30,
+    phi: float = 0.90,
+    deformacion_referencia: float = 0.02
+) -> Dict[str, Any]:
+    """
+    Calcula el minuto en que cada miembro sin protección pierde su capacidad
+    bajo una curva de incendio estándar, para muchos miembros a la vez.
+
+    La temperatura del acero avanza con el modelo de capacidad concentrada
+    (EN 1993-1-2, 4.2.5.1), con Am/V y ksh calculados de la geometría de cada
+    perfil. En cada paso la resistencia se reduce con los factores del modelo
+    NIST (ver 'factores_reduccion_nist'): vigas con φ·Fy(T)·Zx y columnas con el
+    pandeo a temperatura elevada del Apéndice 4 del AISC 360-22.
+
+    Todos los miembros avanzan juntos con pasos gruesos. Solo los miembros cuya
+    razón demanda/capacidad cruza 1 en un paso se vuelven a integrar dentro de
+    ese paso con subpasos finos, y el tiempo de falla se interpola en el subpaso.
+
+    Args:
+        miembros (dict): Arreglos (n,) con:
+            - 'tipo': "viga" o "columna" (TIPOS_MIEMBRO_INCENDIO).
+            - 'd', 'bf', 'tw' (in) y 'A' (in^2) de la tabla de perfiles.
+            - 'Zx' (in^3) en vigas.
+            - 'demanda': Mu (kip-in) en vigas y Pu (kips) en columnas, con la
+              combinación de carga para incendio.
+            - 'KL' (in) y 'ry' (in) en columnas.
+            - Opcionales: 'lados_expuestos' (3 o 4) y 'Am_V' (1/m).
+        material_props (dict): 'E' y 'Fy' (ksi) a temperatura ambiente.
+        curva (str): Curva de CURVAS_INCENDIO.
+        duracion_min (float): Duración del incendio (min).
+        paso_min (float): Paso grueso (min).
+        subpasos_refinamiento (int): Subpasos dentro del paso en que falla un miembro.
+        phi (float): Factor de resistencia.
+        deformacion_referencia (float): Deformación a la que se toma Fy(T) en el modelo NIST.
+
+    Returns:
+        dict: Arreglos (n,) 'tiempo_falla_min' (inf si resiste toda la duración),
+              'temperatura_falla_c' y 'ratio_inicial'; en 'detalles', Am/V, ksh,
+              la temperatura final del acero y la curva de gases en los pasos gruesos.
+    """
+    resultado = {
+        "status": "Error",
+        "mensaje": "",
+        "tiempo_falla_min": None,
+        "temperatura_falla_c": None,
+        "ratio_inicial": None,
+        "detalles": {}
+    }
+
+    try:
+        if curva not in CURVAS_INCENDIO:
+            raise ValueError(f"Curva de incendio no soportada: '{curva}'. Use una de {list(CURVAS_INCENDIO)}")
+        curva_gases = CURVAS_INCENDIO[curva]
+        tipo = np.atleast_1d(np.asarray(miembros['tipo']))
+        if not np.isin(tipo, TIPOS_MIEMBRO_INCENDIO).all():
+            raise ValueError(f"Los tipos de miembro deben ser {TIPOS_MIEMBRO_INCENDIO}")
+        n = tipo.size
+        es_columna = tipo == "columna"
+
+        def arreglo(clave, omision=np.nan):
+            return np.broadcast_to(np.asarray(miembros.get(clave, omision), dtype=float), (n,))
+        datos = {k: arreglo(k) for k in ('d', 'bf', 'tw', 'A', 'demanda')}
+        datos['Zx'] = arreglo('Zx')
+        datos['esbeltez'] = np.where(es_columna, arreglo('KL') / arreglo('ry'), 1.0)
+        # Un dato faltante daría un ratio NaN, y NaN >= 1.0 nunca marca la falla.
+        for clave in ('d', 'bf', 'tw', 'A', 'demanda'):
+            if not np.isfinite(datos[clave]).all():
+                raise ValueError(f"Falta '{clave}' (o no es finito) en algún miembro")
+        if not np.isfinite(datos['Zx'][~es_columna]).all():
+            raise ValueError("Las vigas requieren 'Zx' finito")
+        if not (np.isfinite(arreglo('KL')[es_columna]).all() and np.isfinite(arreglo('ry')[es_columna]).all()):
+            raise ValueError("Las columnas requieren 'KL' y 'ry' finitos")
+        datos['lados_expuestos'] = np.where(
+            np.isnan(arreglo('lados_expuestos')),
+            np.where(es_columna, LADOS_EXPUESTOS_OMISION["columna"], LADOS_EXPUESTOS_OMISION["viga"]),
+            arreglo('lados_expuestos'))
+        if 'Am_V' in miembros:
+            datos['Am_V'] = arreglo('Am_V')
+        Am_V, k_sh = factores_seccion(datos)
+
+        def ratio(temperatura, indices=slice(None)):
+            return _ratio_incendio({k: v[indices] for k, v in datos.items()}, material_props,
+                                   es_columna[indices], temperatura, phi, deformacion_referencia)
+
+        # --- Pasos gruesos para todos los miembros ---
+        tiempos = np.arange(0.0, duracion_min + 0.5 * paso_min, paso_min)
+        Tg = curva_gases(tiempos)
+        Ta = np.full(n, 20.0)
+        ratio_inicial = ratio(Ta)
+        if np.isnan(ratio_inicial).any():
+            raise ValueError(f"Ratio D/C no definido a 20 °C en los miembros {np.flatnonzero(np.isnan(ratio_inicial)).tolist()}")
+        tiempo_falla = np.where(ratio_inicial >= 1.0, 0.0, np.inf)
+        temperatura_falla = np.where(ratio_inicial >= 1.0, 20.0, np.nan)
+        activos = np.flatnonzero(ratio_inicial < 1.0)
+        for k in range(1, tiempos.size):
+            if activos.size == 0:
+                break
+            T_inicio = Ta[activos]
+            # Gases a la mitad del paso, para no sesgar la integración.
+            Tg_medio = curva_gases(0.5 * (tiempos[k - 1] + tiempos[k]))
+            Ta[activos] = _avanzar_temperatura_acero(T_inicio, Tg_medio, Am_V[activos], k_sh[activos],
+                                                     paso_min * 60)
+            ratio_paso = ratio(Ta[activos], activos)
+            if np.isnan(ratio_paso).any():
+                raise ValueError(f"Ratio D/C no definido a {tiempos[k]:g} min")
+            falla = ratio_paso >= 1.0
+            if not falla.any():
+                continue
+
+            # --- Refinamiento del evento: subpasos finos solo para los que fallan ---
+            idx = activos[falla]
+            T_sub, r_prev = T_inicio[falla], ratio(T_inicio[falla], idx)
+            t_falla = np.full(idx.size, tiempos[k])
+            T_falla = Ta[idx].copy()
+            pendientes = np.ones(idx.size, dtype=bool)
+            dt = paso_min / subpasos_refinamiento
+            for j in range(1, subpasos_refinamiento + 1):
+                t_medio = tiempos[k - 1] + (j - 0.5) * dt
+                T_nueva = _avanzar_temperatura_acero(T_sub, curva_gases(t_medio), Am_V[idx], k_sh[idx], dt * 60)
+                r_nuevo = ratio(T_nueva, idx)
+                cruza = pendientes & (r_nuevo >= 1.0)
+                fraccion = np.clip((1.0 - r_prev) / np.where(cruza, r_nuevo - r_prev, 1.0), 0.0, 1.0)
+                t_falla = np.where(cruza, tiempos[k - 1] + (j - 1 + fraccion) * dt, t_falla)
+                T_falla = np.where(cruza, T_sub + fraccion * (T_nueva - T_sub), T_falla)
+                pendientes &= ~cruza
+                T_sub, r_prev = T_nueva, r_nuevo
+            tiempo_falla[idx] = t_falla
+            temperatura_falla[idx] = T_falla
+            activos = activos[~falla]
+
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = (f"Resistencia al fuego ({curva}) calculada para {n} miembros; "
+                                f"{int(np.isfinite(tiempo_falla).sum())} fallan antes de {duracion_min:g} min.")
+        resultado["tiempo_falla_min"] = tiempo_falla
+        resultado["temperatura_falla_c"] = temperatura_falla
+        resultado["ratio_inicial"] = ratio_inicial
+        resultado["detalles"] = {"Am_V_1_m": Am_V, "k_sh": k_sh, "temperatura_final_acero_c": Ta,
+                                 "tiempos_min": tiempos, "temperatura_gases_c": Tg}
+
+    except (KeyError, ValueError) as e:
+        resultado["mensaje"] = f"Error en los datos de entrada: {e}."
+    except Exception as e:
+        resultado["mensaje"] = f"Error inesperado en el análisis: {e}."
+
+    return resultado
+
 # --- EJEMPLO DE USO ---
 if __name__ == "__main__":
-    import numpy as np
     import matplotlib.pyplot as plt
 
     fy_acero = 50 # ksi
@@ -82,12 +491,10 @@ if __name__ == "__main__":
     plt.style.use('seaborn-v0_8-whitegrid')
     fig, ax = plt.subplots(figsize=(10, 7))
 
-    for temp in temperaturas_a_probar:
-        stresses = [
-            modelo_nist_temperatura(s, fy_acero, temp)["valor_calculado_stress"]
-            for s in strains
-        ]
-        ax.plot(strains, stresses, label=f'{temp}°C', linewidth=2)
+    # Superficie esfuerzo-deformación-temperatura en una sola llamada: (strains, temperaturas).
+    superficie = esfuerzo_nist_temperatura(strains[:, None], fy_acero, np.array(temperaturas_a_probar)[None, :])
+    for j, temp in enumerate(temperaturas_a_probar):
+        ax.plot(strains, superficie[:, j], label=f'{temp}°C', linewidth=2)
 
     ax.set_title(f'Modelo Esfuerzo-Deformación del Acero (Fy={fy_acero} ksi) vs. Temperatura', fontsize=16)
     ax.set_xlabel('Deformación Unitaria (strain)', fontsize=12)
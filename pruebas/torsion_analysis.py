@@ -7,8 +7,58 @@ Created on Wed Aug 20 15:43:41 2025
 
 # torsion_analysis.py
 import math
+import numpy as np
 from typing import Dict, Any
 
+from section_constants import obtener_constantes
+
+def _constantes_torsion(
+    material_props: Dict[str, float],
+    seccion_props: Dict[str, float]
+) -> Dict[str, Any]:
+    """Calcula Fcr y Tn, que solo dependen del perfil y del material."""
+    # --- 1. Extraer Datos ---
+    Fy = material_props['Fy']
+    bf, tf = seccion_props['bf'], seccion_props['tf']
+    d, tw = seccion_props['d'], seccion_props['tw']
+    J = seccion_props['J']
+
+    # --- 2. Calcular el Coeficiente de Torsión C ---
+    # Para perfiles I rolados, C es aproximadamente J (AISC H3.1)
+    # Una aproximación más refinada del coeficiente plástico C es:
+    # C = (bf * tf**2 + (d - 2*tf) * tw**2) / 3 
+    # Pero para consistencia con la norma, usaremos el esfuerzo cortante
+    # basado en la teoría de la membrana.
+
+    # --- 3. Calcular el Esfuerzo Cortante Crítico (Fcr) ---
+    # Según la sección H3.1, la resistencia a la torsión se basa en los
+    # esfuerzos cortantes. El esfuerzo de fluencia por cortante es 0.6*Fy.
+    Fcr = 0.6 * Fy
+
+    # Para secciones I, la resistencia a torsión se puede aproximar
+    # con la constante de torsión J y el espesor del patín.
+    # Tn = Fcr * J / t_eff  (donde t_eff es un espesor efectivo)
+    # Una fórmula más directa y comúnmente usada para la capacidad plástica:
+
+    # Resistencia nominal por fluencia torsional (AISC Eq. H3-1)
+    # Este es el estado límite que usualmente controla para torsión pura.
+    Tn_fluencia = Fcr * J / min(tf, tw) # Aproximación conservadora
+
+    # Una fórmula más precisa para la capacidad plástica a torsión de perfiles I
+    Tn = (Fcr / 2) * (bf * tf**2 + (d - 2*tf) * tw**2)
+
+    # La norma indica que para secciones abiertas, Tn = Fcr * C
+    # donde C para perfiles I es:
+    C = (bf*tf**2 * (1 - (0.63*tf)/(bf)) + (d-2*tf)*tw**2/3 + 2*(d-2*tf)*tw**2/3) # aproximación
+    # Para simplificar y ser consistentes, usaremos la fórmula basada en esfuerzos.
+    # El manual de diseño del AISC a menudo usa Fcr * J / t para la torsión de St. Venant.
+    # Tn = Fcr * J / tf # Usando tf como el espesor dominante
+    # Esta es una simplificación. Un cálculo completo involucra alabeo (warping),
+    # que es mucho más complejo y va más allá de un estado límite simple.
+    # Nos quedaremos con la implementación de fluencia por cortante.
+
+    return {"J": J, "Fcr": Fcr, "Tn": Tn}
+
 def calcular_resistencia_torsion(
     material_props: Dict[str, float],
     seccion_props: Dict[str, float]
@@ -18,7 +68,8 @@ def calcular_resistencia_torsion(
     especialmente enfocado en perfiles de patín ancho (W).
 
     Implementa las especificaciones del AISC 360-22, Capítulo H3, para miembros
-    sometidos a torsión.
+    sometidos a torsión. Tn se toma de la caché de 'section_constants' cuando el
+    perfil ya se calculó con el mismo material.
 
     Args:
         material_props (dict): Propiedades del material ('Fy', 'E').
@@ -42,53 +93,16 @@ def calcular_resistencia_torsion(
     }
 
     try:
-        # --- 1. Extraer Datos ---
-        Fy = material_props['Fy']
-        bf, tf = seccion_props['bf'], seccion_props['tf']
-        d, tw = seccion_props['d'], seccion_props['tw']
-        J = seccion_props['J']
-
-        # --- 2. Calcular el Coeficiente de Torsión C ---
-        # Para perfiles I rolados, C es aproximadamente J (AISC H3.1)
-        # Una aproximación más refinada del coeficiente plástico C es:
-        # C = (bf * tf**2 + (d - 2*tf) * tw**2) / 3 
-        # Pero para consistencia con la norma, usaremos el esfuerzo cortante
-        # basado en la teoría de la membrana.
-        
-        # --- 3. Calcular el Esfuerzo Cortante Crítico (Fcr) ---
-        # Según la sección H3.1, la resistencia a la torsión se basa en los
-        # esfuerzos cortantes. El esfuerzo de fluencia por cortante es 0.6*Fy.
-        Fcr = 0.6 * Fy
-        
-        # Para secciones I, la resistencia a torsión se puede aproximar
-        # con la constante de torsión J y el espesor del patín.
-        # Tn = Fcr * J / t_eff  (donde t_eff es un espesor efectivo)
-        # Una fórmula más directa y comúnmente usada para la capacidad plástica:
-        
-        # Resistencia nominal por fluencia torsional (AISC Eq. H3-1)
-        # Este es el estado límite que usualmente controla para torsión pura.
-        Tn_fluencia = Fcr * J / min(tf, tw) # Aproximación conservadora
-        
-        # Una fórmula más precisa para la capacidad plástica a torsión de perfiles I
-        Tn = (Fcr / 2) * (bf * tf**2 + (d - 2*tf) * tw**2)
-
-        # La norma indica que para secciones abiertas, Tn = Fcr * C
-        # donde C para perfiles I es:
-        C = (bf*tf**2 * (1 - (0.63*tf)/(bf)) + (d-2*tf)*tw**2/3 + 2*(d-2*tf)*tw**2/3) # aproximación
-        # Para simplificar y ser consistentes, usaremos la fórmula basada en esfuerzos.
-        # El manual de diseño del AISC a menudo usa Fcr * J / t para la torsión de St. Venant.
-        # Tn = Fcr * J / tf # Usando tf como el espesor dominante
-        # Esta es una simplificación. Un cálculo completo involucra alabeo (warping),
-        # que es mucho más complejo y va más allá de un estado límite simple.
-        # Nos quedaremos con la implementación de fluencia por cortante.
+        k = obtener_constantes('torsion', material_props, seccion_props,
+                               lambda: _constantes_torsion(material_props, seccion_props))
 
         # --- 4. Ensamblar Resultados ---
-        resultado["valor_calculado_Tn"] = Tn
-        resultado["status"] "Exitoso"
+        resultado["valor_calculado_Tn"] = k["Tn"]
+        resultado["status"] = "Exitoso"
         resultado["mensaje"] = "Cálculo de torsión completado (basado en fluencia por cortante)."
         resultado["detalles"] = {
-            "Constante_torsional_J_in4": J,
-            "Esfuerzo_critico_Fcr_ksi": Fcr
+            "Constante_torsional_J_in4": k["J"],
+            "Esfuerzo_critico_Fcr_ksi": k["Fcr"]
         }
 
     except (KeyError, ZeroDivisionError) as e:
@@ -98,6 +112,274 @@ def calcular_resistencia_torsion(
 
     return resultado
 
+
+# ==============================================================================
+# TORSIÓN CON ALABEO A LO LARGO DEL MIEMBRO (AISC DESIGN GUIDE 9)
+# ==============================================================================
+
+# Condiciones de extremo, en el orden de sus códigos:
+#   articulado: θ = 0, θ'' = 0 (giro impedido, alabeo libre)
+#   empotrado:  θ = 0, θ' = 0 (giro y alabeo impedidos)
+#   libre:      T = 0, θ'' = 0 (extremo libre de un voladizo)
+CONDICIONES_EXTREMO_TORSION = ("articulado", "empotrado", "libre")
+
+# Módulo de cortante por omisión (ksi), igual al que usa el AISC.
+G_ACERO_KSI = 11200.0
+
+def _codigos_extremo(condicion: Any, n: int) -> np.ndarray:
+    """Convierte nombres o códigos de CONDICIONES_EXTREMO_TORSION en un arreglo (n,)."""
+    condicion = np.asarray(condicion)
+    if condicion.dtype.kind in 'US':
+        codigos = {nombre: i for i, nombre in enumerate(CONDICIONES_EXTREMO_TORSION)}
+        condicion = np.array([codigos[c] for c in condicion.ravel()]).reshape(condicion.shape)
+    return np.broadcast_to(condicion.astype(np.intp), (n,))
+
+def _base_homogenea(z, z_inicio, z_fin, lam):
+    """
+    Funciones base de la solución homogénea en un tramo y sus tres derivadas,
+    con forma (..., 4, 4): [derivada, función]. Se usan las exponenciales
+    decrecientes e^(-λ(z-z0)) y e^(-λ(z1-z)), equivalentes a cosh/sinh pero sin
+    desbordamiento en miembros con L/a grande.
+    """
+    e1 = np.exp(-lam * (z - z_inicio))
+    e2 = np.exp(-lam * (z_fin - z))
+    cero, uno = np.zeros_like(e1), np.ones_like(e1)
+    return np.stack([
+        np.stack([uno, z - z_inicio, e1, e2], axis=-1),
+        np.stack([cero, uno, -lam * e1, lam * e2], axis=-1),
+        np.stack([cero, cero, lam**2 * e1, lam**2 * e2], axis=-1),
+        np.stack([cero, cero, -lam**3 * e1, lam**3 * e2], axis=-1),
+    ], axis=-2)
+
+def analizar_torsion_alabeo(
+    material_props: Dict[str, float],
+    secciones: Dict[str, Any],
+    L: Any,
+    apoyos: Any,
+    cargas: Dict[str, Any],
+    estaciones: Any = 21
+) -> Dict[str, Any]:
+    """
+    Calcula θ, θ', θ'' y θ''' a lo largo de muchos miembros a la vez con la
+    solución cerrada de la ecuación de torsión con alabeo
+    (GJ·θ' - ECw·θ''' = T; AISC Design Guide 9, Cap. 4 y Apéndice B).
+
+    Cada miembro se divide en dos tramos en el punto de aplicación del par
+    concentrado. En cada tramo θ = C1 + C2·z + C3·e^(-z/a) + C4·e^(-(z1-z)/a)
+    más la solución particular de la carga uniforme, -t·z²/(2GJ). Las 8
+    constantes se obtienen con un sistema lineal por miembro (resuelto en lote
+    con NumPy) a partir de las condiciones de extremo y de continuidad, y
+    después las funciones se evalúan en todas las estaciones sin bucles.
+
+    Args:
+        material_props (dict): 'E' y opcionalmente 'G' (ksi).
+        secciones (dict): Arreglos (n,) con 'J' (in^4) y 'Cw' (in^6).
+        L (array_like): Longitud de cada miembro (in), forma (n,).
+        apoyos (tuple): (extremo_izquierdo, extremo_derecho), nombres o códigos
+            de CONDICIONES_EXTREMO_TORSION, escalares o arreglos (n,).
+        cargas (dict): Arreglos (n,) o escalares:
+            - 't': Par uniformemente distribuido (kip-in/in).
+            - 'T': Par concentrado (kip-in).
+            - 'alfa': Posición relativa del par concentrado (0 a 1).
+        estaciones (int o array_like): Número de estaciones equiespaciadas o
+            posiciones relativas (0 a 1).
+
+    Returns:
+        dict: 'z' (n, estaciones) en in, 'theta' (rad), 'theta_1' (rad/in),
+              'theta_2' (rad/in^2), 'theta_3' (rad/in^3) y 'a' (in) en 'detalles'.
+    """
+    resultado = {
+        "z": None, "theta": None, "theta_1": None, "theta_2": None, "theta_3": None,
+        "status": "Error", "referencia_norma": "AISC Design Guide 9, Cap. 4", "mensaje": "", "detalles": {}
+    }
+
+    try:
+        # --- 1. Extraer Datos de Entrada ---
+        L = np.atleast_1d(np.asarray(L, dtype=float))
+        n = L.shape[0]
+        E = float(material_props['E'])
+        G = float(material_props.get('G', G_ACERO_KSI))
+        GJ = G * np.broadcast_to(np.asarray(secciones['J'], dtype=float), (n,))
+        ECw = E * np.broadcast_to(np.asarray(secciones['Cw'], dtype=float), (n,))
+        if np.any(~(GJ > 0)) or np.any(~(ECw > 0)):
+            raise ValueError("J y Cw deben ser positivos (perfiles de sección abierta con alabeo)")
+        izquierdo = _codigos_extremo(apoyos[0], n)
+        derecho = _codigos_extremo(apoyos[1], n)
+        if np.any((izquierdo == 2) & (derecho == 2)):
+            raise ValueError("Un miembro libre en ambos extremos no tiene restricción a torsión")
+
+        t = np.broadcast_to(np.asarray(cargas.get('t', 0.0), dtype=float), (n,))
+        T = np.broadcast_to(np.asarray(cargas.get('T', 0.0), dtype=float), (n,))
+        alfa = np.broadcast_to(np.asarray(cargas.get('alfa', 0.5), dtype=float), (n,))
+        if np.any((alfa < 0) | (alfa > 1)):
+            raise ValueError("La posición relativa del par concentrado debe estar entre 0 y 1")
+
+        a = np.sqrt(ECw / GJ)
+        lam = 1 / a
+
+        # Un par en un extremo entra como condición de borde (solo afecta si el
+        # extremo es libre; si no, lo toma el apoyo) y el miembro se parte a la mitad.
+        en_extremo = (alfa == 0) | (alfa == 1)
+        T_izq = np.where(alfa == 0, T, 0.0)
+        T_der = np.where(alfa == 1, T, 0.0)
+        T_int = np.where(en_extremo, 0.0, T)
+        zc = np.where(en_extremo, 0.5, alfa) * L
+
+        # --- 2. Solución particular de la carga uniforme y sus derivadas ---
+        def particular(z):
+            return np.stack([-t * z**2 / (2 * GJ), -t * z / GJ, -t / GJ, np.zeros_like(z)], axis=-1)
+
+        # --- 3. Sistema de 8 ecuaciones por miembro ---
+        cero = np.zeros(n)
+        base_izq = _base_homogenea(cero, cero, zc, lam)        # tramo 1 en z = 0
+        base_c1 = _base_homogenea(zc, cero, zc, lam)           # tramo 1 en z = zc
+        base_c2 = _base_homogenea(zc, zc, L, lam)              # tramo 2 en z = zc
+        base_der = _base_homogenea(L, zc, L, lam)              # tramo 2 en z = L
+        p0, pL = particular(cero), particular(L)
+
+        A = np.zeros((n, 8, 8))
+        b = np.zeros((n, 8))
+
+        def condiciones_extremo(fila, columnas, base, p, codigo, par_aplicado):
+            # Par interno GJ·θ' - ECw·θ''' en el extremo.
+            torsion = GJ[:, None] * base[:, 1] - ECw[:, None] * base[:, 3]
+            torsion_p = GJ * p[:, 1] - ECw * p[:, 3]
+            libre, empotrado = (codigo == 2)[:, None], (codigo == 1)[:, None]
+            A[:, fila, columnas] = np.where(libre, torsion, base[:, 0])
+            b[:, fila] = np.where(libre[:, 0], par_aplicado - torsion_p, -p[:, 0])
+            A[:, fila + 1, columnas] = np.where(empotrado, base[:, 1], base[:, 2])
+            b[:, fila + 1] = np.where(empotrado[:, 0], -p[:, 1], -p[:, 2])
+
+        tramo_1, tramo_2 = slice(0, 4), slice(4, 8)
+        # En z = 0 el par interno equilibra al aplicado: T(0) = -T_izq; en z = L, T(L) = T_der.
+        condiciones_extremo(0, tramo_1, base_izq, p0, izquierdo, -T_izq)
+        condiciones_extremo(2, tramo_2, base_der, pL, derecho, T_der)
+        # Continuidad de θ, θ' y θ'' en zc; el par interno salta en -T: ECw·(θ'''₂ - θ'''₁) = T.
+        for k in range(3):
+            A[:, 4 + k, tramo_1] = base_c1[:, k]
+            A[:, 4 + k, tramo_2] = -base_c2[:, k]
+        A[:, 7, tramo_1] = -base_c1[:, 3]
+        A[:, 7, tramo_2] = base_c2[:, 3]
+        b[:, 7] = T_int / ECw
+
+        C = np.linalg.solve(A, b[..., None])[..., 0]
+
+        # --- 4. Evaluar en las estaciones ---
+        estaciones = np.linspace(0.0, 1.0, estaciones) if np.ndim(estaciones) == 0 else np.asarray(estaciones, dtype=float)
+        z = estaciones[None, :] * L[:, None]
+        forma = z.shape
+        def columna(v):
+            return np.broadcast_to(v[:, None], forma)
+        f1 = _base_homogenea(z, 0.0, columna(zc), columna(lam))
+        f2 = _base_homogenea(z, columna(zc), columna(L), columna(lam))
+        en_tramo_1 = (z <= zc[:, None])[..., None, None]
+        giros = np.where(en_tramo_1, f1 @ C[:, None, :4, None], f2 @ C[:, None, 4:, None])[..., 0]
+        t_col, GJ_col = t[:, None], GJ[:, None]
+        giros = giros + np.stack([-t_col * z**2 / (2 * GJ_col), -t_col * z / GJ_col,
+                                  np.broadcast_to(-t_col / GJ_col, forma), np.zeros(forma)], axis=-1)
+
+        resultado["z"] = z
+        resultado["theta"], resultado["theta_1"] = giros[..., 0], giros[..., 1]
+        resultado["theta_2"], resultado["theta_3"] = giros[..., 2], giros[..., 3]
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = f"Funciones de torsión evaluadas para {n} miembros en {forma[1]} estaciones."
+        resultado["detalles"] = {"a_in": a, "GJ_kip_in2": GJ, "ECw_kip_in4": ECw,
+                                 "condiciones_extremo": CONDICIONES_EXTREMO_TORSION}
+
+    except (KeyError, ValueError, IndexError, np.linalg.LinAlgError) as e:
+        resultado["mensaje"] = f"Error en los datos de entrada: {e}."
+    except Exception as e:
+        resultado["mensaje"] = f"Error inesperado: {e}."
+
+    return resultado
+
+def combinar_esfuerzos_torsion_flexion(
+    material_props: Dict[str, float],
+    secciones: Dict[str, Any],
+    torsion: Dict[str, Any],
+    flexion: Dict[str, Any] = None,
+    phi: float = 0.90
+) -> Dict[str, Any]:
+    """
+    Combina los esfuerzos de torsión (St. Venant y alabeo) con los de flexión en
+    las estaciones de 'analizar_torsion_alabeo', para vigas de fachada (spandrel)
+    y trabes carril. Sigue el Design Guide 9 (Sec. 4.7 y 4.9): los esfuerzos se
+    suman en valor absoluto en el punto crítico y se comparan con φ·Fy (normal)
+    y φ·0.6·Fy (cortante), con φ = 0.90 (AISC 360-22, H3.3).
+
+        σw = E·Wno·θ''        τt = G·t·θ'        τws = E·Sw1·θ'''/tf
+        σb = Mx/Sx + My/Sy    τb = V·Q/(I·t)
+
+    Args:
+        material_props (dict): 'Fy', 'E' y opcionalmente 'G' (ksi).
+        secciones (dict): Arreglos (n,) con 'tf', 'tw', 'bf', 'Wno', 'Sw1', 'Qf',
+            'Qw', 'Ix', 'Iy', 'Sx', 'Sy'.
+        torsion (dict): Resultado exitoso de 'analizar_torsion_alabeo'.
+        flexion (dict, opcional): Arreglos difundibles a (n, estaciones) con
+            'Mx', 'Vy' (flexión vertical) y 'My', 'Vx' (lateral, ej. trabe carril),
+            en kip-in y kips.
+
+    Returns:
+        dict: Esfuerzos (ksi) de forma (n, estaciones) en 'detalles',
+              'ratio_demanda_capacidad' (n,) y la estación que gobierna.
+    """
+    resultado = {
+        "ratio_demanda_capacidad": None, "estacion_gobierna": None, "pasa": None,
+        "status": "Error", "referencia_norma": "AISC Design Guide 9, Sec. 4.7; AISC 360-22, H3.3",
+        "mensaje": "", "detalles": {}
+    }
+
+    try:
+        if torsion.get("status") != "Exitoso":
+            raise ValueError("El análisis de torsión no fue exitoso")
+        flexion = flexion or {}
+        Fy, E = float(material_props['Fy']), float(material_props['E'])
+        G = float(material_props.get('G', G_ACERO_KSI))
+        def prop(nombre):
+            return np.asarray(secciones[nombre], dtype=float)[:, None]
+        def carga(nombre):
+            return np.abs(np.asarray(flexion.get(nombre, 0.0), dtype=float))
+
+        # --- 1. Esfuerzos de torsión ---
+        theta_1, theta_2, theta_3 = torsion["theta_1"], torsion["theta_2"], torsion["theta_3"]
+        sigma_w = np.abs(E * prop('Wno') * theta_2)
+        tau_t_patin = np.abs(G * prop('tf') * theta_1)
+        tau_t_alma = np.abs(G * prop('tw') * theta_1)
+        tau_ws = np.abs(E * prop('Sw1') * theta_3 / prop('tf'))
+
+        # --- 2. Esfuerzos de flexión ---
+        sigma_bx = carga('Mx') / prop('Sx')
+        sigma_by = carga('My') / prop('Sy')
+        tau_b_patin = carga('Vy') * prop('Qf') / (prop('Ix') * prop('tf')) + carga('Vx') * prop('bf')**2 / (8 * prop('Iy'))
+        tau_b_alma = carga('Vy') * prop('Qw') / (prop('Ix') * prop('tw'))
+
+        # --- 3. Combinación en los puntos críticos ---
+        sigma = sigma_bx + sigma_by + sigma_w
+        tau = np.maximum(tau_t_patin + tau_ws + tau_b_patin, tau_t_alma + tau_b_alma)
+        ratio_normal = sigma / (phi * Fy)
+        ratio_cortante = tau / (phi * 0.6 * Fy)
+        ratios = np.maximum(ratio_normal, ratio_cortante)
+        estacion = np.argmax(ratios, axis=1)
+        filas = np.arange(ratios.shape[0])
+
+        resultado["ratio_demanda_capacidad"] = ratios[filas, estacion]
+        resultado["estacion_gobierna"] = estacion
+        resultado["pasa"] = resultado["ratio_demanda_capacidad"] <= 1.0
+        resultado["status"] = "Exitoso"
+        resultado["mensaje"] = f"Esfuerzos combinados de torsión y flexión evaluados para {ratios.shape[0]} miembros."
+        resultado["detalles"] = {
+            "sigma_w_ksi": sigma_w, "sigma_b_ksi": sigma_bx + sigma_by, "sigma_total_ksi": sigma,
+            "tau_t_patin_ksi": tau_t_patin, "tau_t_alma_ksi": tau_t_alma, "tau_ws_ksi": tau_ws,
+            "tau_total_ksi": tau, "ratio_normal": ratio_normal, "ratio_cortante": ratio_cortante
+        }
+
+    except (KeyError, ValueError) as e:
+        resultado["mensaje"] = f"Error en los datos de entrada: {e}."
+    except Exception as e:
+        resultado["mensaje"] = f"Error inesperado: {e}."
+
+    return resultado
+
 # --- EJEMPLO DE USO ---
 if __name__ == "__main__":
     from aisc_database import DatabaseAISC
@@ -132,4 +414,19 @@ if __name__ == "__main__":
         print("\nResultados:")
         print(f"  - Constante Torsional (J): {resultado['detalles']['Constante_torsional_J_in4']:.2f} in^4")
         print(f"  - Resistencia Nominal (Tn):   {Tn:.2f} kip-in")
-        print(f"  - Resistencia de Diseño (φTn): {phi_Tn:.2f} kip-in")
\ No newline at end of file
+        print(f"  - Resistencia de Diseño (φTn): {phi_Tn:.2f} kip-in")
+        # --- 4. Torsión con alabeo: viga de fachada con par uniforme (DG9) ---
+        L_viga = 240.0  # in
+        t_fachada = 0.25  # kip-in/in por la excentricidad del muro
+        w_vertical = 0.15  # kip/in
+        secciones = {k: np.array([float(seccion[k])]) for k in
+                     ('J', 'Cw', 'tf', 'tw', 'bf', 'Wno', 'Sw1', 'Qf', 'Qw', 'Ix', 'Iy', 'Sx', 'Sy')}
+        giros = analizar_torsion_alabeo(material, secciones, [L_viga], ('articulado', 'articulado'),
+                                        {'t': t_fachada}, estaciones=41)
+        z = giros['z']
+        flexion = {'Mx': w_vertical * z * (L_viga - z) / 2, 'Vy': w_vertical * (L_viga / 2 - z)}
+        esfuerzos = combinar_esfuerzos_torsion_flexion(material, secciones, giros, flexion)
+        print(f"\nTorsión con alabeo ({giros['mensaje']})")
+        print(f"  - Giro máximo θ: {np.max(np.abs(giros['theta'])):.4f} rad")
+        print(f"  - Ratio demanda/capacidad: {esfuerzos['ratio_demanda_capacidad'][0]:.3f} "
+              f"en z = {z[0, esfuerzos['estacion_gobierna'][0]]:.1f} in")
@@ -2,59 +2,107 @@
 # -*- coding: utf-8 -*-
 
 import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
 from fpdf import FPDF
+from fpdf.enums import MethodReturnValue, XPos, YPos
 from core.config import ProyectoConfig
 from analysis.model import Viga
 from analysis.loads import CargaPuntual, CargaDistribuida
 
+DIRECTORIO_SALIDA = 'reporting/output'
+
+# Equivalente a ln=1, sin el argumento obsoleto de fpdf2 (que inspecciona la pila en cada celda).
+SALTO_LINEA = {"new_x": XPos.LMARGIN, "new_y": YPos.NEXT}
+
+# Texto fijo de la Sección 4, igual en todas las memorias.
+TEXTO_SOLICITACIONES = ("Los siguientes valores representan las máximas solicitaciones encontradas después "
+                        "de analizar todas las combinaciones de carga aplicables.")
+
+# Cortes de línea ya calculados: {(fuente, estilo, tamaño, ancho, texto): [líneas]}.
+# El texto fijo y los datos del proyecto se repiten en cada memoria de un lote, así
+# que el corte de línea (lo más caro de la maquetación) se hace una vez por proceso.
+_LINEAS_CACHE = {}
+
+def nombre_memoria(descripcion_elemento: str) -> str:
+    """Nombre de archivo de la memoria de un elemento, ej. 'Memoria_Calculo_Viga_V-203.pdf'."""
+    return f"Memoria_Calculo_{descripcion_elemento.replace(' ', '_').replace(',', '')}.pdf"
+
 class ReportePDF(FPDF):
     """
     Clase para generar la memoria de cálculo completa en formato PDF
     utilizando la fuente estándar Arial.
     """
-    def __init__(self, config: ProyectoConfig, viga: Viga, envolvente: dict, resultados_diseno: dict, res_arriostramiento: dict):
+    def __init__(self, config: ProyectoConfig, viga: Viga, envolvente: dict, resultados_diseno: dict, res_arriostramiento: dict,
+                 descripcion_elemento: str = None):
         super().__init__()
-        # Almacenamos todos los datos necesarios para el reporte
         self.config = config
+        # Usamos Arial como fuente principal por su compatibilidad
+        self.font_family = 'Arial'
+        self.nuevo_elemento(viga, envolvente, resultados_diseno, res_arriostramiento, descripcion_elemento)
+
+    def nuevo_elemento(self, viga: Viga, envolvente: dict, resultados_diseno: dict, res_arriostramiento: dict,
+                       descripcion_elemento: str = None):
+        """
+        Carga los datos de un elemento y abre su primera página. Permite escribir
+        varias memorias seguidas en el mismo documento; la numeración de páginas
+        se reinicia en cada elemento.
+        """
         self.viga = viga
         self.envolvente = envolvente
         self.res_flexion = resultados_diseno['flexion']
         self.res_cortante = resultados_diseno['cortante']
         self.res_arr_lateral = res_arriostramiento['lateral']
         self.res_arr_torsional = res_arriostramiento['torsional']
-        
-        # Usamos Arial como fuente principal por su compatibilidad
-        self.font_family = 'Arial'
+        self.descripcion_elemento = descripcion_elemento or self.config.descripcion_elemento
 
+        # add_page() cierra antes la página anterior (su pie usa aún la numeración del elemento previo).
         self.add_page()
+        self.pagina_inicial = self.page_no()
         self.set_font(self.font_family, '', 10)
 
     def header(self):
         """Define el encabezado de cada página del reporte."""
         self.set_font(self.font_family, 'B', 14)
-        self.cell(0, 10, 'Memoria de Cálculo Estructural', 0, 1, 'C')
+        self.cell(0, 10, 'Memoria de Cálculo Estructural', **SALTO_LINEA, align='C')
         self.set_font(self.font_family, 'I', 8)
-        self.cell(0, 5, f"Proyecto: {self.config.nombre_proyecto}", 0, 1, 'C')
+        self.cell(0, 5, f"Proyecto: {self.config.nombre_proyecto}", **SALTO_LINEA, align='C')
         self.ln(10)
 
     def footer(self):
         """Define el pie de página, incluyendo el número de página."""
         self.set_y(-15)
         self.set_font(self.font_family, 'I', 8)
-        self.cell(0, 10, f'Página {self.page_no()}', 0, 0, 'C')
+        self.cell(0, 10, f'Página {self.page_no() - self.pagina_inicial + 1}', align='C')
 
     def titulo_seccion(self, titulo):
         """Crea un formato estandarizado para los títulos de sección."""
         self.set_font(self.font_family, 'B', 12)
-        self.cell(0, 10, titulo, 0, 1, 'L')
+        self.cell(0, 10, titulo, **SALTO_LINEA, align='L')
         self.line(self.get_x(), self.get_y(), self.get_x() + 190, self.get_y())
         self.ln(5)
 
+    def lineas_texto(self, ancho: float, texto: str) -> list:
+        """Corta 'texto' en líneas de 'ancho' con la fuente actual, reutilizando cortes ya hechos."""
+        clave = (self.font_family, self.font_style, self.font_size_pt, ancho, texto)
+        lineas = _LINEAS_CACHE.get(clave)
+        if lineas is None:
+            lineas = self.multi_cell(ancho, 1, texto, dry_run=True, output=MethodReturnValue.LINES)
+            _LINEAS_CACHE[clave] = lineas
+        return lineas
+
+    def parrafo(self, alto_linea: float, texto: str):
+        """Equivale a multi_cell(0, alto_linea, texto) pero con el corte de línea en caché."""
+        for linea in self.lineas_texto(self.epw, texto):
+            self.cell(self.epw, alto_linea, linea, **SALTO_LINEA)
+
     def escribir_datos_generales(self):
         """Escribe la Sección 1: Datos Generales del Proyecto."""
         self.titulo_seccion('1. Datos Generales del Proyecto')
         datos = {
-            "Elemento Analizado": self.config.descripcion_elemento,
+            "Elemento Analizado": self.descripcion_elemento,
             "Normativa de Acciones": self.config.normativa_acciones.value,
             "Normativa de Diseño": self.config.normativa_diseno.value,
             "Método de Diseño": self.config.metodo_diseno.value,
@@ -62,11 +110,15 @@ class ReportePDF(FPDF):
             "Revisión": self.config.revision
         }
         for clave, valor in datos.items():
+            self.set_font(self.font_family, '', 10)
+            lineas = self.lineas_texto(140, f"{valor}")
             self.set_font(self.font_family, 'B', 10)
-            self.multi_cell(50, 8, f"{clave}:", border=1)
-            self.set_xy(self.get_x() + 50, self.get_y() - 8)
+            self.cell(50, 8 * len(lineas), f"{clave}:", border=1)
             self.set_font(self.font_family, '', 10)
-            self.multi_cell(140, 8, f"{valor}", border=1)
+            if len(lineas) == 1:
+                self.cell(140, 8, lineas[0], border=1, **SALTO_LINEA)
+            else:
+                self.multi_cell(140, 8, f"{valor}", border=1, **SALTO_LINEA)
         self.ln(10)
 
     def escribir_propiedades_elemento(self):
@@ -87,27 +139,27 @@ class ReportePDF(FPDF):
             self.set_font(self.font_family, 'B', 10)
             self.cell(60, 8, f"{clave}:", border='B')
             self.set_font(self.font_family, '', 10)
-            self.cell(0, 8, f"{valor}", border='B', ln=1)
+            self.cell(0, 8, f"{valor}", border='B', **SALTO_LINEA)
         self.ln(10)
 
     def escribir_cargas_aplicadas(self):
         """Escribe la Sección 3: Cargas Aplicadas (sin factorizar)."""
         self.titulo_seccion('3. Cargas Aplicadas (Sin factorizar)')
         self.set_font(self.font_family, 'B', 10)
-        self.cell(30, 8, "Tipo", 1, 0, 'C'); self.cell(40, 8, "Magnitud", 1, 0, 'C')
-        self.cell(80, 8, "Ubicación", 1, 0, 'C'); self.cell(40, 8, "Caso de Carga", 1, 1, 'C')
+        self.cell(30, 8, "Tipo", 1, align='C'); self.cell(40, 8, "Magnitud", 1, align='C')
+        self.cell(80, 8, "Ubicación", 1, align='C'); self.cell(40, 8, "Caso de Carga", 1, **SALTO_LINEA, align='C')
         self.set_font(self.font_family, '', 10)
         for carga in self.viga.cargas:
             if isinstance(carga, CargaPuntual):
                 self.cell(30, 8, "Puntual", 1)
                 self.cell(40, 8, f"{carga.magnitud} {self.config.unidades['fuerza']}", 1)
                 self.cell(80, 8, f"en x = {carga.posicion} {self.config.unidades['longitud']}", 1)
-                self.cell(40, 8, carga.caso_carga.name, 1, 1)
+                self.cell(40, 8, carga.caso_carga.name, 1, **SALTO_LINEA)
             elif isinstance(carga, CargaDistribuida):
                 self.cell(30, 8, "Distribuida", 1)
                 self.cell(40, 8, f"{carga.magnitud} {self.config.unidades['fuerza']}/{self.config.unidades['longitud']}", 1)
                 self.cell(80, 8, f"de x={carga.pos_inicio} a x={carga.pos_fin} {self.config.unidades['longitud']}", 1)
-                self.cell(40, 8, carga.caso_carga.name, 1, 1)
+                self.cell(40, 8, carga.caso_carga.name, 1, **SALTO_LINEA)
         self.ln(10)
     
     def escribir_resultados_analisis(self):
@@ -115,16 +167,16 @@ class ReportePDF(FPDF):
         self.titulo_seccion('4. Solicitaciones de Diseño (Envolvente)')
         unidades = self.config.unidades
         self.set_font(self.font_family, '', 10)
-        self.multi_cell(0, 5, "Los siguientes valores representan las máximas solicitaciones encontradas después de analizar todas las combinaciones de carga aplicables.")
+        self.parrafo(5, TEXTO_SOLICITACIONES)
         self.ln(3)
         self.set_font(self.font_family, 'B', 11)
         self.cell(60, 8, "Momento Último (Mu):")
         self.set_font(self.font_family, '', 11)
-        self.cell(0, 8, f"{self.envolvente['Mu']:.2f} {unidades['momento']}", ln=1)
+        self.cell(0, 8, f"{self.envolvente['Mu']:.2f} {unidades['momento']}", **SALTO_LINEA)
         self.set_font(self.font_family, 'B', 11)
         self.cell(60, 8, "Cortante Último (Vu):")
         self.set_font(self.font_family, '', 11)
-        self.cell(0, 8, f"{self.envolvente['Vu']:.2f} {unidades['fuerza']}", ln=1)
+        self.cell(0, 8, f"{self.envolvente['Vu']:.2f} {unidades['fuerza']}", **SALTO_LINEA)
         self.ln(10)
         
     def escribir_verificacion_resistencia(self):
@@ -132,65 +184,253 @@ class ReportePDF(FPDF):
         self.titulo_seccion('5. Verificación de Resistencia')
         unidades = self.config.unidades
         self.set_font(self.font_family, 'B', 10)
-        self.cell(0, 8, "Revisión por Flexión", 0, 1)
-        self.cell(47.5, 8, "Solicitación (Mu)", 1, 0, 'C'); self.cell(47.5, 8, "Resistencia (phi*Mn)", 1, 0, 'C')
-        self.cell(47.5, 8, "Ratio (Mu/phi*Mn)", 1, 0, 'C'); self.cell(47.5, 8, "Estatus", 1, 1, 'C')
+        self.cell(0, 8, "Revisión por Flexión", **SALTO_LINEA)
+        self.cell(47.5, 8, "Solicitación (Mu)", 1, align='C'); self.cell(47.5, 8, "Resistencia (phi*Mn)", 1, align='C')
+        self.cell(47.5, 8, "Ratio (Mu/phi*Mn)", 1, align='C'); self.cell(47.5, 8, "Estatus", 1, **SALTO_LINEA, align='C')
         self.set_font(self.font_family, '', 10)
-        self.cell(47.5, 8, f"{self.res_flexion['Mu']:.2f} {unidades['momento']}", 1, 0, 'C')
-        self.cell(47.5, 8, f"{self.res_flexion['phi_Mn']:.2f} {unidades['momento']}", 1, 0, 'C')
-        self.cell(47.5, 8, f"{self.res_flexion['Ratio']:.3f}", 1, 0, 'C')
-        self.cell(47.5, 8, f"{self.res_flexion['Status']}", 1, 1, 'C'); self.ln(10)
+        self.cell(47.5, 8, f"{self.res_flexion['Mu']:.2f} {unidades['momento']}", 1, align='C')
+        self.cell(47.5, 8, f"{self.res_flexion['phi_Mn']:.2f} {unidades['momento']}", 1, align='C')
+        self.cell(47.5, 8, f"{self.res_flexion['Ratio']:.3f}", 1, align='C')
+        self.cell(47.5, 8, f"{self.res_flexion['Status']}", 1, **SALTO_LINEA, align='C'); self.ln(10)
         self.set_font(self.font_family, 'B', 10)
-        self.cell(0, 8, "Revisión por Cortante", 0, 1)
-        self.cell(47.5, 8, "Solicitación (Vu)", 1, 0, 'C'); self.cell(47.5, 8, "Resistencia (phi*Vn)", 1, 0, 'C')
-        self.cell(47.5, 8, "Ratio (Vu/phi*Vn)", 1, 0, 'C'); self.cell(47.5, 8, "Estatus", 1, 1, 'C')
+        self.cell(0, 8, "Revisión por Cortante", **SALTO_LINEA)
+        self.cell(47.5, 8, "Solicitación (Vu)", 1, align='C'); self.cell(47.5, 8, "Resistencia (phi*Vn)", 1, align='C')
+        self.cell(47.5, 8, "Ratio (Vu/phi*Vn)", 1, align='C'); self.cell(47.5, 8, "Estatus", 1, **SALTO_LINEA, align='C')
         self.set_font(self.font_family, '', 10)
-        self.cell(47.5, 8, f"{self.res_cortante['Vu']:.2f} {unidades['fuerza']}", 1, 0, 'C')
-        self.cell(47.5, 8, f"{self.res_cortante['phi_Vn']:.2f} {unidades['fuerza']}", 1, 0, 'C')
-        self.cell(47.5, 8, f"{self.res_cortante['Ratio']:.3f}", 1, 0, 'C')
-        self.cell(47.5, 8, f"{self.res_cortante['Status']}", 1, 1, 'C'); self.ln(10)
+        self.cell(47.5, 8, f"{self.res_cortante['Vu']:.2f} {unidades['fuerza']}", 1, align='C')
+        self.cell(47.5, 8, f"{self.res_cortante['phi_Vn']:.2f} {unidades['fuerza']}", 1, align='C')
+        self.cell(47.5, 8, f"{self.res_cortante['Ratio']:.3f}", 1, align='C')
+        self.cell(47.5, 8, f"{self.res_cortante['Status']}", 1, **SALTO_LINEA, align='C'); self.ln(10)
 
     def escribir_requisitos_arriostramiento(self):
         """Escribe la Sección 6: Requisitos de Arriostramiento."""
         self.titulo_seccion('6. Requisitos de Arriostramiento')
         unidades = self.config.unidades
         self.set_font(self.font_family, 'B', 10)
-        self.cell(0, 8, "Arriostramiento Lateral (en el patín)", 0, 1)
+        self.cell(0, 8, "Arriostramiento Lateral (en el patín)", **SALTO_LINEA)
         self.set_font(self.font_family, 'B', 11)
         self.cell(80, 8, "  - Resistencia Requerida (Vbr):")
         self.set_font(self.font_family, '', 11)
-        self.cell(0, 8, f"{self.res_arr_lateral.resistencia:.4f} {unidades['fuerza']}", ln=1)
+        self.cell(0, 8, f"{self.res_arr_lateral.resistencia:.4f} {unidades['fuerza']}", **SALTO_LINEA)
         self.set_font(self.font_family, 'B', 11)
         self.cell(80, 8, "  - Rigidez Requerida (betabr):")
         self.set_font(self.font_family, '', 11)
-        self.cell(0, 8, f"{self.res_arr_lateral.rigidez:.4f} {unidades['rigidez_fuerza']}", ln=1); self.ln(5)
+        self.cell(0, 8, f"{self.res_arr_lateral.rigidez:.4f} {unidades['rigidez_fuerza']}", **SALTO_LINEA); self.ln(5)
         self.set_font(self.font_family, 'B', 10)
-        self.cell(0, 8, "Arriostramiento Torsional (en la sección transversal)", 0, 1)
+        self.cell(0, 8, "Arriostramiento Torsional (en la sección transversal)", **SALTO_LINEA)
         self.set_font(self.font_family, 'B', 11)
         self.cell(80, 8, "  - Resistencia Requerida (Mbr):")
         self.set_font(self.font_family, '', 11)
-        self.cell(0, 8, f"{self.res_arr_torsional.resistencia_momento:.4f} {unidades['momento']}", ln=1)
+        self.cell(0, 8, f"{self.res_arr_torsional.resistencia_momento:.4f} {unidades['momento']}", **SALTO_LINEA)
         self.set_font(self.font_family, 'B', 11)
         self.cell(80, 8, "  - Rigidez Requerida (betaT):")
         self.set_font(self.font_family, 'I', 11)
-        self.cell(0, 8, f"Cálculo complejo no implementado en esta versión.", ln=1); self.ln(10)
+        self.cell(0, 8, f"Cálculo complejo no implementado en esta versión.", **SALTO_LINEA); self.ln(10)
 
-    def generar(self, nombre_archivo: str):
-        """
-        Ensambla todas las secciones en el documento PDF y lo guarda en el disco.
-        """
+    def escribir_memoria(self):
+        """Escribe todas las secciones de la memoria del elemento actual."""
         self.escribir_datos_generales()
         self.escribir_propiedades_elemento()
         self.escribir_cargas_aplicadas()
         self.escribir_resultados_analisis()
         self.escribir_verificacion_resistencia()
         self.escribir_requisitos_arriostramiento()
-        
+
+    def generar(self, nombre_archivo: str, directorio_salida: str = DIRECTORIO_SALIDA):
+        """
+        Ensambla todas las secciones en el documento PDF y lo guarda en el disco.
+        """
+        self.escribir_memoria()
+
         # Nos aseguramos de que la carpeta de salida exista.
-        directorio_salida = 'reporting/output'
-        if not os.path.exists(directorio_salida):
-            os.makedirs(directorio_salida)
-            
-        # Guardamos el PDF en la ruta correcta.
+        os.makedirs(directorio_salida, exist_ok=True)
+
+        # Guardamos el PDF en la ruta correcta (fpdf2 ya no recibe el destino 'F').
         ruta_salida = os.path.join(directorio_salida, nombre_archivo)
-        self.output(ruta_salida, 'F')
\ No newline at end of file
+        self.output(ruta_salida)
+        return ruta_salida
+
+# ==============================================================================
+# MEMORIAS POR LOTES
+# ==============================================================================
+
+_REFERENCIA = re.compile(rb'(\d+) 0 R')
+_OBJETO = re.compile(rb'(\d+) 0 obj\s')
+
+def _objetos_pdf(documento: bytes) -> dict:
+    """
+    Separa un PDF de fpdf2 (sin flujos de objetos) en {número: cuerpo}, con el
+    cuerpo entre 'n 0 obj' y 'endobj'. Los límites salen de la tabla xref, así que
+    un flujo comprimido que contenga 'endobj' no confunde al lector.
+    """
+    inicio_xref = int(documento[documento.rindex(b'startxref') + 9:].split()[0])
+    encabezado, _, resto = documento[inicio_xref:].partition(b'\n')
+    primero, cantidad = (int(v) for v in resto.split(b'\n', 1)[0].split())
+    entradas = resto.split(b'\n', 1)[1]
+    desplazamientos = []
+    for i in range(cantidad):
+        entrada = entradas[20 * i:20 * i + 18].split()
+        if entrada[2] == b'n':
+            desplazamientos.append((int(entrada[0]), primero + i))
+    desplazamientos.sort()
+    limites = [d for d, _ in desplazamientos[1:]] + [inicio_xref]
+    objetos = {}
+    for (desde, numero), hasta in zip(desplazamientos, limites):
+        trozo = documento[desde:hasta]
+        cuerpo = trozo[_OBJETO.match(trozo).end():trozo.rindex(b'endobj')]
+        objetos[numero] = cuerpo.strip(b'\r\n')
+    return objetos
+
+def concatenar_pdfs(documentos: list) -> bytes:
+    """
+    Une varios PDF generados por fpdf2 en uno solo, página tras página.
+
+    Las páginas y sus recursos se copian tal cual (los flujos no se descomprimen);
+    solo se renumeran las referencias del diccionario de cada objeto y se cuelgan
+    todas las páginas de un único árbol /Pages.
+    """
+    salida = bytearray(b'%PDF-1.3\n%\xe9\xeb\xf1\xbf\n')
+    desplazamientos = [None, None]  # 1: árbol de páginas, 2: catálogo (se escriben al final)
+    paginas, caja = [], None
+
+    for documento in documentos:
+        objetos = _objetos_pdf(documento)
+        raiz_catalogo = objetos[int(_REFERENCIA.search(
+            documento[documento.rindex(b'trailer'):].split(b'/Root', 1)[1]).group(1))]
+        num_arbol = int(_REFERENCIA.search(raiz_catalogo.split(b'/Pages', 1)[1]).group(1))
+        arbol = objetos[num_arbol]
+        if caja is None:
+            caja = re.search(rb'/MediaBox \[[^\]]*\]', arbol).group(0)
+        hijos = [int(n) for n in _REFERENCIA.findall(arbol.split(b'/Kids', 1)[1].split(b']', 1)[0])]
+
+        # Se conservan solo los objetos alcanzables desde las páginas (sin catálogo ni /Info).
+        conservar, pendientes = set(), list(hijos)
+        while pendientes:
+            numero = pendientes.pop()
+            if numero in conservar or numero == num_arbol:
+                continue
+            conservar.add(numero)
+            diccionario = objetos[numero].split(b'stream', 1)[0]
+            pendientes.extend(int(n) for n in _REFERENCIA.findall(diccionario))
+
+        nuevos = {numero: len(desplazamientos) + 1 + i for i, numero in enumerate(sorted(conservar))}
+        renumerar = lambda m: b'%d 0 R' % (1 if int(m.group(1)) == num_arbol else nuevos[int(m.group(1))])
+        for numero in sorted(conservar):
+            diccionario, separador, flujo = objetos[numero].partition(b'stream')
+            desplazamientos.append(len(salida))
+            salida += b'%d 0 obj\n' % nuevos[numero]
+            salida += _REFERENCIA.sub(renumerar, diccionario) + separador + flujo
+            salida += b'\nendobj\n'
+        paginas.extend(nuevos[n] for n in hijos)
+
+    desplazamientos[0] = len(salida)
+    salida += b'1 0 obj\n<<\n/Count %d\n/Kids [%s]\n%s\n/Type /Pages\n>>\nendobj\n' % (
+        len(paginas), b'\n'.join(b'%d 0 R' % n for n in paginas), caja or b'/MediaBox [0 0 595.28 841.89]')
+    desplazamientos[1] = len(salida)
+    salida += b'2 0 obj\n<<\n/Pages 1 0 R\n/Type /Catalog\n>>\nendobj\n'
+
+    inicio_xref = len(salida)
+    salida += b'xref\n0 %d\n0000000000 65535 f \n' % (len(desplazamientos) + 1)
+    for desplazamiento in desplazamientos:
+        salida += b'%010d 00000 n \n' % desplazamiento
+    salida += b'trailer\n<<\n/Size %d\n/Root 2 0 R\n>>\nstartxref\n%d\n%%%%EOF\n' % (
+        len(desplazamientos) + 1, inicio_xref)
+    return bytes(salida)
+
+# Estado de cada proceso trabajador (configuración del proyecto y modo de salida).
+_trabajador = {}
+
+def _inicializar_trabajador(config: ProyectoConfig, directorio_salida: str = None) -> None:
+    _trabajador.clear()
+    _trabajador.update({"config": config, "directorio_salida": directorio_salida})
+
+def _escribir_elemento(reporte, elemento: dict):
+    datos = (elemento['viga'], elemento['envolvente'], elemento['resultados_diseno'],
+             elemento['res_arriostramiento'], elemento.get('descripcion'))
+    if reporte is None:
+        reporte = ReportePDF(_trabajador["config"], *datos)
+    else:
+        reporte.nuevo_elemento(*datos)
+    reporte.escribir_memoria()
+    return reporte
+
+def _bloque_combinado(elementos: list) -> bytes:
+    """Escribe un bloque de memorias en un solo PDF y lo devuelve en memoria."""
+    reporte = None
+    for elemento in elementos:
+        reporte = _escribir_elemento(reporte, elemento)
+    return bytes(reporte.output())
+
+def _bloque_individual(elementos: list) -> list:
+    """Escribe un PDF por elemento en el directorio de salida y devuelve las rutas."""
+    rutas = []
+    for elemento in elementos:
+        reporte = _escribir_elemento(None, elemento)
+        descripcion = reporte.descripcion_elemento
+        rutas.append(reporte.generar(elemento.get('nombre_archivo') or nombre_memoria(descripcion),
+                                     _trabajador["directorio_salida"]))
+    return rutas
+
+def generar_memorias_lote(config: ProyectoConfig, elementos, ruta_salida: str, modo: str = "combinado",
+                          tam_bloque: int = 50, num_procesos: int = None) -> dict:
+    """
+    Genera las memorias de cálculo de muchos elementos repartiendo el trabajo
+    en un grupo de procesos.
+
+    Args:
+        config (ProyectoConfig): Configuración común del proyecto.
+        elementos (iterable[dict]): Un diccionario por elemento con 'viga', 'envolvente',
+            'resultados_diseno', 'res_arriostramiento' y, opcionalmente, 'descripcion'
+            (reemplaza a config.descripcion_elemento) y 'nombre_archivo' (modo individual).
+        ruta_salida (str): Archivo PDF (modo "combinado") o directorio (modo "individual").
+        modo (str): "combinado" para un solo PDF con todas las memorias, en orden, o
+            "individual" para un PDF por elemento.
+        tam_bloque (int): Elementos por tarea enviada a los procesos.
+        num_procesos (int, opcional): Procesos trabajadores; por omisión os.cpu_count().
+            Con 1 todo se hace en el proceso actual.
+
+    Returns:
+        dict: {"modo", "elementos", "rutas"} con las rutas de los archivos escritos.
+    """
+    if modo not in ("combinado", "individual"):
+        raise ValueError(f"Modo de generación no soportado: '{modo}'")
+    num_procesos = num_procesos or os.cpu_count() or 1
+    directorio = ruta_salida if modo == "individual" else None
+    if directorio:
+        os.makedirs(directorio, exist_ok=True)
+    elif os.path.dirname(ruta_salida):
+        os.makedirs(os.path.dirname(ruta_salida), exist_ok=True)
+
+    tarea = _bloque_combinado if modo == "combinado" else _bloque_individual
+    iterador = iter(elementos)
+    bloques = iter(lambda: list(islice(iterador, tam_bloque)), [])
+    resultados, num_elementos = [], 0
+
+    if num_procesos == 1:
+        _inicializar_trabajador(config, directorio)
+        for bloque in bloques:
+            num_elementos += len(bloque)
+            resultados.append(tarea(bloque))
+    else:
+        with ProcessPoolExecutor(max_workers=num_procesos, initializer=_inicializar_trabajador,
+                                 initargs=(config, directorio)) as ejecutor:
+            # Se mantienen pocas tareas en vuelo para no materializar todo el iterable a la vez;
+            # la cola conserva el orden de los elementos.
+            en_vuelo = deque()
+            for bloque in bloques:
+                if len(en_vuelo) >= 2 * num_procesos:
+                    resultados.append(en_vuelo.popleft().result())
+                num_elementos += len(bloque)
+                en_vuelo.append(ejecutor.submit(tarea, bloque))
+            while en_vuelo:
+                resultados.append(en_vuelo.popleft().result())
+
+    if num_elementos == 0:
+        raise ValueError("No se recibió ningún elemento para generar memorias.")
+    if modo == "combinado":
+        with open(ruta_salida, 'wb') as archivo:
+            archivo.write(concatenar_pdfs(resultados) if len(resultados) != 1 else resultados[0])
+        rutas = [ruta_salida]
+    else:
+        rutas = [ruta for bloque in resultados for ruta in bloque]
+    return {"modo": modo, "elementos": num_elementos, "rutas": rutas}
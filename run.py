@@ -13,10 +13,11 @@ from analysis.solver import AnalizadorViga
 
 # --- Capa 3: Diseño Específico de Material ---
 from design.acero.beam_checker import VerificadorResistencia
+from design.acero.beam_designer import DisenadorViga
 from design.acero.bracing_checker import CalculadoraArriostramiento, ArriostramientoTipo, CurvaturaTipo
 
 # --- Herramientas de Reporte ---
-from reporting.pdf_generator import ReportePDF
+from reporting.pdf_generator import ReportePDF, nombre_memoria
 
 def ejemplo_calculo_arriostramiento_columna(config, calc_arriostramiento):
     print("\n--- EJEMPLO ADICIONAL: CÁLCULO DE ARRIOSTRAMIENTO DE COLUMNA ---")
@@ -28,6 +29,18 @@ def ejemplo_calculo_arriostramiento_columna(config, calc_arriostramiento):
     print(f"  - Resistencia Requerida (Vbr): {res_columna.resistencia:.4f} {config.unidades['fuerza']}")
     print(f"  - Rigidez Requerida (βbr):     {res_columna.rigidez:.4f} {config.unidades['rigidez_fuerza']}")
 
+def ejemplo_seleccion_perfil(config, material, Mu, Vu, Lb, w_servicio, longitud):
+    print("\n--- EJEMPLO ADICIONAL: SELECCIÓN DEL PERFIL MÁS LIGERO ---")
+    disenador = DisenadorViga(config, material)
+    Ix_requerido = disenador.inercia_requerida(w_servicio, longitud, limite_deflexion=360)
+    seleccion = disenador.seleccionar_perfil(Mu=Mu, Vu=Vu, Lb=Lb, Ix_requerido=Ix_requerido)
+    if seleccion is None:
+        print("Ningún perfil de la base de datos cumple las solicitaciones.")
+        return
+    print(f"Perfil más ligero para Mu = {Mu:.2f} {config.unidades['momento']}, Vu = {Vu:.2f} {config.unidades['fuerza']} y L/360: {seleccion['Perfil']}")
+    print(f"  - Ratio flexión (Cb = 1.0): {seleccion['Ratio_Flexion']:.3f}")
+    print(f"  - Ratio cortante:           {seleccion['Ratio_Cortante']:.3f}")
+
 def programa_principal():
     config = ProyectoConfig(
         nombre_proyecto="Conjunto Ecatepec", id_proyecto="2025_01", ubicacion="Toluca, México", cliente="PJEDOMEX",
@@ -47,21 +60,26 @@ def programa_principal():
     viga.agregar_carga(CargaPuntual(magnitud=15.0, posicion=4.0, caso_carga=CasoCarga.D))
 
     gestor_comb = GestorCombinaciones(config)
-    combinaciones = gestor_comb.obtener_combinaciones()
     analizador = AnalizadorViga(viga)
+    combinaciones, _ = gestor_comb.podar_combinaciones(
+        gestor_comb.obtener_combinaciones(), analizador.analizar_casos_unitarios())
     resultados_envolvente = {"Mu": 0.0, "Vu": 0.0}
+    resultados_analisis = []
     for combo in combinaciones:
         resultado = analizador.analizar(combinacion=combo)
+        resultados_analisis.append(resultado)
         resultados_envolvente['Mu'] = max(resultados_envolvente['Mu'], resultado['Mu_max'])
         resultados_envolvente['Vu'] = max(resultados_envolvente['Vu'], resultado['Vu_max'])
     Mu_diseno = resultados_envolvente['Mu']; Vu_diseno = resultados_envolvente['Vu']
     
-    verificador = VerificadorResistencia(viga, Mu=Mu_diseno, Vu=Vu_diseno)
+    distancia_entre_arriostramientos = 4.0
+    puntos_arriostramiento = [distancia_entre_arriostramientos * i for i in range(1, int(viga.longitud // distancia_entre_arriostramientos) + 1)]
+    verificador = VerificadorResistencia(viga, Mu=Mu_diseno, Vu=Vu_diseno, resultados_analisis=resultados_analisis,
+                                         puntos_arriostramiento=puntos_arriostramiento)
     res_flexion = verificador.revisar_flexion(); res_cortante = verificador.revisar_cortante()
     resultados_diseno = {"flexion": res_flexion, "cortante": res_cortante}
 
     print("\n--- FASE 3: CÁLCULO DE ARRIOSTRAMIENTO ---")
-    distancia_entre_arriostramientos = 4.0
     calc_arriostramiento = CalculadoraArriostramiento(config=config)
     h0 = (perfil.d - perfil.tf) / 1000 
     res_arr_lateral = calc_arriostramiento.arriostramiento_lateral_viga(
@@ -72,11 +90,13 @@ def programa_principal():
     print("Arriostramiento Torsional para la viga:", f"  - Resistencia Requerida (Mbr): {res_arr_torsional.resistencia_momento:.4f} {config.unidades['momento']}", f"  - Rigidez Requerida (βT):      {res_arr_torsional.rigidez_torsional:.4f} (Cálculo no implementado)", sep='\n')
     res_arriostramiento_final = {"lateral": res_arr_lateral, "torsional": res_arr_torsional}
     ejemplo_calculo_arriostramiento_columna(config, calc_arriostramiento)
+    ejemplo_seleccion_perfil(config, material, Mu_diseno, Vu_diseno, distancia_entre_arriostramientos,
+                             w_servicio=5.0 + 12.0, longitud=viga.longitud)
 
     print("\n--- GENERANDO REPORTE PDF FINAL ---")
     try:
         reporte = ReportePDF(config, viga, resultados_envolvente, resultados_diseno, res_arriostramiento_final)
-        nombre_reporte = f"Memoria_Calculo_{config.descripcion_elemento.replace(' ', '_').replace(',', '')}.pdf"
+        nombre_reporte = nombre_memoria(config.descripcion_elemento)
         reporte.generar(nombre_reporte)
         print(f"¡Éxito! El reporte '{nombre_reporte}' ha sido guardado en la carpeta 'reporting/output'.")
     except Exception as e:
@@ -0,0 +1,10 @@
+# tests/conftest.py
+# -*- coding: utf-8 -*-
+# Los módulos de 'pruebas' se importan entre sí como scripts sueltos
+# (p. ej. 'from section_constants import ...'), así que su carpeta va en la ruta.
+import sys
+from pathlib import Path
+
+_PRUEBAS = str(Path(__file__).resolve().parents[1] / "pruebas")
+if _PRUEBAS not in sys.path:
+    sys.path.insert(0, _PRUEBAS)
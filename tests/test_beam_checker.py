@@ -0,0 +1,42 @@
+# tests/test_beam_checker.py
+# -*- coding: utf-8 -*-
+import pytest
+from core.config import ProyectoConfig, NormativaAcciones, NormativaDisenoAcero, MetodoDiseno
+from core.materials import MaterialAcero
+from core.sections import PerfilAcero
+from analysis.model import Viga, TipoApoyo
+from analysis.loads import CargaPuntual, CasoCarga
+from analysis.solver import AnalizadorViga
+from design.acero.beam_checker import VerificadorResistencia
+
+def _config():
+    return ProyectoConfig(
+        nombre_proyecto="Pruebas", id_proyecto="0", ubicacion="", cliente="", titulo="",
+        descripcion_elemento="Viga de prueba", ingeniero_responsable="", revisor="",
+        normativa_acciones=NormativaAcciones.NTC_ACCIONES_2023, normativa_diseno=NormativaDisenoAcero.AISC_360_22,
+        metodo_diseno=MetodoDiseno.LRFD,
+        unidades={'fuerza': 'kN', 'longitud': 'm', 'momento': 'kNm', 'esfuerzo': 'MPa', 'rigidez_fuerza': 'kN/m'})
+
+def _revisar_cantilever(puntos_arriostramiento=None):
+    config = _config()
+    viga = Viga(longitud=4.0, tipo_apoyo=TipoApoyo.CANTILEVER, config=config)
+    viga.asignar_perfil(PerfilAcero(nombre_perfil="W18X35", material=MaterialAcero.ASTM_A992(config=config),
+                                    config=config))
+    viga.agregar_carga(CargaPuntual(magnitud=20.0, posicion=4.0, caso_carga=CasoCarga.D))
+    resultado = AnalizadorViga(viga).analizar(combinacion={"D": 1.4})
+    verificador = VerificadorResistencia(viga, Mu=resultado['Mu_max'], Vu=resultado['Vu_max'],
+                                         resultados_analisis=[resultado],
+                                         puntos_arriostramiento=puntos_arriostramiento)
+    return verificador.revisar_flexion()
+
+def test_cantilever_sin_arriostrar_usa_cb_unitario():
+    # AISC 360-22, F1: Cb = 1.0 en cantiléveres con el extremo libre sin arriostrar.
+    flexion = _revisar_cantilever()
+    assert flexion["Cb"] == 1.0
+    assert flexion["Lb"] == pytest.approx(4.0)
+
+def test_cantilever_con_extremo_arriostrado_usa_f1_1():
+    libre = _revisar_cantilever()
+    arriostrado = _revisar_cantilever(puntos_arriostramiento=[4.0])
+    assert arriostrado["Cb"] > 1.0
+    assert arriostrado["phi_Mn"] > libre["phi_Mn"]
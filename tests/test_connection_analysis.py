@@ -0,0 +1,41 @@
+# tests/test_connection_analysis.py
+# -*- coding: utf-8 -*-
+import pytest
+from connection_analysis import analizar_grupo_soldadura, calcular_coeficiente_c_icr
+
+COLUMNA_3_TORNILLOS = [(0, 0), (0, 3), (0, 6)]
+GRUPO_2X2 = [(0, 0), (0, 3), (3, 0), (3, 3)]
+
+@pytest.mark.parametrize("excentricidad", [1e-6, 1e-4, 1e-3, 1e-2])
+def test_coeficiente_c_excentricidad_pequena(excentricidad):
+    # Con e → 0 el CI se va al infinito: C tiende al valor concéntrico sin fallar.
+    resultado = calcular_coeficiente_c_icr(COLUMNA_3_TORNILLOS, excentricidad)
+    assert resultado["status"] == "Exitoso", resultado["mensaje"]
+    assert 2.9 < resultado["valor_calculado_C"] <= 3.0
+
+@pytest.mark.parametrize("excentricidad", [1e-4, 1e-3, 0.5, 3.0])
+@pytest.mark.parametrize("angulo", [0.0, 30.0, 75.0])
+def test_coeficiente_c_converge_con_carga_inclinada(excentricidad, angulo):
+    resultado = calcular_coeficiente_c_icr(GRUPO_2X2, excentricidad, angulo)
+    assert resultado["status"] == "Exitoso", resultado["mensaje"]
+    assert 0.0 < resultado["valor_calculado_C"] <= 4.0
+
+def test_coeficiente_c_decrece_con_la_excentricidad():
+    valores = [calcular_coeficiente_c_icr(COLUMNA_3_TORNILLOS, e)["valor_calculado_C"]
+               for e in (0.1, 1.0, 3.0, 10.0)]
+    assert valores == sorted(valores, reverse=True)
+
+@pytest.mark.parametrize("excentricidad", [1e-6, 1e-4, 1e-3])
+def test_grupo_soldadura_excentricidad_pequena(excentricidad):
+    concentrico = analizar_grupo_soldadura([((0, 0), (0, 10))], 0.0)["longitud_efectiva_in"]
+    resultado = analizar_grupo_soldadura([((0, 0), (0, 10))], excentricidad)
+    assert resultado["status"] == "Exitoso", resultado["mensaje"]
+    assert resultado["longitud_efectiva_in"] == pytest.approx(concentrico, rel=1e-3)
+
+@pytest.mark.parametrize("excentricidad", [1e-3, 1e-2, 1.0])
+@pytest.mark.parametrize("angulo", [0.0, 30.0, 75.0])
+def test_grupo_soldadura_converge_con_carga_inclinada(excentricidad, angulo):
+    resultado = analizar_grupo_soldadura([((0, 0), (0, 10)), ((0, 10), (5, 10)), ((5, 10), (5, 0))],
+                                         excentricidad, angulo)
+    assert resultado["status"] == "Exitoso", resultado["mensaje"]
+    assert resultado["longitud_efectiva_in"] > 0.0
@@ -0,0 +1,19 @@
+# tests/test_parametric_study.py
+# -*- coding: utf-8 -*-
+import pytest
+from core.materials import MaterialAcero
+from design.acero.parametric_study import EstudioParametrico
+from tests.test_beam_checker import _config
+
+def test_unidades_imperiales_flexion_en_kip_ft():
+    config = _config()
+    config.unidades = {'fuerza': 'kips', 'longitud': 'ft', 'momento': 'kip-ft', 'esfuerzo': 'ksi',
+                       'rigidez_fuerza': 'kips/ft'}
+    material = MaterialAcero.ASTM_A992(config=config)
+    estudio = EstudioParametrico(config, ancho_tributario=10.0, carga_muerta=0.05, incluir_peso_propio=False)
+    # Arriostramiento continuo (Lb < Lp): φMn = φ·Fy·Zx, en kip-ft.
+    resultado = estudio.ejecutar([30.0], [0.05], ["W18X35"], [material], distancia_arriostramiento=1.0)
+    wu = 1.2 * 0.5 + 1.6 * 0.5
+    Mu = wu * 30.0**2 / 8
+    phi_Mn = 0.90 * material.Fy * 66.5 / 12
+    assert float(resultado.ratios["Flexión"].ravel()[0]) == pytest.approx(Mu / phi_Mn, rel=2e-3)
@@ -0,0 +1,21 @@
+# tests/test_shear_analysis.py
+# -*- coding: utf-8 -*-
+import numpy as np
+from shear_analysis import calcular_resistencia_cortante_vectorizada
+
+ACERO = {'Fy': 50.0, 'E': 29000.0}
+
+def test_g2_1a_solo_en_perfiles_i_rolados():
+    # Misma alma (h/tw ≈ 53.5 < 2.24·√(E/Fy)) en un W y en un canal.
+    secciones = {'d': np.array([17.7, 17.7]), 'tf': np.array([0.425, 0.425]), 'tw': np.array([0.3, 0.3]),
+                 'kdes': np.array([0.827, 0.827]), 'Type': np.array(['W', 'C'])}
+    resultado = calcular_resistencia_cortante_vectorizada(ACERO, secciones)
+    assert resultado["status"] == "Exitoso", resultado["mensaje"]
+    np.testing.assert_array_equal(resultado["detalles"]["caso_cv"], [0, 1])
+    np.testing.assert_allclose(resultado["detalles"]["Factor_phi_v"], [1.00, 0.90])
+
+def test_h_tw_del_catalogo_tiene_prioridad():
+    secciones = {'d': np.array([17.7, 17.7]), 'tf': np.array([0.425, 0.425]), 'tw': np.array([0.3, 0.3]),
+                 'kdes': np.array([0.827, 0.827]), 'h/tw': np.array([53.5, np.nan])}
+    resultado = calcular_resistencia_cortante_vectorizada(ACERO, secciones)
+    np.testing.assert_allclose(resultado["detalles"]["Esbeltez_alma_h_tw"], [53.5, (17.7 - 2 * 0.827) / 0.3])
@@ -0,0 +1,29 @@
+# tests/test_tension_analysis.py
+# -*- coding: utf-8 -*-
+import numpy as np
+import pytest
+from shear_lag_analysis import construir_tabla_factor_u
+from tension_analysis import calcular_resistencia_tension, calcular_resistencia_tension_vectorizada
+
+# Fy·Ag = 500 kips < Fu·An = 560 kips, pero 0.90·500 = 450 > 0.75·560 = 420: controla fractura.
+MATERIAL = {'Fy': 50.0, 'Fu': 65.0}
+AN_FRACTURA_CONTROLA = 560.0 / 65.0
+
+def test_escalar_reporta_pn_del_estado_que_fija_phi_pn():
+    resultado = calcular_resistencia_tension(MATERIAL, {'Ag': 10.0, 'tipo': 'W'},
+                                             {'An': AN_FRACTURA_CONTROLA})
+    assert resultado["status"] == "Exitoso", resultado["mensaje"]
+    assert "Fractura" in resultado["mensaje"]
+    assert resultado["valor_calculado_Pn"] == pytest.approx(560.0)
+
+def test_vectorizada_reporta_pn_del_estado_que_fija_phi_pn():
+    tabla_u = construir_tabla_factor_u({'AISC_Manual_Label': ['W8X34'], 'Type': ['W'], 'A': [10.0],
+                                        'd': [8.22], 'bf': [8.10], 'tf': [0.685], 'x': [np.nan],
+                                        'y': [np.nan]})
+    resultado = calcular_resistencia_tension_vectorizada(
+        MATERIAL, tabla_u,
+        {'indice_perfil': [0, 0], 'configuracion': ['todos', 'todos'], 'An': [AN_FRACTURA_CONTROLA, 10.0]})
+    assert resultado["status"] == "Exitoso", resultado["mensaje"]
+    np.testing.assert_array_equal(resultado["estado_limite_controla"], [1, 0])
+    np.testing.assert_allclose(resultado["valor_calculado_Pn"], [560.0, 500.0])
+    np.testing.assert_allclose(resultado["phi_Pn"], [420.0, 450.0])